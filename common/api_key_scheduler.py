@@ -0,0 +1,198 @@
+import re
+import threading
+import time
+from collections import deque
+
+from utils.constants import Constants
+
+DURATION_PATTERN = re.compile(r"([\d.]+)(ms|h|m|s)")
+DURATION_UNITS = {"ms": 0.001, "s": 1, "m": 60, "h": 3600}
+
+# Rate limit headers of each provider: (limit requests, remaining requests, limit tokens, remaining tokens)
+RATE_LIMIT_HEADERS = {
+    "openai": (
+        "x-ratelimit-limit-requests",
+        "x-ratelimit-remaining-requests",
+        "x-ratelimit-limit-tokens",
+        "x-ratelimit-remaining-tokens",
+    ),
+    "anthropic": (
+        "anthropic-ratelimit-requests-limit",
+        "anthropic-ratelimit-requests-remaining",
+        "anthropic-ratelimit-tokens-limit",
+        "anthropic-ratelimit-tokens-remaining",
+    ),
+}
+
+
+def parse_retry_after(value):
+    """Parses retry-after style values: plain seconds or OpenAI durations like "6m0s" / "20ms"."""
+    if not value:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    parts = DURATION_PATTERN.findall(value)
+    if not parts:
+        return None
+    return sum(float(amount) * DURATION_UNITS[unit] for amount, unit in parts)
+
+
+class KeyState:
+    def __init__(self, api_key, model=None):
+        self.api_key = api_key
+        self.model = model
+        self.events = deque()
+        self.cooldown_until = 0.0
+        self.header_snapshot = None
+        self.rate_limited = 0
+        self.requests = 0
+
+
+class ApiKeyScheduler:
+    """
+    Picks the API key with the most rate limit headroom for every request.
+
+    Each key tracks the requests and tokens it was given in a sliding window.
+    When the provider sent rate limit headers recently, the remaining counts
+    from the headers (minus what was sent since) are used instead. A key that
+    got a 429 is skipped until its retry-after has passed.
+
+    Providers rate limit every model of a key separately, so all of this is
+    tracked per (key, model): a 429 or the headers of one model never change
+    the headroom of the same key on another model.
+
+    With a key_source, reload_keys() reads the key list from it again, so
+    added, removed and rotated keys are used without a restart; acquire()
+    never calls it, as it may wait on Key Vault.
+    """
+
+    _instances = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def getInstance(cls, provider, api_keys=None, key_source=None):
+        if provider not in cls._instances:
+            with cls._lock:
+                if provider not in cls._instances:
+                    cls._instances[provider] = cls(provider, api_keys, key_source)
+        return cls._instances[provider]
+
+    @classmethod
+    def get_registered(cls, provider):
+        return cls._instances.get(provider)
+
+    def __init__(self, provider, api_keys=None, key_source=None):
+        self.provider = provider
+        self.window_seconds = Constants.API_KEY_WINDOW_SECONDS
+        self.requests_per_window = Constants.API_KEY_REQUESTS_PER_MINUTE[provider]
+        self.tokens_per_window = Constants.API_KEY_TOKENS_PER_MINUTE[provider]
+        self.key_source = key_source
+        self._api_keys = []
+        self._states = {}
+        self._state_lock = threading.Lock()
+        self._set_keys(key_source() if key_source else api_keys)
+
+    def reload_keys(self):
+        if self.key_source is not None:
+            self._set_keys(self.key_source())
+
+    def _set_keys(self, api_keys):
+        api_keys = list(dict.fromkeys(api_key.strip() for api_key in api_keys if api_key and api_key.strip()))
+        with self._state_lock:
+            if api_keys == self._api_keys:
+                return
+            if self._api_keys:
+                print(f"{self.provider} API keys changed: {len(self._api_keys)} -> {len(api_keys)} keys")
+            self._api_keys = api_keys
+            self._states = {
+                (api_key, model): state for (api_key, model), state in self._states.items() if api_key in api_keys
+            }
+
+    def _get_state(self, api_key, model):
+        state = self._states.get((api_key, model))
+        if state is None:
+            state = self._states[(api_key, model)] = KeyState(api_key, model)
+        return state
+
+    def _expire_events(self, state, now):
+        while state.events and state.events[0][0] <= now - self.window_seconds:
+            state.events.popleft()
+
+    def _headroom(self, state, now):
+        self._expire_events(state, now)
+        snapshot = state.header_snapshot
+        if snapshot and now - snapshot["received_at"] < self.window_seconds:
+            sent_since = [event for event in state.events if event[0] > snapshot["received_at"]]
+            remaining_requests = snapshot["remaining_requests"] - len(sent_since)
+            remaining_tokens = snapshot["remaining_tokens"] - sum(tokens for _, tokens in sent_since)
+            limit_requests = snapshot["limit_requests"]
+            limit_tokens = snapshot["limit_tokens"]
+        else:
+            limit_requests = self.requests_per_window
+            limit_tokens = self.tokens_per_window
+            remaining_requests = limit_requests - len(state.events)
+            remaining_tokens = limit_tokens - sum(tokens for _, tokens in state.events)
+        return min(
+            remaining_requests / limit_requests if limit_requests else 1.0,
+            remaining_tokens / limit_tokens if limit_tokens else 1.0,
+        )
+
+    def acquire(self, estimated_tokens=Constants.ANSWER_MAX_TOKENS, model=None):
+        """Returns the key to use for the next request to model and books the request against it."""
+        now = time.monotonic()
+        with self._state_lock:
+            states = [self._get_state(api_key, model) for api_key in self._api_keys]
+            available = [state for state in states if state.cooldown_until <= now]
+            if available:
+                state = max(available, key=lambda candidate: self._headroom(candidate, now))
+            else:
+                state = min(states, key=lambda candidate: candidate.cooldown_until)
+            state.events.append((now, estimated_tokens))
+            state.requests += 1
+            return state.api_key
+
+    def update_from_response(self, api_key, status_code, headers, model=None):
+        if api_key not in self._api_keys:
+            return
+        now = time.monotonic()
+        limit_requests_header, remaining_requests_header, limit_tokens_header, remaining_tokens_header = (
+            RATE_LIMIT_HEADERS[self.provider]
+        )
+        with self._state_lock:
+            state = self._get_state(api_key, model)
+            try:
+                state.header_snapshot = {
+                    "received_at": now,
+                    "limit_requests": int(headers[limit_requests_header]),
+                    "remaining_requests": int(headers[remaining_requests_header]),
+                    "limit_tokens": int(headers[limit_tokens_header]),
+                    "remaining_tokens": int(headers[remaining_tokens_header]),
+                }
+            except (KeyError, ValueError):
+                pass
+
+            if status_code == 429:
+                retry_after = parse_retry_after(headers.get("retry-after"))
+                if retry_after is None:
+                    retry_after = Constants.API_KEY_DEFAULT_COOLDOWN_SECONDS
+                state.cooldown_until = max(state.cooldown_until, now + retry_after)
+                state.rate_limited += 1
+                print(
+                    f"{self.provider} API key ...{api_key[-4:]} rate limited on {model}, "
+                    f"cooling down {retry_after:.1f}s"
+                )
+
+    def get_stats(self):
+        now = time.monotonic()
+        with self._state_lock:
+            return {
+                f"...{state.api_key[-4:]} {state.model or 'default'}": {
+                    "requests": state.requests,
+                    "rate_limited": state.rate_limited,
+                    "headroom": round(self._headroom(state, now), 3),
+                    "cooling_down": state.cooldown_until > now,
+                }
+                for state in self._states.values()
+            }
@@ -1,6 +1,7 @@
 from azure.storage.blob import BlobServiceClient
+from azure.storage.blob.aio import BlobServiceClient as AsyncBlobServiceClient
 
-from common.key_vault_manager import KeyVaultManager
+from common.service_container import ServiceContainer
 from utils.constants import Constants, KeyVaultSecretKeys
 
 
@@ -15,16 +16,37 @@ class AzureBlobClientManager:
         return cls._instance
 
     def _init(self):
-        key_vault_manager = KeyVaultManager.getInstance()
-        connection_string = key_vault_manager.get_secret(
+        self.connection_string = None
+        self.async_container_client = None
+        self.refresh_clients()
+
+    def refresh_clients(self):
+        """
+        Rebuilds the clients when the connection string in Key Vault was rotated.
+        Returns the replaced clients, for the caller to close once their
+        in-flight calls are done. May wait on Key Vault, so never call it from
+        a request.
+        """
+        connection_string = ServiceContainer.getInstance().get_secret(
             KeyVaultSecretKeys.AZURE_STORAGE_CONTAINER_CONNECTION_STRING
         )
+        if connection_string == self.connection_string:
+            return []
+        replaced = []
+        if self.connection_string is not None:
+            print("Storage connection string rotated, rebuilding the blob clients")
+            replaced = [
+                client for client in (self.container_client, self.async_container_client) if client is not None
+            ]
+        self.connection_string = connection_string
         self.blob_service_client = BlobServiceClient.from_connection_string(
-            connection_string
+            self.connection_string
         )
         self.container_client = self.blob_service_client.get_container_client(
             Constants.LLM_CONTAINER_NAME
         )
+        self.async_container_client = None
+        return replaced
 
     @classmethod
     def getInstance(cls, *args, **kwargs):
@@ -35,3 +57,13 @@ class AzureBlobClientManager:
 
     def get_container_client(self):
         return self.container_client
+
+    def get_async_container_client(self):
+        if not self.async_container_client:
+            async_blob_service_client = AsyncBlobServiceClient.from_connection_string(
+                self.connection_string
+            )
+            self.async_container_client = async_blob_service_client.get_container_client(
+                Constants.LLM_CONTAINER_NAME
+            )
+        return self.async_container_client
@@ -1,12 +1,41 @@
 import os
 import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 from azure.identity import ClientSecretCredential
 from azure.keyvault.secrets import SecretClient
 
 from utils.constants import Constants
 
 
+class SecretEntry:
+    def __init__(self, value, ttl_seconds):
+        self.value = value
+        self.fetched_at = time.monotonic()
+        self.expires_at = self.fetched_at + ttl_seconds
+        self.refreshing = False
+        # After a failed Key Vault call, no refresh of the entry is started before this time.
+        self.next_attempt_at = 0.0
+
+
 class KeyVaultManager:
+    """
+    Reads secrets from Key Vault through an in-process cache. A secret is
+    kept for its TTL (SECRET_TTL_SECONDS unless set per secret); a read in
+    the last SECRET_REFRESH_AHEAD_SECONDS before expiry returns the cached
+    value and refreshes it in a background thread, so hot secrets never
+    wait on Key Vault. When Key Vault cannot be reached the expired value is
+    served instead of failing, and Key Vault is tried again for it after
+    SECRET_ERROR_RETRY_SECONDS rather than on every read; a failed background
+    refresh backs off for the same time. Concurrent reads
+    of a missing or expired secret share one Key Vault call. Any object with
+    get_secret(name) -> .value can stand in for the SecretClient.
+
+    Callers that keep a client built from a secret should read the secret
+    again on use (a cache hit), so refreshed and rotated values reach them.
+    """
+
     _instance = None
     _lock = threading.Lock()
     _key_vault_name = Constants.KEY_VAULT_NAME
@@ -23,16 +52,119 @@ class KeyVaultManager:
                     cls._instance._init(*args, **kwargs)
         return cls._instance
 
-    def _init(self):
-        key_vault_url = f"https://{self._key_vault_name}.vault.azure.net/"
-        client_id = os.getenv('AZURE_CLIENT_ID')
-        tenant_id = os.getenv('AZURE_TENANT_ID')
-        client_secret = os.getenv('AZURE_CLIENT_SECRET')
-       
-        credential = ClientSecretCredential(tenant_id, client_id, client_secret)
-        self.client = SecretClient(
-            vault_url=key_vault_url, credential=credential
-        )
+    def _init(
+        self,
+        client=None,
+        ttl_seconds=Constants.SECRET_TTL_SECONDS,
+        refresh_ahead_seconds=Constants.SECRET_REFRESH_AHEAD_SECONDS,
+        error_retry_seconds=Constants.SECRET_ERROR_RETRY_SECONDS,
+    ):
+        if client is None:
+            key_vault_url = f"https://{self._key_vault_name}.vault.azure.net/"
+            client_id = os.getenv('AZURE_CLIENT_ID')
+            tenant_id = os.getenv('AZURE_TENANT_ID')
+            client_secret = os.getenv('AZURE_CLIENT_SECRET')
+
+            credential = ClientSecretCredential(tenant_id, client_id, client_secret)
+            client = SecretClient(
+                vault_url=key_vault_url, credential=credential
+            )
+        self.client = client
+        self.ttl_seconds = ttl_seconds
+        self.refresh_ahead_seconds = refresh_ahead_seconds
+        self.error_retry_seconds = error_retry_seconds
+        self._ttls = {}
+        self._cache = {}
+        self._cache_lock = threading.Lock()
+        self._fetch_locks = {}
+        self._stats = {
+            "hits": 0,
+            "misses": 0,
+            "background_refreshes": 0,
+            "refresh_failures": 0,
+            "stale_served": 0,
+            "shared_fetches": 0,
+        }
+
+    def set_ttl(self, secret_name, ttl_seconds):
+        """Overrides the TTL of one secret, e.g. a shorter one for keys that rotate often."""
+        self._ttls[secret_name] = ttl_seconds
+
+    def _fetch(self, secret_name):
+        value = self.client.get_secret(secret_name).value
+        with self._cache_lock:
+            self._cache[secret_name] = SecretEntry(value, self._ttls.get(secret_name, self.ttl_seconds))
+        return value
+
+    def _refresh(self, secret_name, entry):
+        try:
+            self._fetch(secret_name)
+            with self._cache_lock:
+                self._stats["background_refreshes"] += 1
+        except Exception as e:
+            with self._cache_lock:
+                self._stats["refresh_failures"] += 1
+                entry.next_attempt_at = time.monotonic() + self.error_retry_seconds
+            print(f"Background refresh of secret {secret_name} failed: {e}")
+        finally:
+            entry.refreshing = False
+
+    def _fetch_expired(self, secret_name):
+        """Fetches a missing or expired secret once for all the callers waiting on it."""
+        with self._cache_lock:
+            fetch_lock = self._fetch_locks.setdefault(secret_name, threading.Lock())
+        with fetch_lock:
+            with self._cache_lock:
+                entry = self._cache.get(secret_name)
+                if entry is not None and time.monotonic() < entry.expires_at:
+                    # Another caller fetched it (or backed off after an error) while this one waited.
+                    self._stats["shared_fetches"] += 1
+                    return entry.value
+            if entry is None:
+                return self._fetch(secret_name)
+            try:
+                return self._fetch(secret_name)
+            except Exception as e:
+                with self._cache_lock:
+                    self._stats["stale_served"] += 1
+                    entry.expires_at = entry.next_attempt_at = time.monotonic() + self.error_retry_seconds
+                print(f"Reading secret {secret_name} failed, serving the cached value: {e}")
+                return entry.value
 
     def get_secret(self, secret_name):
-        return self.client.get_secret(secret_name).value
\ No newline at end of file
+        now = time.monotonic()
+        refresh = False
+        with self._cache_lock:
+            entry = self._cache.get(secret_name)
+            if entry is None or now >= entry.expires_at:
+                self._stats["misses"] += 1
+            else:
+                self._stats["hits"] += 1
+                if (
+                    not entry.refreshing
+                    and now >= entry.next_attempt_at
+                    and now >= entry.expires_at - self.refresh_ahead_seconds
+                ):
+                    entry.refreshing = refresh = True
+        if entry is None or now >= entry.expires_at:
+            return self._fetch_expired(secret_name)
+
+        if refresh:
+            threading.Thread(target=self._refresh, args=(secret_name, entry), daemon=True).start()
+        return entry.value
+
+    def prefetch(self, secret_names):
+        """Reads the secrets concurrently, only going to Key Vault for the uncached ones. Returns name -> value."""
+        secret_names = sorted(set(secret_names))
+        if not secret_names:
+            return {}
+        workers = min(len(secret_names), Constants.SECRET_FETCH_CONCURRENCY)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            values = list(executor.map(self.get_secret, secret_names))
+        return dict(zip(secret_names, values))
+
+    def get_stats(self):
+        with self._cache_lock:
+            stats = dict(self._stats)
+            stats["cached_secrets"] = len(self._cache)
+        return stats
@@ -0,0 +1,190 @@
+import json
+import threading
+
+import anthropic
+import httpx
+from langchain_anthropic import ChatAnthropic
+from langchain_openai import ChatOpenAI
+
+from common.api_key_scheduler import ApiKeyScheduler
+from utils.constants import Constants, LLMProviders
+
+
+class LLMClientManager:
+    """
+    Process wide registry of chat model clients keyed by (provider, model, API key).
+    All clients of a provider share one pooled, HTTP/2 capable httpx client, so
+    requests reuse open connections instead of paying a TLS handshake each.
+    Per request settings (temperature, max_tokens, callbacks) are passed at call
+    time with .bind() / config and never stored on the shared client.
+    """
+
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls, *args, **kwargs):
+        raise NotImplementedError("Use getInstance() method to get an instance.")
+
+    @classmethod
+    def getInstance(cls, *args, **kwargs):
+        if not cls._instance:
+            with cls._lock:
+                if not cls._instance:
+                    cls._instance = super(LLMClientManager, cls).__new__(cls)
+                    cls._instance._init(*args, **kwargs)
+        return cls._instance
+
+    def _init(self):
+        self._clients = {}
+        self._http_clients = {}
+        self._client_lock = threading.Lock()
+        self._stats = {
+            "clients_created": 0,
+            "client_reuses": 0,
+            "requests": 0,
+            "new_connections": 0,
+            "tls_handshakes": 0,
+        }
+
+    def _get_http_client(self, provider, is_async=True):
+        http_client = self._http_clients.get((provider, is_async))
+        if http_client is None:
+            client_class = httpx.AsyncClient if is_async else httpx.Client
+            http_client = client_class(
+                http2=True,
+                limits=httpx.Limits(
+                    max_connections=Constants.LLM_HTTP_MAX_CONNECTIONS,
+                    max_keepalive_connections=Constants.LLM_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+                    keepalive_expiry=Constants.LLM_HTTP_KEEPALIVE_EXPIRY,
+                ),
+                timeout=httpx.Timeout(Constants.LLM_HTTP_TIMEOUT, connect=10.0),
+                event_hooks={
+                    "request": [self._on_async_request if is_async else self._on_request],
+                    "response": [
+                        self._async_response_hook(provider)
+                        if is_async
+                        else self._response_hook(provider)
+                    ],
+                },
+            )
+            self._http_clients[(provider, is_async)] = http_client
+        return http_client
+
+    def _on_request(self, request):
+        self._stats["requests"] += 1
+        request.extensions["trace"] = self._on_trace
+
+    async def _on_async_request(self, request):
+        self._stats["requests"] += 1
+        request.extensions["trace"] = self._on_async_trace
+
+    def _response_hook(self, provider):
+        def on_response(response):
+            scheduler = ApiKeyScheduler.get_registered(provider)
+            if scheduler is None:
+                return
+            if provider == LLMProviders.ANTHROPIC:
+                api_key = response.request.headers.get("x-api-key", "")
+            else:
+                api_key = response.request.headers.get("authorization", "").removeprefix("Bearer ")
+            scheduler.update_from_response(
+                api_key, response.status_code, response.headers, self._request_model(response.request)
+            )
+
+        return on_response
+
+    @staticmethod
+    def _request_model(request):
+        """The model of a chat request, read from its JSON body; rate limits are per key and model."""
+        try:
+            return json.loads(request.content).get("model")
+        except (httpx.RequestNotRead, ValueError, AttributeError):
+            return None
+
+    def _async_response_hook(self, provider):
+        on_response = self._response_hook(provider)
+
+        async def on_async_response(response):
+            on_response(response)
+
+        return on_async_response
+
+    def _on_trace(self, event_name, info):
+        if event_name == "connection.connect_tcp.complete":
+            self._stats["new_connections"] += 1
+        elif event_name == "connection.start_tls.complete":
+            self._stats["tls_handshakes"] += 1
+
+    async def _on_async_trace(self, event_name, info):
+        self._on_trace(event_name, info)
+
+    def _get_or_create(self, key, factory):
+        client = self._clients.get(key)
+        if client is not None:
+            self._stats["client_reuses"] += 1
+            return client
+        with self._client_lock:
+            client = self._clients.get(key)
+            if client is None:
+                client = factory()
+                self._clients[key] = client
+                self._stats["clients_created"] += 1
+            else:
+                self._stats["client_reuses"] += 1
+        return client
+
+    def get_chat_openai(self, model, api_key, base_url=None):
+        def factory():
+            return ChatOpenAI(
+                model=model,
+                api_key=api_key,
+                base_url=base_url,
+                streaming=True,
+                verbose=True,
+                http_client=self._get_http_client(LLMProviders.OPENAI, is_async=False),
+                http_async_client=self._get_http_client(LLMProviders.OPENAI),
+            )
+
+        return self._get_or_create((LLMProviders.OPENAI, model, api_key, base_url), factory)
+
+    def get_chat_anthropic(self, model, api_key, base_url=None):
+        def factory():
+            llm = ChatAnthropic(
+                model_name=model,
+                api_key=api_key,
+                streaming=True,
+                verbose=True,
+                **({"anthropic_api_url": base_url} if base_url else {}),
+            )
+            # ChatAnthropic has no http client option; swap its async client
+            # for one that shares the provider connection pool.
+            object.__setattr__(
+                llm,
+                "_async_client",
+                anthropic.AsyncAnthropic(
+                    api_key=api_key,
+                    base_url=llm.anthropic_api_url,
+                    max_retries=llm.max_retries,
+                    http_client=self._get_http_client(LLMProviders.ANTHROPIC),
+                ),
+            )
+            return llm
+
+        return self._get_or_create((LLMProviders.ANTHROPIC, model, api_key, base_url), factory)
+
+    def get_stats(self):
+        stats = dict(self._stats)
+        stats["clients"] = len(self._clients)
+        stats["connection_reuse_rate"] = (
+            1 - stats["new_connections"] / stats["requests"] if stats["requests"] else 0.0
+        )
+        return stats
+
+    async def aclose(self):
+        for http_client in self._http_clients.values():
+            if isinstance(http_client, httpx.AsyncClient):
+                await http_client.aclose()
+            else:
+                http_client.close()
+        self._http_clients = {}
+        self._clients = {}
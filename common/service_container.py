@@ -0,0 +1,255 @@
+import asyncio
+import threading
+import time
+
+from common.key_vault_manager import KeyVaultManager
+from utils.constants import Constants
+
+
+class ServiceContainer:
+    """
+    Owns the process wide clients of the app and the secrets they are built
+    from, so importing a module never touches Key Vault or the network.
+
+    Modules register a factory per service, with the secrets it needs. On
+    startup the secrets of every registered service are prefetched into the
+    KeyVaultManager cache in one concurrent batch, then the eager services
+    are built; the others are built the first time they are asked for. A
+    failed startup leaves the app up but not ready, and is retried in the
+    background instead of crash-looping the pod.
+
+    get() only reads the built services and never waits on Key Vault. A
+    background task started with the app checks for rotated secrets every
+    SECRET_ROTATION_CHECK_SECONDS, in a thread: a service is rebuilt when one
+    of its secrets changed or a service it depends on was rebuilt, and the
+    old one is closed ROTATED_CLIENT_CLOSE_DELAY_SECONDS later, once its
+    in-flight calls are done. Services registered with rebuild=False re-read
+    their secrets in their refresh hook instead.
+    """
+
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls, *args, **kwargs):
+        raise NotImplementedError("Use getInstance() method to get an instance.")
+
+    @classmethod
+    def getInstance(cls, *args, **kwargs):
+        if not cls._instance:
+            with cls._lock:
+                if not cls._instance:
+                    cls._instance = super(ServiceContainer, cls).__new__(cls)
+                    cls._instance._init(*args, **kwargs)
+        return cls._instance
+
+    def _init(self):
+        self._secret_names = set()
+        self._factories = {}
+        self._closers = {}
+        self._refreshers = {}
+        self._service_secrets = {}
+        self._dependencies = {}
+        self._built_from = {}
+        self._eager = []
+        self._services = {}
+        self._service_locks = {}
+        self._build_seconds = {}
+        self._state_lock = threading.Lock()
+        self._ready = False
+        self._errors = {}
+        self._startup_attempts = 0
+        self._startup_seconds = None
+        self._retry_task = None
+        self._rotation_task = None
+        self._close_tasks = set()
+
+    def load_secrets(self):
+        """Prefetches the secrets of every registered service, concurrently."""
+        return KeyVaultManager.getInstance().prefetch(self._secret_names)
+
+    def get_secrets(self, *names):
+        """Returns the values of the secrets; the uncached ones are read from Key Vault in one batch."""
+        values = KeyVaultManager.getInstance().prefetch(names)
+        return [values[name] for name in names]
+
+    def get_secret(self, name):
+        return KeyVaultManager.getInstance().get_secret(name)
+
+    def register(
+        self, name, factory, eager=False, secrets=(), close=None, depends=(), rebuild=True, refresh=None
+    ):
+        """
+        Registers a service built by factory() on first use, or at startup when
+        eager. Its secrets join the startup batch; close(service) runs on
+        shutdown and when the service is rebuilt. depends names the services
+        the factory uses, so the service is rebuilt with them. refresh(service)
+        runs on every rotation check and returns the objects it replaced, to be
+        closed like a rebuilt service.
+        """
+        with self._state_lock:
+            self._factories[name] = factory
+            self._service_locks.setdefault(name, threading.Lock())
+            self._secret_names.update(secrets)
+            self._service_secrets[name] = tuple(secrets) if rebuild else ()
+            self._dependencies[name] = tuple(depends)
+            if close is not None:
+                self._closers[name] = close
+            if refresh is not None:
+                self._refreshers[name] = refresh
+            if eager and name not in self._eager:
+                self._eager.append(name)
+
+    def _inputs(self, name):
+        """What the service is built from: its secret values and the identity of its dependencies."""
+        key_vault_manager = KeyVaultManager.getInstance()
+        return tuple(key_vault_manager.get_secret(secret) for secret in self._service_secrets[name]) + tuple(
+            id(self.get(dependency)) for dependency in self._dependencies[name]
+        )
+
+    def _close(self, name, service):
+        close = self._closers.get(name)
+        if close is None:
+            return None
+        return close(service)
+
+    def _build(self, name):
+        inputs = self._inputs(name)
+        started = time.perf_counter()
+        service = self._factories[name]()
+        self._build_seconds[name] = time.perf_counter() - started
+        self._built_from[name] = inputs
+        return service
+
+    def get(self, name):
+        service = self._services.get(name)
+        if service is None:
+            with self._service_locks[name]:
+                service = self._services.get(name)
+                if service is None:
+                    service = self._services[name] = self._build(name)
+        return service
+
+    def _check_rotation(self, name, checked, retired):
+        if name in checked:
+            return
+        checked.add(name)
+        for dependency in self._dependencies[name]:
+            self._check_rotation(dependency, checked, retired)
+        service = self._services.get(name)
+        if service is None:
+            return
+
+        refresh = self._refreshers.get(name)
+        if refresh is not None:
+            retired.extend((name, lambda old=old: old.close()) for old in refresh(service) or ())
+        if not self._service_secrets[name] and not self._dependencies[name]:
+            return
+        if self._inputs(name) == self._built_from.get(name):
+            return
+        with self._service_locks[name]:
+            self._services[name] = self._build(name)
+        print(f"Rebuilt {name} after a secret rotation")
+        retired.append((name, lambda: self._close(name, service)))
+
+    def check_rotations(self):
+        """
+        Rebuilds the services whose secrets were rotated, dependencies first,
+        and runs the refresh hooks. Blocking; returns (name, close) pairs for
+        what was replaced.
+        """
+        checked, retired = set(), []
+        for name in list(self._factories):
+            try:
+                self._check_rotation(name, checked, retired)
+            except Exception as e:
+                print(f"Rotation check of {name} failed: {e}")
+        return retired
+
+    async def _close_later(self, name, close):
+        await asyncio.sleep(Constants.ROTATED_CLIENT_CLOSE_DELAY_SECONDS)
+        try:
+            result = close()
+            if asyncio.iscoroutine(result):
+                await result
+        except Exception as e:
+            print(f"Closing the previous {name} failed: {e}")
+
+    async def _watch_rotations(self):
+        while True:
+            await asyncio.sleep(Constants.SECRET_ROTATION_CHECK_SECONDS)
+            for name, close in await asyncio.to_thread(self.check_rotations):
+                task = asyncio.create_task(self._close_later(name, close))
+                self._close_tasks.add(task)
+                task.add_done_callback(self._close_tasks.discard)
+
+    async def startup(self):
+        """Loads all secrets in one batch, then builds the eager services concurrently. Returns readiness."""
+        self._startup_attempts += 1
+        started = time.perf_counter()
+        errors = {}
+        try:
+            await asyncio.to_thread(self.load_secrets)
+        except Exception as e:
+            errors["secrets"] = repr(e)
+        else:
+            results = await asyncio.gather(
+                *(asyncio.to_thread(self.get, name) for name in self._eager), return_exceptions=True
+            )
+            for name, result in zip(self._eager, results):
+                if isinstance(result, Exception):
+                    errors[name] = repr(result)
+
+        self._errors = errors
+        self._ready = not errors
+        if self._ready:
+            self._startup_seconds = time.perf_counter() - started
+            print(f"Services ready in {self._startup_seconds:.2f}s")
+        else:
+            print(f"Service startup attempt {self._startup_attempts} failed: {errors}")
+        return self._ready
+
+    async def _retry_startup(self):
+        delay = Constants.STARTUP_RETRY_SECONDS
+        while True:
+            await asyncio.sleep(delay)
+            if await self.startup():
+                return
+            delay = min(delay * 2, Constants.STARTUP_RETRY_MAX_SECONDS)
+
+    async def start(self):
+        """Startup for the FastAPI lifespan: never raises, keeps retrying in the background until ready."""
+        if not await self.startup():
+            self._retry_task = asyncio.create_task(self._retry_startup())
+        self._rotation_task = asyncio.create_task(self._watch_rotations())
+
+    async def stop(self):
+        for task in (self._retry_task, self._rotation_task, *self._close_tasks):
+            if task is not None:
+                task.cancel()
+        self._retry_task = self._rotation_task = None
+        for name in reversed(list(self._services)):
+            try:
+                result = self._close(name, self._services[name])
+                if asyncio.iscoroutine(result):
+                    await result
+            except Exception as e:
+                print(f"Closing {name} failed: {e}")
+        self._services.clear()
+        self._built_from.clear()
+        self._ready = False
+
+    def is_ready(self):
+        return self._ready
+
+    def readiness(self):
+        return {
+            "ready": self._ready,
+            "startup_attempts": self._startup_attempts,
+            "startup_seconds": self._startup_seconds,
+            "secrets": len(self._secret_names),
+            "services": {
+                name: round(self._build_seconds[name], 4) if name in self._services else None
+                for name in self._factories
+            },
+            "errors": dict(self._errors),
+        }
@@ -7,3 +7,18 @@ class OpenAIModel(Enum):
     CLAUDE_3_OPOUS = "claude-3-opous"
     TITLE = "title"
     NH_QA = "nh-qa"
+
+    @property
+    def context_window(self):
+        return MODEL_CONTEXT_WINDOWS[self]
+
+
+# Context window (in tokens) of the model that actually serves each option
+MODEL_CONTEXT_WINDOWS = {
+    OpenAIModel.GPT_4O: 128000,
+    OpenAIModel.GPT_4: 8192,
+    OpenAIModel.CLAUDE_3_OPUS: 200000,
+    OpenAIModel.CLAUDE_3_OPOUS: 200000,
+    OpenAIModel.TITLE: 8192,
+    OpenAIModel.NH_QA: 8192,
+}
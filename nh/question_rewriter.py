@@ -0,0 +1,172 @@
+import hashlib
+import json
+import re
+import threading
+import time
+from collections import OrderedDict
+
+from langchain_core.messages import HumanMessage
+from langchain_core.output_parsers import StrOutputParser
+from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
+
+from utils.constants import Constants
+
+# Words that point back into the conversation: a question containing them needs the history.
+REFERENCE_PATTERN = re.compile(
+    r"\b(it|its|they|them|their|this|that|these|those|he|she|him|her|his|"
+    r"above|previous|previously|earlier|same|also|else|instead|more|another|other|"
+    r"what about|how about|and what|as well)\b",
+    re.IGNORECASE,
+)
+STANDALONE_MIN_WORDS = 6
+JSON_OBJECT_PATTERN = re.compile(r"\{.*\}", re.DOTALL)
+
+contextualize_q_system_prompt = """Given a chat history and the latest user question \
+which might reference context in the chat history, formulate a standalone question \
+which can be understood without the chat history. Do NOT answer the question, \
+just reformulate it if needed and otherwise return it as is."""
+
+contextualize_q_with_variants_system_prompt = """Given a chat history (possibly empty) and the latest \
+user question which might reference context in the chat history, formulate a standalone question \
+which can be understood without the chat history. Do NOT answer the question. Then write {variants} \
+different versions of the standalone question, to retrieve relevant documents from a vector database \
+despite the limitations of distance-based similarity search.
+Reply with JSON only, in the form {{"standalone_question": "...", "variants": ["...", "..."]}}"""
+
+
+class QuestionRewriter:
+    """
+    Turns the latest nh-qa question into a standalone question, and when asked
+    into retrieval query variants too, with at most one LLM call. The call is
+    skipped when the question needs no history and no variants are wanted,
+    and rewrites are cached per (history hash, question).
+    """
+
+    def __init__(
+        self,
+        get_llm,
+        variants=Constants.QUESTION_REWRITE_VARIANTS,
+        max_entries=Constants.QUESTION_REWRITE_CACHE_MAX_ENTRIES,
+        ttl_seconds=Constants.QUESTION_REWRITE_CACHE_TTL_SECONDS,
+    ):
+        self.get_llm = get_llm
+        self.variants = variants
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"skipped": 0, "cache_hits": 0, "llm_calls": 0, "parse_failures": 0}
+
+    @staticmethod
+    def prior_history(question, chat_history):
+        """The history before the latest question (get_history_question includes the question itself)."""
+        if chat_history and isinstance(chat_history[-1], HumanMessage) and chat_history[-1].content == question:
+            return chat_history[:-1]
+        return chat_history
+
+    @staticmethod
+    def is_standalone(question, prior_history):
+        if not prior_history:
+            return True
+        return len(question.split()) >= STANDALONE_MIN_WORDS and not REFERENCE_PATTERN.search(question)
+
+    @staticmethod
+    def _cache_key(question, prior_history, with_variants):
+        history_hash = hashlib.sha256(
+            "\n".join(f"{message.type}:{message.content}" for message in prior_history).encode("utf-8")
+        ).hexdigest()
+        return (history_hash, question.strip(), with_variants)
+
+    def _cache_get(self, key):
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                return None
+            if time.monotonic() - entry[0] > self.ttl_seconds:
+                del self._cache[key]
+                return None
+            self._cache.move_to_end(key)
+            self._stats["cache_hits"] += 1
+            return entry[1]
+
+    def _cache_put(self, key, value):
+        with self._lock:
+            self._cache[key] = (time.monotonic(), value)
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
+
+    def _chain(self, with_variants):
+        system_prompt = (
+            contextualize_q_with_variants_system_prompt.format(variants=self.variants)
+            if with_variants
+            else contextualize_q_system_prompt
+        )
+        prompt = ChatPromptTemplate.from_messages(
+            [
+                ("system", system_prompt.replace("{", "{{").replace("}", "}}")),
+                MessagesPlaceholder(variable_name="chat_history"),
+                ("human", "{question}"),
+            ]
+        )
+        return (prompt | self.get_llm() | StrOutputParser()).with_config(tags=["contextualize_q_chain"])
+
+    def _parse(self, question, output, with_variants):
+        """Returns the standalone question and the retrieval queries from the LLM output, or None."""
+        if not with_variants:
+            standalone_question = output.strip() or question
+            return standalone_question, [standalone_question]
+        try:
+            parsed = json.loads(JSON_OBJECT_PATTERN.search(output).group(0))
+            standalone_question = str(parsed.get("standalone_question") or question).strip()
+            variants = [str(variant).strip() for variant in parsed.get("variants", []) if str(variant).strip()]
+        except (AttributeError, ValueError):
+            with self._lock:
+                self._stats["parse_failures"] += 1
+            return None
+        queries = list(dict.fromkeys([standalone_question] + variants[: self.variants]))
+        return standalone_question, queries
+
+    def _prepare(self, question, chat_history, with_variants):
+        prior_history = self.prior_history(question, chat_history)
+        if self.is_standalone(question, prior_history):
+            if not with_variants:
+                with self._lock:
+                    self._stats["skipped"] += 1
+                return None, None, (question, [question])
+            # The variants do not depend on the history, so leave it out of the call and the key.
+            prior_history = []
+        key = self._cache_key(question, prior_history, with_variants)
+        return prior_history, key, self._cache_get(key)
+
+    def rewrite(self, question, chat_history, with_variants=False):
+        prior_history, key, result = self._prepare(question, chat_history, with_variants)
+        if result is not None:
+            return result
+        with self._lock:
+            self._stats["llm_calls"] += 1
+        output = self._chain(with_variants).invoke({"question": question, "chat_history": prior_history})
+        result = self._parse(question, output, with_variants)
+        if result is None:
+            return question, [question]
+        self._cache_put(key, result)
+        return result
+
+    async def arewrite(self, question, chat_history, with_variants=False):
+        prior_history, key, result = self._prepare(question, chat_history, with_variants)
+        if result is not None:
+            return result
+        with self._lock:
+            self._stats["llm_calls"] += 1
+        output = await self._chain(with_variants).ainvoke({"question": question, "chat_history": prior_history})
+        result = self._parse(question, output, with_variants)
+        if result is None:
+            return question, [question]
+        self._cache_put(key, result)
+        return result
+
+    def get_stats(self):
+        with self._lock:
+            stats = dict(self._stats)
+            stats["cache_entries"] = len(self._cache)
+        return stats
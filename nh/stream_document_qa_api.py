@@ -1,82 +1,132 @@
-import random
+import asyncio
+import hashlib
 from urllib.parse import quote
 
-from langchain.prompts import ChatPromptTemplate
-from langchain.retrievers.multi_query import MultiQueryRetriever
-from langchain_openai import ChatOpenAI, OpenAIEmbeddings
-from langchain_core.output_parsers import StrOutputParser
-from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
-from langchain_community.vectorstores import PGVector
+from langchain_openai import OpenAIEmbeddings
+import sqlalchemy
 
+from nh.question_rewriter import QuestionRewriter
 from src.helper import *
-from common.key_vault_manager import KeyVaultManager
-from utils.constants import KeyVaultSecretKeys
+from src.vectorstore.dedup import dedupe_documents
+from src.vectorstore.embedding_cache import CachedEmbeddings
+from src.vectorstore.hybrid_retriever import HybridRetriever
+from src.vectorstore.index_manager import search_connect_args
+from src.vectorstore.multi_query_search import MultiQueryVectorSearch
+from src.vectorstore.reranker import ChunkReranker
+from common.api_key_scheduler import ApiKeyScheduler
+from common.llm_client_manager import LLMClientManager
+from common.service_container import ServiceContainer
+from utils.constants import Constants, KeyVaultSecretKeys, LLMProviders
 
-# Initialize key vault manager
-key_vault_manager = KeyVaultManager.getInstance()
+services = ServiceContainer.getInstance()
 
-# Retrieve secrets
-openai_key = key_vault_manager.get_secret(KeyVaultSecretKeys.OPENAI_API_KEY)
-OPENAI_API_KEY_LIST = key_vault_manager.get_secret(KeyVaultSecretKeys.OPENAI_API_KEY_LIST).split(",")
-db_name = "postgres"
-db_user = key_vault_manager.get_secret(KeyVaultSecretKeys.POSTGRES_USER)
-db_password = key_vault_manager.get_secret(KeyVaultSecretKeys.POSTGRES_PASSWORD)
-db_host = key_vault_manager.get_secret(KeyVaultSecretKeys.POSTGRES_HOST)
-db_port = key_vault_manager.get_secret(KeyVaultSecretKeys.POSTGRES_PORT)
+COLLECTION_NAME = "poc_v0"
+DB_NAME = "postgres"
+DB_SECRETS = (
+    KeyVaultSecretKeys.POSTGRES_USER,
+    KeyVaultSecretKeys.POSTGRES_PASSWORD,
+    KeyVaultSecretKeys.POSTGRES_HOST,
+    KeyVaultSecretKeys.POSTGRES_PORT,
+)
 
-# Set environment variable for OpenAI API Key
-os.environ["OPENAI_API_KEY"] = random.choice(OPENAI_API_KEY_LIST)
+llm_client_manager = LLMClientManager.getInstance()
 
-# Initialize embedding
-embedding = OpenAIEmbeddings(api_key=openai_key)
 
-# Connection string for PostgreSQL
-CONNECTION_STRING = f"postgresql+psycopg2://{db_user}:{quote(db_password)}@{db_host}:{db_port}/{db_name}"
-COLLECTION_NAME = "poc_v0"
+def get_openai_api_keys():
+    return services.get_secret(KeyVaultSecretKeys.OPENAI_API_KEY_LIST).split(",")
 
-# Initialize PGVector
-nh_knowldge_store = PGVector(
-    collection_name=COLLECTION_NAME,
-    connection_string=CONNECTION_STRING,
-    embedding_function=embedding,
-)
 
-# Initialize retriever from knowledge store
-nh_knowldge_retriever = nh_knowldge_store.as_retriever(
-    search_type="similarity_score_threshold", search_kwargs={"score_threshold": 0.75}
-)
+def create_openai_key_scheduler():
+    return ApiKeyScheduler.getInstance(LLMProviders.OPENAI, key_source=get_openai_api_keys)
+
+
+def create_embedding():
+    return CachedEmbeddings(OpenAIEmbeddings(api_key=services.get_secret(KeyVaultSecretKeys.OPENAI_API_KEY)))
 
-# Initialize ChatOpenAI
-llm = ChatOpenAI(api_key=os.environ["OPENAI_API_KEY"], temperature=0.1, model_name="gpt-4")
 
-# Initialize MultiQueryRetriever
-retriever_from_llm = MultiQueryRetriever.from_llm(
-    retriever=nh_knowldge_retriever, llm=llm
+def get_connection_string():
+    db_user, db_password, db_host, db_port = services.get_secrets(*DB_SECRETS)
+    return f"postgresql+psycopg2://{db_user}:{quote(db_password)}@{db_host}:{db_port}/{DB_NAME}"
+
+
+def create_nh_engine():
+    """One connection pool for the multi-query search and the hybrid retriever."""
+    return sqlalchemy.create_engine(get_connection_string(), connect_args=search_connect_args())
+
+
+services.register(
+    "openai_key_scheduler",
+    create_openai_key_scheduler,
+    eager=True,
+    secrets=[KeyVaultSecretKeys.OPENAI_API_KEY_LIST],
+    rebuild=False,
+    refresh=lambda scheduler: scheduler.reload_keys(),
+)
+services.register(
+    "embedding", create_embedding, eager=True, secrets=[KeyVaultSecretKeys.OPENAI_API_KEY]
+)
+services.register(
+    "nh_engine", create_nh_engine, eager=True, secrets=DB_SECRETS, close=lambda engine: engine.dispose()
 )
+services.register("reranker", ChunkReranker.getInstance, eager=True)
+# Searches all rewritten sub-queries of a question in one batched statement
+services.register(
+    "nh_multi_query_search",
+    lambda: MultiQueryVectorSearch(services.get("nh_engine"), services.get("embedding"), COLLECTION_NAME),
+    eager=True,
+    depends=("nh_engine", "embedding"),
+)
+# Full text + vector retriever, used instead of the multi-query one when NH_QA_RETRIEVER is "hybrid"
+services.register(
+    "nh_hybrid_retriever",
+    lambda: HybridRetriever(
+        engine=services.get("nh_engine"), embeddings=services.get("embedding"), collection_name=COLLECTION_NAME
+    ),
+    eager=True,
+    depends=("nh_engine", "embedding"),
+)
+
+
+def get_llm():
+    """Returns the question rewriting model on the API key with the most rate limit headroom right now."""
+    return llm_client_manager.get_chat_openai(
+        Constants.QUESTION_REWRITER_MODEL,
+        services.get("openai_key_scheduler").acquire(
+            estimated_tokens=Constants.QUESTION_REWRITE_ESTIMATED_TOKENS, model=Constants.QUESTION_REWRITER_MODEL
+        ),
+    ).bind(temperature=0.1)
+
+
+question_rewriter = QuestionRewriter(get_llm)
+
 
 def format_docs(docs):
     return "\n\n".join(doc.page_content for doc in docs)
 
-contextualize_q_system_prompt = """Given a chat history and the latest user question \
-which might reference context in the chat history, formulate a standalone question \
-which can be understood without the chat history. Do NOT answer the question, \
-just reformulate it if needed and otherwise return it as is."""
-contextualize_q_prompt = ChatPromptTemplate.from_messages(
-    [
-        ("system", contextualize_q_system_prompt),
-        MessagesPlaceholder(variable_name="chat_history"),
-        ("human", "{question}"),
-    ]
-)
-contextualize_q_chain = (contextualize_q_prompt | llm | StrOutputParser()).with_config(
-    tags=["contextualize_q_chain"]
-)
 
-def get_sourced_documents(session_user_question, chat_history):
-    contextualized_question = contextualize_q_chain.invoke(
-        {"question": session_user_question, "chat_history": chat_history}
+def chunk_id(doc):
+    """Content based id of a retrieved chunk."""
+    return hashlib.sha256(
+        f"{doc.metadata.get('file_name')}|{doc.page_content}".encode("utf-8")
+    ).hexdigest()
+
+
+async def aretrieve_documents(queries):
+    """Searches every sub-query in one round trip; chunks found by several keep their best score."""
+    return dedupe_documents(await services.get("nh_multi_query_search").asearch(queries))
+
+
+async def aget_sourced_documents(session_user_question, chat_history):
+    # At most one LLM call before the answer: the rewrite and, for multi-query retrieval, its variants.
+    contextualized_question, queries = await question_rewriter.arewrite(
+        session_user_question, chat_history, with_variants=Constants.NH_QA_RETRIEVER != "hybrid"
     )
-    source_docs = retriever_from_llm.invoke(contextualized_question)
+    if Constants.NH_QA_RETRIEVER == "hybrid":
+        source_docs = dedupe_documents(await services.get("nh_hybrid_retriever").ainvoke(contextualized_question))
+    else:
+        source_docs = await aretrieve_documents(queries)
+    if Constants.RERANK_ENABLED:
+        source_docs = await asyncio.to_thread(services.get("reranker").rerank, contextualized_question, source_docs)
     formatted_docs = format_docs(source_docs)
 
-    return contextualized_question, source_docs, formatted_docs
\ No newline at end of file
+    return contextualized_question, source_docs, formatted_docs
@@ -0,0 +1,164 @@
+import math
+import re
+
+from enums.model import OpenAIModel
+from utils.constants import Constants
+from utils.tokens import count_tokens, truncate_tokens
+
+WORD_PATTERN = re.compile(r"[a-z0-9]{3,}")
+SECTION_SEPARATOR = "\n\n"
+
+# Totals over all prompts built by the process, served by /stats/
+context_stats = {
+    "prompts": 0,
+    "trimmed_prompts": 0,
+    "sections_truncated": 0,
+    "context_tokens": 0,
+    "budget_tokens": 0,
+}
+
+
+def get_terms(text):
+    return set(WORD_PATTERN.findall(text.lower()))
+
+
+def escape_template(text):
+    """Document text goes into a prompt template, so literal braces must not be read as variables."""
+    return text.replace("{", "{{").replace("}", "}}")
+
+
+class ContextBuilder:
+    """
+    Assembles the system prompt of a document chat within the context window
+    of the model. History, the question and the answer (ANSWER_MAX_TOKENS) are
+    reserved first; what is left is filled with the document sections that
+    share the most terms with the question, kept in their original order.
+    Sections that do not fit are skipped so smaller ones further down can
+    still be kept; the best ranked of the skipped sections is then cut to
+    the tokens left rather than dropped, so a file without paragraph breaks
+    still reaches the model. The blank line after each section counts too.
+    """
+
+    def __init__(self, model_name, header, user_question="", chat_history=None):
+        self.header = header
+        self.user_question = user_question
+        self.sources = []
+
+        history_text = "\n".join(
+            str(message.content) for message in (chat_history or [])
+        )
+        self.reserved_tokens = {
+            "header": count_tokens(header),
+            "history": count_tokens(history_text),
+            "question": count_tokens(user_question),
+            "answer": Constants.ANSWER_MAX_TOKENS,
+        }
+        self.budget = max(
+            OpenAIModel(model_name).context_window - sum(self.reserved_tokens.values()),
+            0,
+        )
+        self.token_report = {}
+        self.truncated = set()
+
+    def add_source(self, name, text, token_count=None):
+        self.sources.append((name, text, token_count))
+
+    def build(self):
+        source_sections = []
+        for name, text, token_count in self.sources:
+            sections = [section for section in text.split(SECTION_SEPARATOR) if section.strip()]
+            source_sections.append((name, sections, token_count))
+
+        separator_tokens = count_tokens(SECTION_SEPARATOR)
+        total_tokens = sum(
+            token_count if token_count is not None else count_tokens(text)
+            for _, text, token_count in self.sources
+        ) + separator_tokens * sum(len(sections) for _, sections, _ in source_sections)
+        if total_tokens <= self.budget:
+            selected = {
+                (source_index, section_index)
+                for source_index, (_, sections, _) in enumerate(source_sections)
+                for section_index in range(len(sections))
+            }
+            section_tokens = None
+        else:
+            selected, section_tokens = self._rank_and_trim(source_sections)
+
+        parts = [self.header]
+        sources_report = {}
+        for source_index, (name, sections, token_count) in enumerate(source_sections):
+            kept = [
+                section
+                for section_index, section in enumerate(sections)
+                if (source_index, section_index) in selected
+            ]
+            if section_tokens is None:
+                included_tokens = (
+                    token_count
+                    if token_count is not None
+                    else count_tokens(self.sources[source_index][1])
+                )
+            else:
+                included_tokens = sum(
+                    section_tokens[(source_index, section_index)]
+                    for section_index in range(len(sections))
+                    if (source_index, section_index) in selected
+                )
+            sources_report[name] = {
+                "tokens": included_tokens,
+                "sections_kept": len(kept),
+                "sections_total": len(sections),
+                "sections_truncated": sum(
+                    1 for source, _ in self.truncated if source == source_index
+                ),
+            }
+            parts.extend(escape_template(section) + SECTION_SEPARATOR for section in kept)
+
+        self.token_report = {
+            "budget": self.budget,
+            "reserved": self.reserved_tokens,
+            "sources": sources_report,
+        }
+        context_stats["prompts"] += 1
+        context_stats["trimmed_prompts"] += section_tokens is not None
+        context_stats["sections_truncated"] += len(self.truncated)
+        context_stats["context_tokens"] += sum(source["tokens"] for source in sources_report.values())
+        context_stats["budget_tokens"] += self.budget
+        return "".join(parts)
+
+    def _rank_and_trim(self, source_sections):
+        question_terms = get_terms(self.user_question)
+        section_tokens = {}
+        ranked = []
+        for source_index, (_, sections, _) in enumerate(source_sections):
+            for section_index, section in enumerate(sections):
+                tokens = count_tokens(section)
+                section_tokens[(source_index, section_index)] = tokens
+                overlap = len(question_terms & get_terms(section))
+                score = overlap / math.sqrt(tokens) if tokens else 0.0
+                # Ties keep document order, so an unrelated question keeps the earliest sections.
+                ranked.append((-score, source_index, section_index))
+
+        separator_tokens = count_tokens(SECTION_SEPARATOR)
+        selected = set()
+        used_tokens = 0
+        overflow = None
+        for _, source_index, section_index in sorted(ranked):
+            tokens = section_tokens[(source_index, section_index)] + separator_tokens
+            if used_tokens + tokens > self.budget:
+                if overflow is None:
+                    overflow = (source_index, section_index)
+                continue
+            selected.add((source_index, section_index))
+            used_tokens += tokens
+
+        remaining_tokens = self.budget - used_tokens - separator_tokens
+        if overflow is not None and remaining_tokens > 0:
+            source_index, section_index = overflow
+            sections = source_sections[source_index][1]
+            sections[section_index] = truncate_tokens(sections[section_index], remaining_tokens)
+            section_tokens[overflow] = count_tokens(sections[section_index])
+            if sections[section_index].strip():
+                selected.add(overflow)
+                self.truncated.add(overflow)
+        return selected, section_tokens
@@ -1,92 +1,66 @@
+import asyncio
 import re
 from langchain.memory import ConversationBufferMemory
 from langchain.prompts import ChatPromptTemplate
 from langchain.schema import AIMessage, HumanMessage
 
-from utils.blob_utils import get_content_from_azure_blob
-from utils.documents import *
+from src.context_builder import ContextBuilder
+from utils.blob_utils import aget_content_from_azure_blob
 from utils.get_tags import *
+from utils.prompt_assets import PromptAssetStore
 from utils.prompt import *
 
 
-def get_prompt(model_name, session_tags, files):
-    if len(session_tags) == 0 and len(files) == 0 and model_name != "title":
-        prompt = ChatPromptTemplate.from_template(chat_template)
-
-    elif len(session_tags) > 0 and len(files) == 0:
-        prompt_text = """
-            **Please first read the document, If you can give answer using only this document, please provide the answer using document content. If the answer is not belong from the document please use your own knowldge to answer the question. Take History as context.**
-
-            When you respond about any questions, you need to think about the company from multiple perspectives, including what the company is doing and what is most important for the company.
-            Each answer must contain: Introduction, Approach, and Conclusion.
-            Approach should be comprehensive and detail every perspective of the given company.
-            In Approach, describe each point in very detailed paragraphs.
-            Always take a breath and think step by step.
-
-            *CLEARLY FOLLOW THE QUESTION INSTRUCTION ABOUT LENGTH OF RESPONSE*
-            {chat_history}
-            """
-
-        for tag in session_tags:
-            tag_id = tag["id"]
-            if tag_id in document_dictionary.keys():
-                prompt_text += document_dictionary[tag_id]
-            else:
-                print(f"Tag: {tag}")
-                prompt_text += get_content_from_tags(tag)
-
-        prompt = ChatPromptTemplate.from_messages(
-            [("system", prompt_text), ("human", "{user_question}")]
-        )
-
-    elif len(session_tags) > 0 and len(files) > 0:
-        prompt_text = """
-            **Please first read the document, If you can give answer using only this document, please provide the answer using document content. If the answer is not belong from the document please use your own knowldge to answer the question. Take History as context.**
-            When you respond about any questions, you need to think about the company from multiple perspectives, including what the company is doing and what is most important for the company.
-            Each answer must contain: Introduction, Approach, and Conclusion.
-            Approach should be comprehensive and detail every perspective of the given company.
-            In Approach, describe each point in very detailed paragraphs.
-            Always take a breath and think step by step.
-
-            *CLEARLY FOLLOW THE QUESTION INSTRUCTION ABOUT LENGTH OF RESPONSE*
-            {chat_history}
-            """
-        print(f"Session Tags: {session_tags}")
-
-        for tag in session_tags:
-            if tag in document_dictionary.keys():
-                prompt_text += document_dictionary[tag]
-            else:
-                prompt_text += get_content_from_tags(f"tags/{tag.displayName}")
-        prompt_text += get_content_from_azure_blob(files)
-
-        prompt = ChatPromptTemplate.from_messages(
-            [("system", prompt_text), ("human", "{user_question}")]
+async def get_tag_contents(session_tags):
+    prompt_assets = PromptAssetStore.getInstance()
+    tag_contents = await asyncio.gather(
+        *(
+            aget_content_from_tags(tag)
+            for tag in session_tags
+            if not prompt_assets.has(tag["id"])
         )
+    )
+    tag_contents = iter(tag_contents)
+    contents = []
+    for tag in session_tags:
+        if prompt_assets.has(tag["id"]):
+            asset = prompt_assets.get(tag["id"])
+            contents.append((tag["displayName"], asset.text, asset.token_count))
+        else:
+            print(f"Tag: {tag}")
+            contents.append((tag["displayName"], next(tag_contents), None))
+    return contents
+
+
+async def get_prompt(model_name, session_tags, files, user_question="", chat_history=None):
+    if model_name == "title":
+        prompt = ChatPromptTemplate.from_messages([("system", title_system_template)])
+
+    elif len(session_tags) == 0 and len(files) == 0:
+        prompt = ChatPromptTemplate.from_template(chat_template)
 
-    elif len(session_tags) == 0 and len(files) > 0:
-        prompt_text = """
-            Please firest read the document, If you can give answer using only this document, please provide the answer using document content. If the answer is not belong from the document please use your own knowldge to answer the question. Take History as context.
+    else:
+        header = document_system_template if len(session_tags) > 0 else file_system_template
+        context_builder = ContextBuilder(model_name, header, user_question, chat_history)
 
-            *CLEARLY FOLLOW THE QUESTION INSTRUCTION ABOUT LENGTH OF RESPONSE*
-            {chat_history}
-            """
+        if len(files) > 0:
+            tag_contents, files_content = await asyncio.gather(
+                get_tag_contents(session_tags),
+                aget_content_from_azure_blob(files),
+            )
+        else:
+            tag_contents = await get_tag_contents(session_tags)
+        for tag_name, content, token_count in tag_contents:
+            context_builder.add_source(f"tag:{tag_name}", content, token_count)
+        if len(files) > 0:
+            context_builder.add_source("files", files_content)
 
-        prompt_text += get_content_from_azure_blob(files)
+        prompt_text = context_builder.build()
 
         prompt = ChatPromptTemplate.from_messages(
             [("system", prompt_text), ("human", "{user_question}")]
         )
 
-    elif model_name == "title":
-
-        prompt_text = """
-            Generate Chat title we see in ChatGPT of 2 to 3 words based on Chat History
-
-            {chat_history}
-            """
-        prompt = ChatPromptTemplate.from_messages([("system", prompt_text)])
-
     return prompt
 
 def clean_response(response):
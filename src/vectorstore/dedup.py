@@ -0,0 +1,193 @@
+import hashlib
+import json
+import re
+from collections import defaultdict
+
+import numpy as np
+from psycopg2 import sql
+
+from src.vectorstore.manifest import COLLECTION_TABLE, EMBEDDING_TABLE
+
+WORD_PATTERN = re.compile(r"\w+")
+SHINGLE_SIZE = 3
+# Below this many words a fingerprint is too noisy to call two chunks near-duplicates.
+SIMHASH_MIN_WORDS = 20
+# Chunks whose 64 bit SimHashes differ in at most this many bits are near-duplicates.
+NEAR_DUPLICATE_MAX_DISTANCE = 3
+# 4 bands of 16 bits: two fingerprints within 3 bits share at least one band exactly.
+SIMHASH_BANDS = 4
+BAND_BITS = 64 // SIMHASH_BANDS
+BIT_POSITIONS = np.arange(64, dtype=np.uint64)
+
+
+def content_hash(text):
+    """Hash of the whitespace-normalized text, for exact duplicates."""
+    return hashlib.sha256(" ".join(text.split()).encode("utf-8")).hexdigest()
+
+
+def simhash(text):
+    """64 bit SimHash over word 3-shingles, or None for chunks too short to fingerprint."""
+    words = WORD_PATTERN.findall(text.lower())
+    if len(words) < SIMHASH_MIN_WORDS:
+        return None
+    shingles = {" ".join(words[i : i + SHINGLE_SIZE]) for i in range(len(words) - SHINGLE_SIZE + 1)}
+    hashes = np.fromiter(
+        (
+            int.from_bytes(hashlib.blake2b(shingle.encode("utf-8"), digest_size=8).digest(), "little")
+            for shingle in shingles
+        ),
+        dtype=np.uint64,
+        count=len(shingles),
+    )
+    bit_counts = ((hashes[:, None] >> BIT_POSITIONS) & np.uint64(1)).sum(axis=0)
+    fingerprint = 0
+    for position in np.nonzero(bit_counts * 2 > len(hashes))[0]:
+        fingerprint |= 1 << int(position)
+    return fingerprint
+
+
+def hamming_distance(a, b):
+    return bin(a ^ b).count("1")
+
+
+def annotate_chunk(split, blob_name):
+    """Adds the dedup fingerprints and the source file list to a chunk's metadata."""
+    fingerprint = simhash(split.page_content)
+    split.metadata["content_hash"] = content_hash(split.page_content)
+    split.metadata["simhash"] = format(fingerprint, "016x") if fingerprint is not None else None
+    split.metadata["source_files"] = [blob_name]
+    return fingerprint
+
+
+class ChunkDedupIndex:
+    """
+    In-memory index of the chunks of a collection by content hash and by
+    SimHash bands, so every new chunk is checked against everything stored
+    so far for an exact or near duplicate.
+    """
+
+    def __init__(self, max_distance=NEAR_DUPLICATE_MAX_DISTANCE):
+        self.max_distance = max_distance
+        self._by_hash = {}
+        self._fingerprints = {}
+        self._bands = [defaultdict(set) for _ in range(SIMHASH_BANDS)]
+
+    def __len__(self):
+        return len(self._fingerprints)
+
+    @staticmethod
+    def _band_values(fingerprint):
+        mask = (1 << BAND_BITS) - 1
+        return [(fingerprint >> (band * BAND_BITS)) & mask for band in range(SIMHASH_BANDS)]
+
+    def find(self, chunk_hash, fingerprint):
+        """Returns the id of a stored duplicate of the chunk, or None."""
+        if chunk_hash in self._by_hash:
+            return self._by_hash[chunk_hash]
+        if fingerprint is None:
+            return None
+        for band, value in enumerate(self._band_values(fingerprint)):
+            for candidate_id in self._bands[band].get(value, ()):
+                candidate = self._fingerprints[candidate_id][1]
+                if hamming_distance(fingerprint, candidate) <= self.max_distance:
+                    return candidate_id
+        return None
+
+    def add(self, chunk_id, chunk_hash, fingerprint):
+        self._by_hash.setdefault(chunk_hash, chunk_id)
+        self._fingerprints[chunk_id] = (chunk_hash, fingerprint)
+        if fingerprint is not None:
+            for band, value in enumerate(self._band_values(fingerprint)):
+                self._bands[band][value].add(chunk_id)
+
+    def remove(self, chunk_id):
+        if chunk_id not in self._fingerprints:
+            return
+        chunk_hash, fingerprint = self._fingerprints.pop(chunk_id)
+        if self._by_hash.get(chunk_hash) == chunk_id:
+            del self._by_hash[chunk_hash]
+        if fingerprint is not None:
+            for band, value in enumerate(self._band_values(fingerprint)):
+                self._bands[band][value].discard(chunk_id)
+
+
+def load_dedup_index(conn, collection_name):
+    """Builds the dedup index from the fingerprints stored in the chunks of a collection."""
+    index = ChunkDedupIndex()
+    with conn.cursor() as cursor:
+        cursor.execute(
+            sql.SQL(
+                """
+                SELECT e.custom_id, e.cmetadata->>'content_hash', e.cmetadata->>'simhash'
+                FROM {embedding} e JOIN {collection} c ON e.collection_id = c.uuid
+                WHERE c.name = %s AND e.cmetadata->>'content_hash' IS NOT NULL
+                """
+            ).format(
+                embedding=sql.Identifier(EMBEDDING_TABLE),
+                collection=sql.Identifier(COLLECTION_TABLE),
+            ),
+            (collection_name,),
+        )
+        for chunk_id, chunk_hash, fingerprint in cursor:
+            index.add(chunk_id, chunk_hash, int(fingerprint, 16) if fingerprint else None)
+    conn.commit()
+    return index
+
+
+def attach_sources(conn, collection_name, attachments):
+    """
+    Adds blob names to the source_files of stored chunks ({custom_id: blob names}).
+    Returns the ids that were found and updated.
+    """
+    if not attachments:
+        return set()
+    updated = set()
+    with conn.cursor() as cursor:
+        cursor.execute(
+            sql.SQL(
+                """
+                SELECT e.uuid, e.custom_id, e.cmetadata::text
+                FROM {embedding} e JOIN {collection} c ON e.collection_id = c.uuid
+                WHERE c.name = %s AND e.custom_id = ANY(%s)
+                """
+            ).format(
+                embedding=sql.Identifier(EMBEDDING_TABLE),
+                collection=sql.Identifier(COLLECTION_TABLE),
+            ),
+            (collection_name, list(attachments)),
+        )
+        for row_uuid, chunk_id, metadata in cursor.fetchall():
+            metadata = json.loads(metadata)
+            sources = metadata.get("source_files") or [metadata.get("file_name")]
+            metadata["source_files"] = sources + sorted(set(attachments[chunk_id]) - set(sources))
+            cursor.execute(
+                sql.SQL("UPDATE {} SET cmetadata = %s WHERE uuid = %s").format(sql.Identifier(EMBEDDING_TABLE)),
+                (json.dumps(metadata), row_uuid),
+            )
+            updated.add(chunk_id)
+    conn.commit()
+    return updated
+
+
+def dedupe_documents(documents, max_distance=NEAR_DUPLICATE_MAX_DISTANCE):
+    """
+    Drops retrieved documents that repeat an earlier one exactly or nearly,
+    keeping the first (best ranked) copy with the source files of both.
+    """
+    index = ChunkDedupIndex(max_distance)
+    kept = []
+    for doc in documents:
+        chunk_hash = content_hash(doc.page_content)
+        fingerprint = simhash(doc.page_content)
+        duplicate = index.find(chunk_hash, fingerprint)
+        if duplicate is None:
+            index.add(len(kept), chunk_hash, fingerprint)
+            kept.append(doc)
+            continue
+        kept_doc = kept[duplicate]
+        sources = kept_doc.metadata.get("source_files") or [kept_doc.metadata.get("file_name")]
+        for source in doc.metadata.get("source_files") or [doc.metadata.get("file_name")]:
+            if source not in sources:
+                sources = sources + [source]
+        kept[duplicate] = kept_doc.copy(update={"metadata": dict(kept_doc.metadata, source_files=sources)})
+    return kept
@@ -0,0 +1,170 @@
+import asyncio
+import hashlib
+import sqlite3
+import threading
+from collections import OrderedDict
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+from utils.constants import Constants
+
+
+class CachedEmbeddings(Embeddings):
+    """
+    Wraps an Embeddings implementation with a bounded in-memory LRU and an
+    optional SQLite table, which keeps the newest sqlite_max_rows vectors
+    and is shared by the worker processes of a pod. Queries and documents
+    share the cache; a batch only sends its (deduplicated) misses to the API,
+    in a single call. The async methods do their SQLite reads and writes in a
+    thread, and a read or write that cannot get the SQLite lock within
+    SQLITE_CACHE_BUSY_TIMEOUT_SECONDS is skipped.
+    """
+
+    def __init__(
+        self,
+        underlying,
+        max_entries=Constants.EMBEDDING_CACHE_MAX_ENTRIES,
+        sqlite_path=Constants.EMBEDDING_CACHE_SQLITE_PATH,
+        sqlite_max_rows=Constants.EMBEDDING_CACHE_SQLITE_MAX_ROWS,
+    ):
+        self.underlying = underlying
+        self.namespace = getattr(underlying, "model", underlying.__class__.__name__)
+        self.max_entries = max_entries
+        self.sqlite_max_rows = sqlite_max_rows
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self._db_lock = threading.Lock()
+        self._stats = {"memory_hits": 0, "sqlite_hits": 0, "misses": 0, "api_calls": 0, "evictions": 0, "sqlite_errors": 0}
+
+        self._db = None
+        if sqlite_path:
+            self._db = sqlite3.connect(sqlite_path, check_same_thread=False)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS embedding_cache (key TEXT PRIMARY KEY, vector BLOB NOT NULL)"
+            )
+            self._db.commit()
+            # Setup above may wait for the other workers; cache reads and writes afterwards must not.
+            self._db.execute(f"PRAGMA busy_timeout = {int(Constants.SQLITE_CACHE_BUSY_TIMEOUT_SECONDS * 1000)}")
+
+    def _key(self, text):
+        return hashlib.sha256(f"{self.namespace}|{text}".encode("utf-8")).hexdigest()
+
+    def _put_memory(self, key, vector):
+        self._memory[key] = vector
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+            self._stats["evictions"] += 1
+
+    def _count_sqlite_error(self, operation, error):
+        with self._lock:
+            self._stats["sqlite_errors"] += 1
+        print(f"Embedding cache {operation} skipped: {error}")
+
+    def _read_sqlite(self, missing_keys):
+        rows = []
+        try:
+            with self._db_lock:
+                for start in range(0, len(missing_keys), 500):
+                    batch = missing_keys[start : start + 500]
+                    rows.extend(
+                        self._db.execute(
+                            f"SELECT key, vector FROM embedding_cache WHERE key IN ({','.join('?' * len(batch))})",
+                            batch,
+                        ).fetchall()
+                    )
+        except sqlite3.Error as e:
+            self._count_sqlite_error("read", e)
+        return rows
+
+    def _lookup(self, texts):
+        """Returns the cached vectors by key and the texts that still need embedding."""
+        keys = [self._key(text) for text in texts]
+        found = {}
+        with self._lock:
+            for key in keys:
+                if key in self._memory:
+                    self._memory.move_to_end(key)
+                    found[key] = self._memory[key]
+                    self._stats["memory_hits"] += 1
+
+        missing_keys = [key for key in dict.fromkeys(keys) if key not in found]
+        if self._db is not None and missing_keys:
+            rows = self._read_sqlite(missing_keys)
+            with self._lock:
+                for key, blob in rows:
+                    vector = np.frombuffer(blob, dtype=np.float32)
+                    found[key] = vector
+                    self._put_memory(key, vector)
+                    self._stats["sqlite_hits"] += 1
+
+        misses = {}
+        for key, text in zip(keys, texts):
+            if key not in found and key not in misses:
+                misses[key] = text
+        return keys, found, misses
+
+    def _store(self, found, misses, vectors):
+        with self._lock:
+            self._stats["misses"] += len(misses)
+            self._stats["api_calls"] += 1
+            rows = []
+            for key, vector in zip(misses, vectors):
+                vector = np.asarray(vector, dtype=np.float32)
+                found[key] = vector
+                self._put_memory(key, vector)
+                rows.append((key, vector.tobytes()))
+        if self._db is None:
+            return
+        try:
+            with self._db_lock:
+                self._db.executemany(
+                    "INSERT OR REPLACE INTO embedding_cache (key, vector) VALUES (?, ?)", rows
+                )
+                # A replaced row gets a new rowid, so the oldest rowids are the least recently written.
+                self._db.execute(
+                    """
+                    DELETE FROM embedding_cache WHERE rowid <= (
+                        SELECT rowid FROM embedding_cache ORDER BY rowid DESC LIMIT 1 OFFSET ?
+                    )
+                    """,
+                    (self.sqlite_max_rows,),
+                )
+                self._db.commit()
+        except sqlite3.Error as e:
+            with self._db_lock:
+                self._db.rollback()
+            self._count_sqlite_error("write", e)
+
+    def embed_documents(self, texts):
+        keys, found, misses = self._lookup(texts)
+        if misses:
+            vectors = self.underlying.embed_documents(list(misses.values()))
+            self._store(found, misses, vectors)
+        return [found[key].tolist() for key in keys]
+
+    def embed_query(self, text):
+        return self.embed_documents([text])[0]
+
+    async def aembed_documents(self, texts):
+        if self._db is None:
+            keys, found, misses = self._lookup(texts)
+        else:
+            keys, found, misses = await asyncio.to_thread(self._lookup, texts)
+        if misses:
+            vectors = await self.underlying.aembed_documents(list(misses.values()))
+            await asyncio.to_thread(self._store, found, misses, vectors)
+        return [found[key].tolist() for key in keys]
+
+    async def aembed_query(self, text):
+        return (await self.aembed_documents([text]))[0]
+
+    def get_stats(self):
+        with self._lock:
+            stats = dict(self._stats)
+            stats["memory_entries"] = len(self._memory)
+        lookups = stats["memory_hits"] + stats["sqlite_hits"] + stats["misses"]
+        stats["hit_rate"] = (stats["memory_hits"] + stats["sqlite_hits"]) / lookups if lookups else 0.0
+        return stats
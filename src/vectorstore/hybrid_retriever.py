@@ -0,0 +1,115 @@
+import asyncio
+import json
+from typing import Any
+
+import sqlalchemy
+from langchain_core.documents import Document
+from langchain_core.retrievers import BaseRetriever
+
+from src.vectorstore.bulk_loader import format_vector
+from utils.constants import Constants
+
+# Vector and full text candidates ranked separately, then fused with
+# reciprocal rank fusion: score = sum over both lists of 1 / (rrf_k + rank).
+# A chunk only takes part when it is relevant on its own: a vector hit within
+# the cosine distance cutoff, or a text hit with a non-zero rank, so an
+# off-topic question gets no context rather than the k nearest chunks.
+# The config and collection id are inlined so the partial HNSW and GIN indexes match.
+HYBRID_SEARCH_SQL = """
+WITH vector_hits AS (
+    SELECT uuid, row_number() OVER (ORDER BY distance) AS rank
+    FROM (
+        SELECT uuid, embedding <=> CAST(:embedding AS vector) AS distance
+        FROM langchain_pg_embedding
+        WHERE collection_id = '{collection_id}'
+        ORDER BY distance
+        LIMIT :candidates
+    ) nearest
+    WHERE distance <= :max_distance
+),
+text_hits AS (
+    SELECT uuid, row_number() OVER (ORDER BY text_rank DESC) AS rank
+    FROM (
+        SELECT uuid, ts_rank_cd(to_tsvector('{config}'::regconfig, document), query) AS text_rank
+        FROM langchain_pg_embedding, websearch_to_tsquery('{config}'::regconfig, :question) query
+        WHERE collection_id = '{collection_id}'
+        AND to_tsvector('{config}'::regconfig, document) @@ query
+        ORDER BY text_rank DESC
+        LIMIT :candidates
+    ) matching
+    WHERE text_rank > 0
+),
+fused AS (
+    SELECT uuid, sum(1.0 / (:rrf_k + rank)) AS score
+    FROM (SELECT * FROM vector_hits UNION ALL SELECT * FROM text_hits) hits
+    GROUP BY uuid
+)
+SELECT e.document, e.cmetadata::text, fused.score
+FROM fused JOIN langchain_pg_embedding e ON e.uuid = fused.uuid
+ORDER BY fused.score DESC
+LIMIT :k
+"""
+
+
+def get_collection_id(engine, collection_name):
+    with engine.connect() as connection:
+        collection_id = connection.execute(
+            sqlalchemy.text("SELECT uuid FROM langchain_pg_collection WHERE name = :name LIMIT 1"),
+            {"name": collection_name},
+        ).scalar()
+    if collection_id is None:
+        raise ValueError(f"Collection {collection_name} not found")
+    return str(collection_id)
+
+
+class HybridRetriever(BaseRetriever):
+    """
+    Retrieves chunks of a PGVector collection by fusing a vector search and a
+    Postgres full text search with reciprocal rank fusion, in one query.
+    Exact terms (client names, acronyms) that embeddings blur are caught by
+    the text side, so no LLM generated query variants are needed. Vector hits
+    under score_threshold (cosine similarity) only count through the text side.
+    """
+
+    engine: Any
+    embeddings: Any
+    collection_name: str
+    k: int = Constants.HYBRID_TOP_K
+    candidates: int = Constants.HYBRID_CANDIDATES
+    rrf_k: int = Constants.HYBRID_RRF_K
+    score_threshold: float = Constants.NH_QA_SCORE_THRESHOLD
+    text_search_config: str = Constants.TEXT_SEARCH_CONFIG
+    collection_id: str = ""
+
+    def _resolve_collection_id(self):
+        if not self.collection_id:
+            self.collection_id = get_collection_id(self.engine, self.collection_name)
+        return self.collection_id
+
+    def _search(self, question, query_vector):
+        statement = sqlalchemy.text(
+            HYBRID_SEARCH_SQL.format(
+                collection_id=self._resolve_collection_id(),
+                config=self.text_search_config.replace("'", ""),
+            )
+        )
+        with self.engine.connect() as connection:
+            rows = connection.execute(
+                statement,
+                {
+                    "embedding": format_vector(query_vector),
+                    "question": question,
+                    "candidates": self.candidates,
+                    "rrf_k": self.rrf_k,
+                    "max_distance": 1 - self.score_threshold,
+                    "k": self.k,
+                },
+            ).fetchall()
+        return [Document(page_content=document, metadata=json.loads(metadata or "{}")) for document, metadata, _ in rows]
+
+    def _get_relevant_documents(self, query, *, run_manager):
+        return self._search(query, self.embeddings.embed_query(query))
+
+    async def _aget_relevant_documents(self, query, *, run_manager):
+        query_vector = await self.embeddings.aembed_query(query)
+        return await asyncio.to_thread(self._search, query, query_vector)
@@ -0,0 +1,221 @@
+import math
+import re
+from contextlib import contextmanager
+
+from psycopg2 import sql
+
+from src.vectorstore.manifest import COLLECTION_TABLE, EMBEDDING_TABLE
+from utils.constants import Constants
+
+INDEX_METHODS = ("hnsw", "ivfflat")
+
+
+def search_connect_args(ef_search=Constants.HNSW_EF_SEARCH, probes=Constants.IVFFLAT_PROBES):
+    """libpq connect args that set the ANN search knobs for every session of an engine."""
+    return {"options": f"-c hnsw.ef_search={int(ef_search)} -c ivfflat.probes={int(probes)}"}
+
+
+def ivfflat_lists(row_count):
+    """pgvector's starting point: rows / 1000 lists up to 1M rows, sqrt(rows) above."""
+    if row_count <= 1_000_000:
+        return max(1, row_count // 1000)
+    return int(math.sqrt(row_count))
+
+
+@contextmanager
+def search_settings(conn, ef_search=None, probes=None):
+    """Overrides hnsw.ef_search / ivfflat.probes for the queries of one transaction."""
+    with conn.cursor() as cursor:
+        if ef_search is not None:
+            cursor.execute("SET LOCAL hnsw.ef_search = %s", (int(ef_search),))
+        if probes is not None:
+            cursor.execute("SET LOCAL ivfflat.probes = %s", (int(probes),))
+        yield cursor
+
+
+class VectorIndexManager:
+    """
+    Creates, rebuilds and drops an HNSW or IVFFlat index per collection.
+    The index is partial (WHERE collection_id = <uuid>) so each collection
+    gets its own graph or lists, which the planner uses because PGVector
+    always filters on collection_id. Both index types need a fixed
+    dimension: until the embedding column has been narrowed to vector(N) by
+    the one-off migrate_dimension(), only the full text index is created.
+    """
+
+    def __init__(self, conn, collection_name, dimensions=Constants.VECTOR_DIMENSIONS):
+        self.conn = conn
+        self.collection_name = collection_name
+        self.dimensions = dimensions
+
+    def collection_id(self):
+        with self.conn.cursor() as cursor:
+            cursor.execute(
+                sql.SQL("SELECT uuid FROM {} WHERE name = %s LIMIT 1").format(
+                    sql.Identifier(COLLECTION_TABLE)
+                ),
+                (self.collection_name,),
+            )
+            row = cursor.fetchone()
+        if row is None:
+            raise ValueError(f"Collection {self.collection_name} not found")
+        return str(row[0])
+
+    def index_name(self, method):
+        name = re.sub(r"\W", "_", self.collection_name.lower())
+        return f"{EMBEDDING_TABLE}_{name}_{method}_idx"[:63]
+
+    def _row_count(self, collection_id):
+        with self.conn.cursor() as cursor:
+            cursor.execute(
+                sql.SQL("SELECT count(*) FROM {} WHERE collection_id = %s").format(
+                    sql.Identifier(EMBEDDING_TABLE)
+                ),
+                (collection_id,),
+            )
+            return cursor.fetchone()[0]
+
+    def _execute_autocommit(self, statement, params=None):
+        # CREATE / REINDEX ... CONCURRENTLY cannot run inside a transaction block.
+        self.conn.commit()
+        autocommit = self.conn.autocommit
+        self.conn.autocommit = True
+        try:
+            with self.conn.cursor() as cursor:
+                cursor.execute(statement, params)
+        finally:
+            self.conn.autocommit = autocommit
+
+    def column_type(self):
+        with self.conn.cursor() as cursor:
+            cursor.execute(
+                """
+                SELECT format_type(atttypid, atttypmod) FROM pg_attribute
+                WHERE attrelid = %s::regclass AND attname = 'embedding'
+                """,
+                (EMBEDDING_TABLE,),
+            )
+            return cursor.fetchone()[0]
+
+    def has_dimension(self):
+        return self.column_type() == f"vector({self.dimensions})"
+
+    def migrate_dimension(self):
+        """
+        One-off migration narrowing the untyped embedding column to
+        vector(dimensions). The ALTER TABLE rewrites the table every collection
+        shares under an ACCESS EXCLUSIVE lock, blocking all searches until it is
+        done, and fails if any collection holds another dimension.
+        """
+        column_type = self.column_type()
+        if column_type == f"vector({self.dimensions})":
+            return
+        if column_type != "vector":
+            raise ValueError(f"Embedding column is {column_type}, expected vector({self.dimensions})")
+        print(f"Altering {EMBEDDING_TABLE}.embedding to vector({self.dimensions})")
+        with self.conn.cursor() as cursor:
+            cursor.execute(
+                sql.SQL("ALTER TABLE {} ALTER COLUMN embedding TYPE vector({})").format(
+                    sql.Identifier(EMBEDDING_TABLE), sql.Literal(self.dimensions)
+                )
+            )
+        self.conn.commit()
+
+    def text_index_name(self):
+        name = re.sub(r"\W", "_", self.collection_name.lower())
+        return f"{EMBEDDING_TABLE}_{name}_fts_idx"[:63]
+
+    def list_indexes(self):
+        index_names = [self.index_name(method) for method in INDEX_METHODS] + [self.text_index_name()]
+        with self.conn.cursor() as cursor:
+            cursor.execute(
+                "SELECT indexname, indexdef FROM pg_indexes WHERE tablename = %s AND indexname = ANY(%s)",
+                (EMBEDDING_TABLE, index_names),
+            )
+            return dict(cursor.fetchall())
+
+    def create_index(
+        self,
+        method=Constants.VECTOR_INDEX_METHOD,
+        m=Constants.HNSW_M,
+        ef_construction=Constants.HNSW_EF_CONSTRUCTION,
+        lists=None,
+    ):
+        if method not in INDEX_METHODS:
+            raise ValueError(f"Unknown index method {method}, expected one of {INDEX_METHODS}")
+        if not self.has_dimension():
+            raise ValueError(
+                f"{EMBEDDING_TABLE}.embedding is {self.column_type()}; run migrate_dimension() before indexing it"
+            )
+        collection_id = self.collection_id()
+        if method == "hnsw":
+            options = sql.SQL("m = {}, ef_construction = {}").format(
+                sql.Literal(int(m)), sql.Literal(int(ef_construction))
+            )
+        else:
+            # IVFFlat clusters the rows present at build time, so build it after loading.
+            if lists is None:
+                lists = ivfflat_lists(self._row_count(collection_id))
+            options = sql.SQL("lists = {}").format(sql.Literal(int(lists)))
+
+        print(f"Creating {method} index {self.index_name(method)} ({options.as_string(self.conn)})")
+        self._execute_autocommit(
+            sql.SQL(
+                """
+                CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {table}
+                USING {method} (embedding vector_cosine_ops) WITH ({options})
+                WHERE collection_id = {collection_id}
+                """
+            ).format(
+                name=sql.Identifier(self.index_name(method)),
+                table=sql.Identifier(EMBEDDING_TABLE),
+                method=sql.SQL(method),
+                options=options,
+                collection_id=sql.Literal(collection_id),
+            )
+        )
+
+    def create_text_index(self, config=Constants.TEXT_SEARCH_CONFIG):
+        """GIN index over to_tsvector(config, document) for the full text side of hybrid search."""
+        print(f"Creating full text index {self.text_index_name()} ({config})")
+        self._execute_autocommit(
+            sql.SQL(
+                """
+                CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {table}
+                USING gin (to_tsvector({config}::regconfig, document))
+                WHERE collection_id = {collection_id}
+                """
+            ).format(
+                name=sql.Identifier(self.text_index_name()),
+                table=sql.Identifier(EMBEDDING_TABLE),
+                config=sql.Literal(config),
+                collection_id=sql.Literal(self.collection_id()),
+            )
+        )
+
+    def ensure_index(self, method=Constants.VECTOR_INDEX_METHOD, migrate_dimension=False):
+        if migrate_dimension:
+            self.migrate_dimension()
+        indexes = self.list_indexes()
+        if self.index_name(method) not in indexes:
+            if self.has_dimension():
+                self.create_index(method)
+            else:
+                print(
+                    f"Skipping the {method} index: {EMBEDDING_TABLE}.embedding is not vector({self.dimensions}) "
+                    "yet, run one ingestion with VECTOR_MIGRATE_DIMENSION=true"
+                )
+        if self.text_index_name() not in indexes:
+            self.create_text_index()
+
+    def rebuild_index(self, method=Constants.VECTOR_INDEX_METHOD):
+        """Rebuilds without blocking searches; IVFFlat needs this after large loads to recluster."""
+        print(f"Rebuilding index {self.index_name(method)}")
+        self._execute_autocommit(
+            sql.SQL("REINDEX INDEX CONCURRENTLY {}").format(sql.Identifier(self.index_name(method)))
+        )
+
+    def drop_index(self, method=Constants.VECTOR_INDEX_METHOD):
+        self._execute_autocommit(
+            sql.SQL("DROP INDEX CONCURRENTLY IF EXISTS {}").format(sql.Identifier(self.index_name(method)))
+        )
@@ -0,0 +1,139 @@
+import json
+
+from psycopg2 import sql
+
+EMBEDDING_TABLE = "langchain_pg_embedding"
+COLLECTION_TABLE = "langchain_pg_collection"
+STATUS_PENDING = "pending"
+STATUS_DONE = "done"
+
+
+class ManifestEntry:
+    def __init__(self, blob_name, etag, content_hash, chunk_count, status):
+        self.blob_name = blob_name
+        self.etag = etag
+        self.content_hash = content_hash
+        self.chunk_count = chunk_count
+        self.status = status
+
+
+class IngestionManifest:
+    """
+    One row per ingested blob with its ETag, content hash and chunk count.
+    A blob is marked pending before its chunks are written and done after,
+    so a crashed run leaves the unfinished blob pending and the next run
+    redoes only that blob.
+    """
+
+    def __init__(self, conn, collection_name):
+        self.conn = conn
+        self.collection_name = collection_name
+
+    def ensure_table(self):
+        with self.conn.cursor() as cursor:
+            cursor.execute(
+                """
+                CREATE TABLE IF NOT EXISTS ingestion_manifest (
+                    collection_name TEXT NOT NULL,
+                    blob_name TEXT NOT NULL,
+                    etag TEXT,
+                    content_hash TEXT,
+                    chunk_count INTEGER NOT NULL DEFAULT 0,
+                    status TEXT NOT NULL,
+                    updated_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+                    PRIMARY KEY (collection_name, blob_name)
+                )
+                """
+            )
+        self.conn.commit()
+
+    def load(self):
+        with self.conn.cursor() as cursor:
+            cursor.execute(
+                """
+                SELECT blob_name, etag, content_hash, chunk_count, status
+                FROM ingestion_manifest WHERE collection_name = %s
+                """,
+                (self.collection_name,),
+            )
+            return {row[0]: ManifestEntry(*row) for row in cursor.fetchall()}
+
+    def _upsert(self, blob_name, etag, content_hash, chunk_count, status):
+        with self.conn.cursor() as cursor:
+            cursor.execute(
+                """
+                INSERT INTO ingestion_manifest
+                    (collection_name, blob_name, etag, content_hash, chunk_count, status, updated_at)
+                VALUES (%s, %s, %s, %s, %s, %s, now())
+                ON CONFLICT (collection_name, blob_name) DO UPDATE SET
+                    etag = EXCLUDED.etag,
+                    content_hash = EXCLUDED.content_hash,
+                    chunk_count = EXCLUDED.chunk_count,
+                    status = EXCLUDED.status,
+                    updated_at = now()
+                """,
+                (self.collection_name, blob_name, etag, content_hash, chunk_count, status),
+            )
+        self.conn.commit()
+
+    def mark_pending(self, blob_name, etag):
+        self._upsert(blob_name, etag, None, 0, STATUS_PENDING)
+
+    def mark_done(self, blob_name, etag, content_hash, chunk_count):
+        self._upsert(blob_name, etag, content_hash, chunk_count, STATUS_DONE)
+
+    def remove(self, blob_name):
+        with self.conn.cursor() as cursor:
+            cursor.execute(
+                "DELETE FROM ingestion_manifest WHERE collection_name = %s AND blob_name = %s",
+                (self.collection_name, blob_name),
+            )
+        self.conn.commit()
+
+
+def delete_blob_chunks(conn, collection_name, blob_name):
+    """
+    Removes a blob from the PGVector collection: its chunks are deleted unless
+    another blob shares them, in which case the blob is only dropped from their
+    source_files. Returns the custom ids of the deleted chunks.
+    """
+    deleted, deleted_uuids = [], []
+    with conn.cursor() as cursor:
+        cursor.execute(
+            sql.SQL(
+                """
+                SELECT e.uuid, e.custom_id, e.cmetadata::text
+                FROM {embedding} e JOIN {collection} c ON e.collection_id = c.uuid
+                WHERE c.name = %s
+                AND (e.cmetadata->>'file_name' = %s OR e.cmetadata::jsonb->'source_files' ? %s)
+                """
+            ).format(
+                embedding=sql.Identifier(EMBEDDING_TABLE),
+                collection=sql.Identifier(COLLECTION_TABLE),
+            ),
+            (collection_name, blob_name, blob_name),
+        )
+        for row_uuid, custom_id, metadata in cursor.fetchall():
+            metadata = json.loads(metadata)
+            sources = metadata.get("source_files") or [metadata.get("file_name")]
+            remaining = [source for source in sources if source != blob_name]
+            if remaining:
+                metadata["source_files"] = remaining
+                if metadata.get("file_name") == blob_name:
+                    metadata["file_name"] = remaining[0]
+                cursor.execute(
+                    sql.SQL("UPDATE {} SET cmetadata = %s WHERE uuid = %s").format(
+                        sql.Identifier(EMBEDDING_TABLE)
+                    ),
+                    (json.dumps(metadata), row_uuid),
+                )
+            else:
+                deleted_uuids.append(str(row_uuid))
+                deleted.append(custom_id)
+        if deleted_uuids:
+            cursor.execute(
+                sql.SQL("DELETE FROM {} WHERE uuid = ANY(%s::uuid[])").format(sql.Identifier(EMBEDDING_TABLE)),
+                (deleted_uuids,),
+            )
+    conn.commit()
+    return deleted
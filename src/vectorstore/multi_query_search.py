@@ -0,0 +1,81 @@
+import asyncio
+import json
+
+import sqlalchemy
+from langchain_core.documents import Document
+
+from src.vectorstore.bulk_loader import format_vector
+from src.vectorstore.hybrid_retriever import get_collection_id
+from utils.constants import Constants
+
+# Every query vector gets its own index-backed top-k through LATERAL, in one round trip.
+# The collection id is inlined so the partial ANN index of the collection matches.
+MULTI_QUERY_SEARCH_SQL = """
+SELECT hit.custom_id, hit.document, hit.cmetadata::text, 1 - hit.distance AS score
+FROM unnest(CAST(:embeddings AS vector[])) AS query(embedding)
+CROSS JOIN LATERAL (
+    SELECT e.custom_id, e.document, e.cmetadata, e.embedding <=> query.embedding AS distance
+    FROM langchain_pg_embedding e
+    WHERE e.collection_id = '{collection_id}'
+    ORDER BY e.embedding <=> query.embedding
+    LIMIT :k
+) hit
+"""
+
+
+class MultiQueryVectorSearch:
+    """
+    Searches a PGVector collection for several sub-queries at once: the
+    query vectors are embedded in one batch and searched in one SQL
+    statement, so latency stays flat as the number of sub-queries grows.
+    Hits under the score threshold are dropped, and a chunk found by several
+    sub-queries is returned once, with its best score, best first.
+    """
+
+    def __init__(
+        self,
+        engine,
+        embeddings,
+        collection_name,
+        k=Constants.NH_QA_TOP_K_PER_QUERY,
+        score_threshold=Constants.NH_QA_SCORE_THRESHOLD,
+    ):
+        self.engine = engine
+        self.embeddings = embeddings
+        self.collection_name = collection_name
+        self.k = k
+        self.score_threshold = score_threshold
+        self._collection_id = None
+
+    def _search_vectors(self, query_vectors):
+        if self._collection_id is None:
+            self._collection_id = get_collection_id(self.engine, self.collection_name)
+        statement = sqlalchemy.text(MULTI_QUERY_SEARCH_SQL.format(collection_id=self._collection_id))
+        with self.engine.connect() as connection:
+            rows = connection.execute(
+                statement,
+                {"embeddings": [format_vector(vector) for vector in query_vectors], "k": self.k},
+            ).fetchall()
+
+        best = {}
+        for custom_id, document, metadata, score in rows:
+            if score < self.score_threshold:
+                continue
+            if custom_id not in best or score > best[custom_id][0]:
+                best[custom_id] = (score, document, metadata)
+        ranked = sorted(best.values(), key=lambda hit: hit[0], reverse=True)
+        return [
+            Document(page_content=document, metadata=json.loads(metadata or "{}"))
+            for _, document, metadata in ranked
+        ]
+
+    def search(self, queries):
+        if not queries:
+            return []
+        return self._search_vectors(self.embeddings.embed_documents(queries))
+
+    async def asearch(self, queries):
+        if not queries:
+            return []
+        query_vectors = await self.embeddings.aembed_documents(queries)
+        return await asyncio.to_thread(self._search_vectors, query_vectors)
@@ -0,0 +1,400 @@
+import asyncio
+import hashlib
+import time
+import uuid
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+
+from src.vectorstore.dedup import annotate_chunk, attach_sources
+from src.vectorstore.manifest import STATUS_DONE, delete_blob_chunks
+from src.vectorstore.splitting import (
+    RANGE_BYTES,
+    STREAMING_THRESHOLD_BYTES,
+    StreamingDecoder,
+    StreamingSplitter,
+    split_documents_from_bytes,
+)
+from utils.constants import Constants
+from utils.tokens import count_tokens
+
+
+def split_and_count(blob_name, raw_data):
+    """Runs in the split process pool: returns the chunks of a blob, their token counts and SimHashes."""
+    splits = split_documents_from_bytes(blob_name, raw_data)
+    fingerprints = [annotate_chunk(split, blob_name) for split in splits]
+    return splits, [count_tokens(split.page_content) for split in splits], fingerprints
+
+
+def split_range(blob_name, decoder, splitter, data, final):
+    """Runs in a thread for streamed blobs: decodes one range and returns the chunks it completed."""
+    text = decoder.decode(data, final)
+    splitter.encoding = decoder.encoding
+    splits = splitter.feed(text)
+    if final:
+        splits += splitter.finish()
+    fingerprints = [annotate_chunk(split, blob_name) for split in splits]
+    return splits, [count_tokens(split.page_content) for split in splits], fingerprints
+
+
+class StageStats:
+    def __init__(self, name):
+        self.name = name
+        self.items = 0
+        self.chunks = 0
+        self.tokens = 0
+        self.bytes = 0
+        self.busy_seconds = 0.0
+
+    def record(self, seconds, items=1, chunks=0, tokens=0, size=0):
+        self.items += items
+        self.chunks += chunks
+        self.tokens += tokens
+        self.bytes += size
+        self.busy_seconds += seconds
+
+    def report(self, wall_seconds):
+        return (
+            f"{self.name:<9} items={self.items:<6} chunks={self.chunks:<7} "
+            f"busy={self.busy_seconds:8.1f}s "
+            f"chunks/s={self.chunks / wall_seconds if wall_seconds else 0:8.1f} "
+            f"tokens/s={self.tokens / wall_seconds if wall_seconds else 0:10.1f} "
+            f"MB/s={self.bytes / 1e6 / wall_seconds if wall_seconds else 0:6.2f}"
+        )
+
+
+class IngestionPipeline:
+    """
+    Streams blobs through four stages connected by bounded queues:
+    concurrent async downloads -> decode and split in a process pool ->
+    embedding in batches packed across blobs -> bulk inserts into Postgres.
+    A blob is marked done in the manifest once its last chunk is inserted;
+    a blob that fails anywhere stays pending and is retried by the next run.
+
+    With a dedup_index, a chunk that duplicates (exactly or nearly) one
+    already stored or queued is not embedded again: the blob is added to
+    the source_files of the stored chunk once all inserts are through.
+    """
+
+    def __init__(
+        self,
+        conn,
+        manifest,
+        vectorstore,
+        embeddings,
+        async_container_client,
+        collection_name,
+        dedup_index=None,
+    ):
+        self.conn = conn
+        self.manifest = manifest
+        self.vectorstore = vectorstore
+        self.embeddings = embeddings
+        self.async_container_client = async_container_client
+        self.collection_name = collection_name
+        self.dedup_index = dedup_index
+        self.stats = {
+            name: StageStats(name) for name in ["download", "split", "embed", "insert"]
+        }
+        self._manifest_lock = asyncio.Lock()
+        self._remaining_chunks = {}
+        self._blob_done_args = {}
+        self._failed_blobs = set()
+        self._attachments = defaultdict(set)
+        self._deferred_done = set()
+        self.duplicate_chunks = 0
+
+    async def _manifest_call(self, function, *args):
+        # The manifest shares one psycopg2 connection, so its calls are serialized.
+        async with self._manifest_lock:
+            return await asyncio.to_thread(function, *args)
+
+    async def _finish_blob(self, blob_name):
+        if blob_name in self._failed_blobs:
+            return
+        if any(blob_name in blob_names for blob_names in self._attachments.values()):
+            # Done only once its shared chunks list it as a source.
+            self._deferred_done.add(blob_name)
+            return
+        await self._manifest_call(self.manifest.mark_done, blob_name, *self._blob_done_args.pop(blob_name))
+
+    def _drop_duplicates(self, blob_name, splits, token_counts, fingerprints):
+        """Returns the (split, tokens, custom_id) items that are not duplicates of stored chunks."""
+        items = []
+        for split, tokens, fingerprint in zip(splits, token_counts, fingerprints):
+            if self.dedup_index is not None:
+                duplicate_id = self.dedup_index.find(split.metadata["content_hash"], fingerprint)
+                if duplicate_id is not None:
+                    self._attachments[duplicate_id].add(blob_name)
+                    self.duplicate_chunks += 1
+                    continue
+            custom_id = str(uuid.uuid4())
+            if self.dedup_index is not None:
+                self.dedup_index.add(custom_id, split.metadata["content_hash"], fingerprint)
+            items.append((split, tokens, custom_id))
+        return items
+
+    async def _reset_blob(self, blob_properties):
+        """Marks a blob pending and deletes its stored chunks before its new chunks are queued."""
+        blob_name = blob_properties.name
+        await self._manifest_call(self.manifest.mark_pending, blob_name, blob_properties.etag)
+        deleted_ids = await self._manifest_call(
+            delete_blob_chunks, self.conn, self.collection_name, blob_name
+        )
+        if self.dedup_index is not None:
+            for deleted_id in deleted_ids:
+                self.dedup_index.remove(deleted_id)
+                # Blobs that matched a chunk which is now gone are redone next run.
+                self._failed_blobs.update(self._attachments.pop(deleted_id, ()))
+
+    async def _stream_blob(self, blob_properties, split_results):
+        """
+        Reads a large blob in RANGE_BYTES ranges and queues its chunks as they
+        are split, so neither its bytes nor its text are ever held whole.
+        Its content hash is only known at the end, so unlike small blobs an
+        unchanged hash does not skip the work.
+        """
+        blob_name = blob_properties.name
+        await self._reset_blob(blob_properties)
+        # One extra count holds the blob open until its last range is split.
+        self._remaining_chunks[blob_name] = 1
+        hasher = hashlib.sha256()
+        decoder, splitter, chunk_count = None, None, 0
+        try:
+            blob_client = self.async_container_client.get_blob_client(blob_name)
+            for offset in range(0, blob_properties.size, RANGE_BYTES):
+                started = time.perf_counter()
+                downloader = await blob_client.download_blob(offset=offset, length=RANGE_BYTES)
+                data = await downloader.readall()
+                self.stats["download"].record(time.perf_counter() - started, items=0, size=len(data))
+                hasher.update(data)
+                if decoder is None:
+                    decoder = StreamingDecoder(data)
+                    splitter = StreamingSplitter(blob_name, decoder.encoding)
+
+                started = time.perf_counter()
+                final = offset + RANGE_BYTES >= blob_properties.size
+                splits, token_counts, fingerprints = await asyncio.to_thread(
+                    split_range, blob_name, decoder, splitter, data, final
+                )
+                self.stats["split"].record(
+                    time.perf_counter() - started, items=0, chunks=len(splits), tokens=sum(token_counts)
+                )
+                chunk_count += len(splits)
+                for item in self._drop_duplicates(blob_name, splits, token_counts, fingerprints):
+                    self._remaining_chunks[blob_name] += 1
+                    await split_results.put(item)
+        except Exception as e:
+            print(f"Streaming {blob_name} failed: {e}")
+            self._failed_blobs.add(blob_name)
+
+        self.stats["download"].record(0, items=1)
+        self.stats["split"].record(0, items=1)
+        self._blob_done_args[blob_name] = (blob_properties.etag, hasher.hexdigest(), chunk_count)
+        self._remaining_chunks[blob_name] -= 1
+        if self._remaining_chunks[blob_name] == 0:
+            del self._remaining_chunks[blob_name]
+            await self._finish_blob(blob_name)
+
+    async def _download_worker(self, jobs, downloaded):
+        while not jobs.empty():
+            blob_properties, entry = jobs.get_nowait()
+            if getattr(blob_properties, "size", 0) > STREAMING_THRESHOLD_BYTES:
+                # Left to the split stage, which streams it in ranges.
+                await downloaded.put((blob_properties, entry, None))
+                continue
+            started = time.perf_counter()
+            try:
+                blob_client = self.async_container_client.get_blob_client(blob_properties.name)
+                downloader = await blob_client.download_blob()
+                raw_data = await downloader.readall()
+            except Exception as e:
+                print(f"Download of {blob_properties.name} failed: {e}")
+                self._failed_blobs.add(blob_properties.name)
+                continue
+            self.stats["download"].record(time.perf_counter() - started, size=len(raw_data))
+            await downloaded.put((blob_properties, entry, raw_data))
+
+    async def _split_worker(self, executor, downloaded, split_results):
+        loop = asyncio.get_running_loop()
+        while True:
+            item = await downloaded.get()
+            if item is None:
+                return
+            blob_properties, entry, raw_data = item
+            if raw_data is None:
+                await self._stream_blob(blob_properties, split_results)
+                continue
+            blob_name = blob_properties.name
+            content_hash = hashlib.sha256(raw_data).hexdigest()
+
+            if entry and entry.status == STATUS_DONE and entry.content_hash == content_hash:
+                await self._manifest_call(
+                    self.manifest.mark_done, blob_name, blob_properties.etag, content_hash, entry.chunk_count
+                )
+                continue
+
+            started = time.perf_counter()
+            try:
+                splits, token_counts, fingerprints = await loop.run_in_executor(
+                    executor, split_and_count, blob_name, raw_data
+                )
+            except Exception as e:
+                print(f"Splitting {blob_name} failed: {e}")
+                continue
+            self.stats["split"].record(
+                time.perf_counter() - started, chunks=len(splits), tokens=sum(token_counts)
+            )
+
+            await self._reset_blob(blob_properties)
+            self._blob_done_args[blob_name] = (blob_properties.etag, content_hash, len(splits))
+            items = self._drop_duplicates(blob_name, splits, token_counts, fingerprints)
+            if not items:
+                await self._finish_blob(blob_name)
+                continue
+            self._remaining_chunks[blob_name] = len(items)
+            for item in items:
+                await split_results.put(item)
+
+    async def _batcher(self, split_results, batches, split_workers):
+        """Packs chunks from many blobs into batches of up to INGEST_EMBED_BATCH_SIZE."""
+        batch = []
+        finished_workers = 0
+        while finished_workers < split_workers:
+            item = await split_results.get()
+            if item is None:
+                finished_workers += 1
+                continue
+            batch.append(item)
+            if len(batch) >= Constants.INGEST_EMBED_BATCH_SIZE:
+                await batches.put(batch)
+                batch = []
+        if batch:
+            await batches.put(batch)
+
+    async def _embed_worker(self, batches, embedded):
+        while True:
+            batch = await batches.get()
+            if batch is None:
+                return
+            started = time.perf_counter()
+            try:
+                vectors = await self.embeddings.aembed_documents(
+                    [split.page_content for split, _, _ in batch]
+                )
+            except Exception as e:
+                print(f"Embedding a batch of {len(batch)} chunks failed: {e}")
+                self._failed_blobs.update(split.metadata["file_name"] for split, _, _ in batch)
+                continue
+            self.stats["embed"].record(
+                time.perf_counter() - started,
+                chunks=len(batch),
+                tokens=sum(tokens for _, tokens, _ in batch),
+            )
+            await embedded.put((batch, vectors))
+
+    async def _insert_worker(self, embedded):
+        while True:
+            item = await embedded.get()
+            if item is None:
+                return
+            batch, vectors = item
+            started = time.perf_counter()
+            try:
+                await asyncio.to_thread(
+                    self.vectorstore.add_embeddings,
+                    texts=[split.page_content for split, _, _ in batch],
+                    embeddings=vectors,
+                    metadatas=[split.metadata for split, _, _ in batch],
+                    ids=[custom_id for _, _, custom_id in batch],
+                )
+            except Exception as e:
+                print(f"Inserting a batch of {len(batch)} chunks failed: {e}")
+                self._failed_blobs.update(split.metadata["file_name"] for split, _, _ in batch)
+                continue
+            self.stats["insert"].record(
+                time.perf_counter() - started,
+                chunks=len(batch),
+                tokens=sum(tokens for _, tokens, _ in batch),
+            )
+
+            for split, _, _ in batch:
+                blob_name = split.metadata["file_name"]
+                self._remaining_chunks[blob_name] -= 1
+                if self._remaining_chunks[blob_name] == 0:
+                    del self._remaining_chunks[blob_name]
+                    await self._finish_blob(blob_name)
+
+    async def _apply_attachments(self):
+        """Lists the blobs whose chunks were duplicates as sources of the stored chunks."""
+        attachments = {
+            custom_id: blob_names - self._failed_blobs
+            for custom_id, blob_names in self._attachments.items()
+            if blob_names - self._failed_blobs
+        }
+        try:
+            updated = await self._manifest_call(attach_sources, self.conn, self.collection_name, attachments)
+        except Exception as e:
+            print(f"Attaching duplicate chunk sources failed: {e}")
+            updated = set()
+        for custom_id, blob_names in attachments.items():
+            if custom_id not in updated:
+                # The stored copy never made it in (its blob failed), so redo these blobs next run.
+                self._failed_blobs.update(blob_names)
+        self._attachments.clear()
+        for blob_name in sorted(self._deferred_done - self._failed_blobs):
+            await self._finish_blob(blob_name)
+
+    async def run(self, blob_jobs):
+        """Ingests (blob_properties, manifest_entry) jobs and prints the per stage throughput."""
+        started = time.perf_counter()
+        jobs = asyncio.Queue()
+        for job in blob_jobs:
+            jobs.put_nowait(job)
+        downloaded = asyncio.Queue(maxsize=Constants.INGEST_QUEUE_SIZE)
+        split_results = asyncio.Queue(maxsize=Constants.INGEST_EMBED_BATCH_SIZE * 2)
+        batches = asyncio.Queue(maxsize=Constants.INGEST_EMBED_CONCURRENCY * 2)
+        embedded = asyncio.Queue(maxsize=Constants.INGEST_EMBED_CONCURRENCY * 2)
+
+        async def run_downloads():
+            await asyncio.gather(
+                *(self._download_worker(jobs, downloaded) for _ in range(Constants.INGEST_DOWNLOAD_CONCURRENCY))
+            )
+            for _ in range(Constants.INGEST_SPLIT_WORKERS):
+                await downloaded.put(None)
+
+        async def run_splits(executor):
+            async def split_worker():
+                await self._split_worker(executor, downloaded, split_results)
+                await split_results.put(None)
+
+            await asyncio.gather(*(split_worker() for _ in range(Constants.INGEST_SPLIT_WORKERS)))
+
+        async def run_batcher():
+            await self._batcher(split_results, batches, Constants.INGEST_SPLIT_WORKERS)
+            for _ in range(Constants.INGEST_EMBED_CONCURRENCY):
+                await batches.put(None)
+
+        async def run_embeds():
+            await asyncio.gather(
+                *(self._embed_worker(batches, embedded) for _ in range(Constants.INGEST_EMBED_CONCURRENCY))
+            )
+            await embedded.put(None)
+
+        with ProcessPoolExecutor(max_workers=Constants.INGEST_SPLIT_WORKERS) as executor:
+            await asyncio.gather(
+                run_downloads(),
+                run_splits(executor),
+                run_batcher(),
+                run_embeds(),
+                self._insert_worker(embedded),
+            )
+        await self._apply_attachments()
+
+        wall_seconds = time.perf_counter() - started
+        print(f"Pipeline finished in {wall_seconds:.1f}s")
+        for stage_stats in self.stats.values():
+            print(stage_stats.report(wall_seconds))
+        if self.dedup_index is not None:
+            print(f"{self.duplicate_chunks} duplicate chunks were stored once and linked to their blobs")
+        if self._failed_blobs:
+            print(f"{len(self._failed_blobs)} blobs failed and stay pending for the next run")
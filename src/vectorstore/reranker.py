@@ -0,0 +1,173 @@
+import math
+import os
+import re
+import threading
+import time
+from collections import Counter
+
+import numpy as np
+
+from utils.constants import Constants
+from utils.tokens import count_tokens
+
+try:
+    import onnxruntime
+    from tokenizers import Tokenizer
+except ImportError:
+    onnxruntime = None
+    Tokenizer = None
+
+TERM_PATTERN = re.compile(r"\w+")
+BM25_K1 = 1.5
+BM25_B = 0.75
+CROSS_ENCODER_MAX_LENGTH = 512
+
+
+def bm25_scores(question, texts):
+    """BM25 of the question against each text, with document frequencies taken from the texts themselves."""
+    documents = [TERM_PATTERN.findall(text.lower()) for text in texts]
+    query_terms = set(TERM_PATTERN.findall(question.lower()))
+    if not documents or not query_terms:
+        return [0.0] * len(texts)
+    average_length = sum(len(terms) for terms in documents) / len(documents) or 1
+    document_frequency = Counter(term for terms in documents for term in set(terms) & query_terms)
+    scores = []
+    for terms in documents:
+        counts = Counter(terms)
+        score = 0.0
+        for term in query_terms:
+            if not counts[term]:
+                continue
+            idf = math.log(1 + (len(documents) - document_frequency[term] + 0.5) / (document_frequency[term] + 0.5))
+            norm = counts[term] + BM25_K1 * (1 - BM25_B + BM25_B * len(terms) / average_length)
+            score += idf * counts[term] * (BM25_K1 + 1) / norm
+        scores.append(score)
+    return scores
+
+
+class CrossEncoder:
+    """A cross-encoder exported to ONNX (e.g. a quantized ms-marco-MiniLM), run on CPU."""
+
+    def __init__(self, model_dir):
+        options = onnxruntime.SessionOptions()
+        options.intra_op_num_threads = 1
+        self.session = onnxruntime.InferenceSession(
+            os.path.join(model_dir, "model.onnx"), options, providers=["CPUExecutionProvider"]
+        )
+        self.input_names = {model_input.name for model_input in self.session.get_inputs()}
+        self.tokenizer = Tokenizer.from_file(os.path.join(model_dir, "tokenizer.json"))
+        self.tokenizer.enable_truncation(max_length=CROSS_ENCODER_MAX_LENGTH)
+        self.tokenizer.enable_padding()
+
+    def score(self, question, texts):
+        encodings = self.tokenizer.encode_batch([(question, text) for text in texts])
+        inputs = {
+            "input_ids": np.array([encoding.ids for encoding in encodings], dtype=np.int64),
+            "attention_mask": np.array([encoding.attention_mask for encoding in encodings], dtype=np.int64),
+            "token_type_ids": np.array([encoding.type_ids for encoding in encodings], dtype=np.int64),
+        }
+        logits = self.session.run(None, {name: value for name, value in inputs.items() if name in self.input_names})[0]
+        return logits.reshape(len(texts), -1)[:, 0].tolist()
+
+
+class ChunkReranker:
+    """
+    Reorders retrieved chunks by relevance to the question and keeps the best
+    ones that fit in a token budget. BM25 ranks every candidate first; when a
+    cross-encoder is configured it then rescores candidates in batches, best
+    BM25 first, until the latency budget runs out. Candidates that already fit
+    the budget are returned untouched, as there would be nothing to save.
+    """
+
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls, *args, **kwargs):
+        raise NotImplementedError("Use getInstance() method to get an instance.")
+
+    @classmethod
+    def getInstance(cls, *args, **kwargs):
+        if not cls._instance:
+            with cls._lock:
+                if not cls._instance:
+                    cls._instance = super(ChunkReranker, cls).__new__(cls)
+                    cls._instance._init(*args, **kwargs)
+        return cls._instance
+
+    def _init(self):
+        self.cross_encoder = None
+        if Constants.RERANKER_MODEL_DIR:
+            if onnxruntime is None:
+                print("RERANKER_MODEL_DIR is set but onnxruntime/tokenizers are not installed, using BM25")
+            else:
+                self.cross_encoder = CrossEncoder(Constants.RERANKER_MODEL_DIR)
+        self._stats_lock = threading.Lock()
+        self._stats = {
+            "calls": 0,
+            "skipped": 0,
+            "cross_encoder_batches": 0,
+            "latency_budget_exceeded": 0,
+            "tokens_in": 0,
+            "tokens_out": 0,
+            "seconds": 0.0,
+        }
+
+    def _scores(self, question, texts):
+        """Returns one sort key per text: cross-encoder scored texts first, then the rest by BM25."""
+        bm25 = bm25_scores(question, texts)
+        keys = [(0, score) for score in bm25]
+        if self.cross_encoder is None:
+            return keys, False
+
+        started = time.perf_counter()
+        order = sorted(range(len(texts)), key=lambda i: bm25[i], reverse=True)
+        for start in range(0, len(order), Constants.RERANK_BATCH_SIZE):
+            if time.perf_counter() - started > Constants.RERANK_LATENCY_BUDGET_SECONDS:
+                return keys, True
+            batch = order[start : start + Constants.RERANK_BATCH_SIZE]
+            for i, score in zip(batch, self.cross_encoder.score(question, [texts[i] for i in batch])):
+                keys[i] = (1, score)
+            with self._stats_lock:
+                self._stats["cross_encoder_batches"] += 1
+        return keys, False
+
+    def rerank(
+        self,
+        question,
+        documents,
+        top_k=Constants.RERANK_TOP_K,
+        max_tokens=Constants.RERANK_MAX_CONTEXT_TOKENS,
+    ):
+        started = time.perf_counter()
+        token_counts = [count_tokens(doc.page_content) for doc in documents]
+        if len(documents) <= top_k and sum(token_counts) <= max_tokens:
+            with self._stats_lock:
+                self._stats["skipped"] += 1
+            return documents
+
+        keys, budget_exceeded = self._scores(question, [doc.page_content for doc in documents])
+        ranked = sorted(range(len(documents)), key=lambda i: keys[i], reverse=True)
+        kept, used_tokens = [], 0
+        for i in ranked:
+            if len(kept) == top_k:
+                break
+            if used_tokens + token_counts[i] > max_tokens:
+                continue
+            kept.append(i)
+            used_tokens += token_counts[i]
+
+        with self._stats_lock:
+            self._stats["calls"] += 1
+            self._stats["latency_budget_exceeded"] += int(budget_exceeded)
+            self._stats["tokens_in"] += sum(token_counts)
+            self._stats["tokens_out"] += used_tokens
+            self._stats["seconds"] += time.perf_counter() - started
+        return [documents[i] for i in kept]
+
+    def get_stats(self):
+        with self._stats_lock:
+            stats = dict(self._stats)
+        stats["model"] = "cross-encoder" if self.cross_encoder is not None else "bm25"
+        stats["tokens_saved"] = stats["tokens_in"] - stats["tokens_out"]
+        stats["average_ms"] = 1000 * stats["seconds"] / stats["calls"] if stats["calls"] else 0.0
+        return stats
@@ -0,0 +1,252 @@
+import codecs
+import re
+
+import chardet
+from langchain.docstore.document import Document
+from langchain.text_splitter import RecursiveCharacterTextSplitter
+
+CHUNK_SIZE = 1000
+CHUNK_OVERLAP = 200
+ENCODINGS = ["utf-8", "latin1", "iso-8859-1", "windows-1252"]
+DETECT_SAMPLE_BYTES = 64 * 1024
+# Longest BOMs first: the UTF-32 LE BOM starts with the UTF-16 LE one.
+BOMS = [
+    (codecs.BOM_UTF32_LE, "utf-32"),
+    (codecs.BOM_UTF32_BE, "utf-32"),
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+]
+NON_ASCII_PATTERN = re.compile(rb"[\x80-\xff]")
+# Blobs above this size are read in ranges and split as they stream in.
+STREAMING_THRESHOLD_BYTES = 16 * 1024 * 1024
+RANGE_BYTES = 1024 * 1024
+# Text the streaming splitter hands to RecursiveCharacterTextSplitter at a time.
+STREAMING_WINDOW_CHARS = 32 * CHUNK_SIZE
+STREAMING_MAX_BUFFER_CHARS = 4 * STREAMING_WINDOW_CHARS
+PARAGRAPH_SEPARATOR_PATTERN = re.compile("\n\n")
+MIN_DOCUMENT_CHARS = 100
+MIN_CHUNK_CHARS = 10
+
+
+def try_decode(data, encodings):
+    """Tries to decode the data using a list of encodings."""
+    for encoding in encodings:
+        try:
+            return data.decode(encoding), encoding
+        except UnicodeDecodeError:
+            continue
+    raise UnicodeDecodeError("Unable to decode data with provided encodings.")
+
+
+def detection_sample(data):
+    """Up to DETECT_SAMPLE_BYTES starting just before the first non-ASCII byte, where the evidence is."""
+    match = NON_ASCII_PATTERN.search(data)
+    start = max(0, match.start() - 1024) if match else 0
+    return data[start : start + DETECT_SAMPLE_BYTES]
+
+
+def decode_bytes(data):
+    """
+    Tiered decoding, cheapest first: a BOM, then strict UTF-8 (which covers
+    ASCII), then chardet on a bounded sample, then the ENCODINGS list.
+    Returns the text and the encoding used.
+    """
+    for bom, encoding in BOMS:
+        if data.startswith(bom):
+            try:
+                return data.decode(encoding), encoding
+            except UnicodeDecodeError:
+                break
+
+    try:
+        return data.decode("utf-8"), "utf-8"
+    except UnicodeDecodeError:
+        pass
+
+    result = chardet.detect(detection_sample(data))
+    encoding = result["encoding"]
+    if encoding:
+        try:
+            return data.decode(encoding), encoding.lower()
+        except (UnicodeDecodeError, LookupError):
+            pass
+
+    return try_decode(data, [encoding for encoding in ENCODINGS if encoding != "utf-8"])
+
+
+def split_documents_from_bytes(blob_name, raw_data):
+    """Decodes and splits the content of a blob."""
+    document_text, used_encoding = decode_bytes(raw_data)
+
+    doc = Document(
+        page_content=document_text,
+        metadata={"file_name": blob_name, "encoding": used_encoding},
+    )
+    if len(doc.page_content) > MIN_DOCUMENT_CHARS:
+        doc_text = doc.page_content.replace("\x00", "")
+        list_doc = [Document(page_content=doc_text, metadata=doc.metadata)]
+    else:
+        list_doc = []
+
+    text_splitter = RecursiveCharacterTextSplitter(
+        chunk_size=CHUNK_SIZE, chunk_overlap=CHUNK_OVERLAP
+    )
+    splits = text_splitter.split_documents(list_doc)
+    return [split for split in splits if len(split.page_content) > MIN_CHUNK_CHARS]
+
+
+def detect_stream_encoding(head):
+    """Picks the encoding of a streamed blob from its first range, with the same tiers as decode_bytes."""
+    for bom, encoding in BOMS:
+        if head.startswith(bom):
+            return encoding
+    try:
+        # final=False: the range may end inside a multi-byte character.
+        codecs.getincrementaldecoder("utf-8")().decode(head, final=False)
+        return "utf-8"
+    except UnicodeDecodeError:
+        pass
+    encoding = chardet.detect(detection_sample(head))["encoding"]
+    try:
+        return codecs.lookup(encoding).name if encoding else ENCODINGS[1]
+    except LookupError:
+        return ENCODINGS[1]
+
+
+class StreamingDecoder:
+    """
+    Incremental decoder for ranges of a blob. When a blob that looked like
+    UTF-8 stops being valid UTF-8 later on, the undecoded bytes are
+    re-detected and decoding continues in the detected encoding.
+    """
+
+    def __init__(self, head):
+        self.encoding = detect_stream_encoding(head)
+        self._decoder = codecs.getincrementaldecoder(self.encoding)()
+
+    def decode(self, data, final=False):
+        pending = self._decoder.getstate()[0]
+        try:
+            return self._decoder.decode(data, final)
+        except UnicodeDecodeError:
+            remaining = pending + data
+            encoding = chardet.detect(detection_sample(remaining))["encoding"] or ENCODINGS[1]
+            try:
+                self._decoder = codecs.getincrementaldecoder(encoding)()
+                text = self._decoder.decode(remaining, final)
+            except (UnicodeDecodeError, LookupError):
+                encoding = ENCODINGS[1]
+                self._decoder = codecs.getincrementaldecoder(encoding)()
+                text = self._decoder.decode(remaining, final)
+            print(f"Switched decoding from {self.encoding} to {encoding} mid-stream")
+            self.encoding = encoding.lower()
+            return text
+
+
+class StreamingSplitter:
+    """
+    Splits text that arrives in pieces into the chunks split_documents_from_bytes
+    would produce, holding at most STREAMING_MAX_BUFFER_CHARS of text (plus
+    the piece being fed) rather than the whole blob.
+
+    RecursiveCharacterTextSplitter starts a fresh chunk, with no overlap
+    carried over, after every paragraph of CHUNK_SIZE or more characters.
+    Windows are cut right after such a paragraph, so the chunks come out
+    identical to splitting the whole text. Text without long paragraphs is
+    cut at the start of the window's last chunk instead, which keeps the
+    chunk size and overlap but can shift boundaries slightly.
+    """
+
+    def __init__(self, blob_name, encoding=None):
+        self.blob_name = blob_name
+        self.encoding = encoding
+        self.text_splitter = RecursiveCharacterTextSplitter(
+            chunk_size=CHUNK_SIZE, chunk_overlap=CHUNK_OVERLAP
+        )
+        self._buffer = ""
+        self._position = 0
+        self._total_chars = 0
+        self._pending = []
+
+    def _document(self, text):
+        return Document(
+            page_content=text,
+            metadata={"file_name": self.blob_name, "encoding": self.encoding},
+        )
+
+    def _exact_cut(self, window):
+        """Offset of the last paragraph separator in the window that follows a long paragraph, or None."""
+        separators = [match.start() for match in PARAGRAPH_SEPARATOR_PATTERN.finditer(window)]
+        # The window must keep a separator before the cut, or the splitter would pick "\n" for it.
+        for previous, separator in reversed(list(zip(separators, separators[1:]))):
+            if separator - previous >= CHUNK_SIZE:
+                return separator
+        return None
+
+    def _approximate_cut(self, window):
+        """Splits the window and returns its chunks but the last, and where that last one starts."""
+        chunks = self.text_splitter.split_text(window)
+        if len(chunks) < 2:
+            return [], None
+        start = window.rfind(chunks[-1])
+        return chunks[:-1], start if start > 0 else None
+
+    def _emit(self, chunks):
+        documents = [self._document(chunk) for chunk in chunks if len(chunk) > MIN_CHUNK_CHARS]
+        if self._total_chars > MIN_DOCUMENT_CHARS:
+            documents, self._pending = self._pending + documents, []
+            return documents
+        # Like the in-memory path, a blob of MIN_DOCUMENT_CHARS or less yields nothing;
+        # the check waits until enough text has been seen.
+        self._pending.extend(documents)
+        return []
+
+    def feed(self, text):
+        """Adds decoded text and returns the chunks that are now complete."""
+        text = text.replace("\x00", "")
+        self._total_chars += len(text)
+        self._buffer += text
+        chunks = []
+        while len(self._buffer) - self._position >= STREAMING_WINDOW_CHARS:
+            window = self._buffer[self._position : self._position + STREAMING_MAX_BUFFER_CHARS]
+            cut = self._exact_cut(window)
+            if cut is not None:
+                chunks.extend(self.text_splitter.split_text(window[:cut]))
+            elif len(window) >= STREAMING_MAX_BUFFER_CHARS:
+                window_chunks, cut = self._approximate_cut(window)
+                if cut is None:
+                    break
+                chunks.extend(window_chunks)
+            else:
+                # Wait for a long paragraph or a full buffer.
+                break
+            self._position += cut
+        self._buffer = self._buffer[self._position :]
+        self._position = 0
+        return self._emit(chunks)
+
+    def finish(self):
+        """Returns the remaining chunks once the whole blob has been fed."""
+        chunks = self.text_splitter.split_text(self._buffer) if self._buffer else []
+        self._buffer = ""
+        if self._total_chars <= MIN_DOCUMENT_CHARS:
+            return []
+        return self._emit(chunks)
+
+
+def iter_split_ranges(blob_name, ranges):
+    """Decodes and splits an iterable of byte ranges, yielding chunks as soon as they are complete."""
+    decoder, splitter = None, None
+    for data in ranges:
+        if decoder is None:
+            decoder = StreamingDecoder(data)
+            splitter = StreamingSplitter(blob_name, decoder.encoding)
+        text = decoder.decode(data)
+        splitter.encoding = decoder.encoding
+        yield from splitter.feed(text)
+    if decoder is None:
+        return
+    splitter.encoding = decoder.encoding
+    yield from splitter.feed(decoder.decode(b"", final=True))
+    yield from splitter.finish()
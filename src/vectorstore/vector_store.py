@@ -1,34 +1,38 @@
+import asyncio
 from urllib.parse import quote
 
-import chardet
 import psycopg2
-from langchain.docstore.document import Document
-from langchain.text_splitter import RecursiveCharacterTextSplitter
 from langchain_community.vectorstores import PGVector
 from langchain_openai import OpenAIEmbeddings
 from psycopg2 import sql
 
 from common.azure_blob_client_manager import AzureBlobClientManager
-from common.key_vault_manager import KeyVaultManager
-from utils.constants import KeyVaultSecretKeys
+from common.service_container import ServiceContainer
+from src.vectorstore.bulk_loader import PGVectorBulkLoader
+from src.vectorstore.dedup import load_dedup_index
+from src.vectorstore.embedding_cache import CachedEmbeddings
+from src.vectorstore.index_manager import VectorIndexManager
+from src.vectorstore.manifest import (
+    STATUS_DONE,
+    IngestionManifest,
+    delete_blob_chunks,
+)
+from src.vectorstore.pipeline import IngestionPipeline
+from utils.constants import Constants, KeyVaultSecretKeys
 
 # Constants
 BLOB_PREFIXES = ["north-highland/text/raw/"]
-CHUNK_SIZE = 1000
-CHUNK_OVERLAP = 200
 COLLECTION_NAME = "poc_v0"
-ENCODINGS = ["utf-8", "latin1", "iso-8859-1", "windows-1252"]
 
-# Initialize key vault manager
-key_vault_manager = KeyVaultManager.getInstance()
-
-# Retrieve secrets
+# Retrieve secrets, in one concurrent Key Vault batch
 db_name = "postgres"
-db_user = key_vault_manager.get_secret(KeyVaultSecretKeys.POSTGRES_USER)
-db_password = key_vault_manager.get_secret(KeyVaultSecretKeys.POSTGRES_PASSWORD)
-db_host = key_vault_manager.get_secret(KeyVaultSecretKeys.POSTGRES_HOST)
-db_port = key_vault_manager.get_secret(KeyVaultSecretKeys.POSTGRES_PORT)
-openai_key = key_vault_manager.get_secret(KeyVaultSecretKeys.OPENAI_API_KEY)
+db_user, db_password, db_host, db_port, openai_key = ServiceContainer.getInstance().get_secrets(
+    KeyVaultSecretKeys.POSTGRES_USER,
+    KeyVaultSecretKeys.POSTGRES_PASSWORD,
+    KeyVaultSecretKeys.POSTGRES_HOST,
+    KeyVaultSecretKeys.POSTGRES_PORT,
+    KeyVaultSecretKeys.OPENAI_API_KEY,
+)
 
 container_instance = AzureBlobClientManager.getInstance()
 container_client = container_instance.get_container_client()
@@ -65,89 +69,87 @@ def connect_to_db():
             print("Database connection closed")
 
 
-def get_blob_files(container_client, prefix):
-    """Returns a list of blob files from the container with the specified prefix."""
-    blobs = container_client.list_blobs(name_starts_with=prefix)
-    return [blob.name for blob in blobs]
-
-
-def try_decode(data, encodings):
-    """Tries to decode the data using a list of encodings."""
-    for encoding in encodings:
-        try:
-            return data.decode(encoding), encoding
-        except UnicodeDecodeError:
-            continue
-    raise UnicodeDecodeError("Unable to decode data with provided encodings.")
-
-
-def load_and_split_documents_from_blob(container_client, blob_name):
-    """Loads and splits documents from a blob."""
-    blob_client = container_client.get_blob_client(blob_name)
-    raw_data = blob_client.download_blob().readall()
+def get_blob_properties(container_client, prefix):
+    """Returns the properties (name, ETag, ...) of the blobs with the specified prefix."""
+    return list(container_client.list_blobs(name_starts_with=prefix))
 
-    result = chardet.detect(raw_data)
-    encoding = result["encoding"]
 
-    document_text, used_encoding = try_decode(
-        raw_data, [encoding] + ENCODINGS if encoding else ENCODINGS
-    )
-
-    doc = Document(page_content=document_text, metadata={"file_name": blob_name})
-    if len(doc.page_content) > 100:
-        doc_text = doc.page_content.replace("\x00", "")
-        list_doc = [Document(page_content=doc_text, metadata=doc.metadata)]
-    else:
-        list_doc = []
+def ingest():
+    """
+    Incremental ingestion: only new or changed blobs are embedded, chunks of
+    removed blobs are deleted, and a run interrupted half way resumes from the
+    manifest. An unchanged corpus makes no embedding calls.
+    """
+    connect_to_db()
 
-    text_splitter = RecursiveCharacterTextSplitter(
-        chunk_size=CHUNK_SIZE, chunk_overlap=CHUNK_OVERLAP
+    conn = psycopg2.connect(
+        dbname=db_name, user=db_user, password=db_password, host=db_host, port=db_port
     )
-    splits = text_splitter.split_documents(list_doc)
-    return [split for split in splits if len(split.page_content) > 10]
-
-
-connect_to_db()
-
-embeddings = OpenAIEmbeddings(api_key=openai_key)
-
-blob_keys = []
-for prefix in BLOB_PREFIXES:
-    blob_keys.extend(get_blob_files(container_client, prefix))
-print(f"Total blobs found: {len(blob_keys)}")
-
-initial_splits = []
-for key in blob_keys[:5]:
-    print(f"Processing initial blob: {key}")
-    splits = load_and_split_documents_from_blob(container_client, key)
-    if splits:
-        initial_splits.extend(splits)
-print("Initial Splitting Done")
-print(f"Total initial splits: {len(initial_splits)}")
-
-CONNECTION_STRING = f"postgresql+psycopg2://{db_user}:{quote(db_password)}@{db_host}:{db_port}/{db_name}"
-try:
-    vectorstore = PGVector.from_documents(
-        embedding=embeddings,
-        documents=initial_splits,
+    manifest = IngestionManifest(conn, COLLECTION_NAME)
+    manifest.ensure_table()
+    entries = manifest.load()
+
+    blob_properties = []
+    for prefix in BLOB_PREFIXES:
+        blob_properties.extend(get_blob_properties(container_client, prefix))
+    print(f"Total blobs found: {len(blob_properties)}")
+
+    current_blob_names = {blob.name for blob in blob_properties}
+    for blob_name in sorted(set(entries) - current_blob_names):
+        deleted = delete_blob_chunks(conn, COLLECTION_NAME, blob_name)
+        manifest.remove(blob_name)
+        print(f"Removed {len(deleted)} chunks of deleted blob {blob_name}")
+
+    # PGVector creates the extension, tables and collection; rows are then
+    # written with COPY on a connection of their own.
+    PGVector(
         collection_name=COLLECTION_NAME,
         connection_string=CONNECTION_STRING,
-        pre_delete_collection=True,
+        embedding_function=embeddings,
     )
-except Exception as e:
-    print(f"An error occurred while initializing the vector store: {e}")
-    vectorstore = PGVector.from_documents(
-        embedding=embeddings,
-        documents=initial_splits,
-        collection_name=COLLECTION_NAME,
-        connection_string=CONNECTION_STRING,
-        pre_delete_collection=False,
+    loader_conn = psycopg2.connect(
+        dbname=db_name, user=db_user, password=db_password, host=db_host, port=db_port
+    )
+    bulk_loader = PGVectorBulkLoader(loader_conn, COLLECTION_NAME)
+
+    blob_jobs = [
+        (blob, entries.get(blob.name))
+        for blob in blob_properties
+        if not (
+            blob.name in entries
+            and entries[blob.name].status == STATUS_DONE
+            and entries[blob.name].etag == blob.etag
+        )
+    ]
+    print(f"{len(blob_properties) - len(blob_jobs)} blobs unchanged, {len(blob_jobs)} to process")
+
+    pipeline = IngestionPipeline(
+        conn,
+        manifest,
+        bulk_loader,
+        embeddings,
+        container_instance.get_async_container_client(),
+        COLLECTION_NAME,
+        dedup_index=load_dedup_index(conn, COLLECTION_NAME),
     )
+    asyncio.run(pipeline.run(blob_jobs))
+    loader_conn.close()
+
+    index_manager = VectorIndexManager(conn, COLLECTION_NAME)
+    indexes = index_manager.list_indexes()
+    index_manager.ensure_index(migrate_dimension=Constants.VECTOR_MIGRATE_DIMENSION)
+    if (
+        index_manager.index_name(Constants.VECTOR_INDEX_METHOD) in indexes
+        and Constants.VECTOR_INDEX_METHOD == "ivfflat"
+        and blob_jobs
+    ):
+        # HNSW absorbs inserts; IVFFlat lists go stale as the data drifts.
+        index_manager.rebuild_index()
+    conn.close()
+
+
+embeddings = CachedEmbeddings(OpenAIEmbeddings(api_key=openai_key))
+CONNECTION_STRING = f"postgresql+psycopg2://{db_user}:{quote(db_password)}@{db_host}:{db_port}/{db_name}"
 
-for key in blob_keys[5:]:
-    final_splits = []
-    splits = load_and_split_documents_from_blob(container_client, key)
-    if splits:
-        final_splits.extend(splits)
-        print(f"Processing {key} documents")
-        vectorstore.add_documents(final_splits)
+if __name__ == "__main__":
+    ingest()
@@ -1,36 +1,112 @@
-import json
-import random
+import os
+from contextlib import asynccontextmanager
 from typing import AsyncIterable, Optional
 
 from langchain.callbacks import AsyncIteratorCallbackHandler
-from langchain_openai import ChatOpenAI
 from langchain_core.output_parsers import StrOutputParser
 from langchain_core.runnables import RunnablePassthrough
 from pydantic import BaseModel
 
+from common.api_key_scheduler import ApiKeyScheduler
+from common.azure_blob_client_manager import AzureBlobClientManager
 from common.key_vault_manager import KeyVaultManager
+from common.llm_client_manager import LLMClientManager
+from common.service_container import ServiceContainer
 from enums.model import OpenAIModel
-from fastapi import FastAPI
+from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import StreamingResponse
-from nh.stream_document_qa_api import get_sourced_documents
+from nh.stream_document_qa_api import (
+    aget_sourced_documents,
+    chunk_id,
+    question_rewriter,
+)
+from src.context_builder import context_stats
 from src.helper import get_history_question, get_prompt
-from utils.constants import KeyVaultSecretKeys
+from utils.constants import Constants, KeyVaultSecretKeys, LLMProviders
 from utils.prompt import *
-from langchain_anthropic import ChatAnthropic
+from utils.semantic_cache import SemanticResponseCache
+from utils.sse import (
+    ERROR_EVENT,
+    SOURCES_EVENT,
+    TITLE_EVENT,
+    TOKEN_EVENT,
+    sse_stream,
+    stream_stats,
+)
+from utils.extraction import parse_timings
+from utils.text_cache import ExtractedTextCache
+from utils.tokens import count_tokens
 from utils.logging_config  import setup_logging
 
 setup_logging()
 
-key_vault_manager = KeyVaultManager.getInstance()
-OPENAI_API_KEY_LIST = key_vault_manager.get_secret(
-    KeyVaultSecretKeys.OPENAI_API_KEY_LIST
-).split(",")
-ANTHROPIC_API_KEY_LIST = key_vault_manager.get_secret(
-    KeyVaultSecretKeys.ANTHROPIC_KEY_LIST
-).split(",")
+services = ServiceContainer.getInstance()
+
+CLAUDE_MODEL = "claude-3-opus-20240229"
+
+
+def get_anthropic_api_keys():
+    return services.get_secret(KeyVaultSecretKeys.ANTHROPIC_KEY_LIST).split(",")
+
+
+def create_anthropic_key_scheduler():
+    return ApiKeyScheduler.getInstance(LLMProviders.ANTHROPIC, key_source=get_anthropic_api_keys)
+
+
+# The OpenAI key scheduler, embeddings and retrievers are registered by nh.stream_document_qa_api
+services.register(
+    "anthropic_key_scheduler",
+    create_anthropic_key_scheduler,
+    eager=True,
+    secrets=[KeyVaultSecretKeys.ANTHROPIC_KEY_LIST],
+    rebuild=False,
+    refresh=lambda scheduler: scheduler.reload_keys(),
+)
+services.register(
+    "blob_client_manager",
+    AzureBlobClientManager.getInstance,
+    eager=True,
+    secrets=[KeyVaultSecretKeys.AZURE_STORAGE_CONTAINER_CONNECTION_STRING],
+    rebuild=False,
+    refresh=lambda manager: manager.refresh_clients(),
+)
+
+llm_client_manager = LLMClientManager.getInstance()
+
+
+def create_response_cache(model):
+    return SemanticResponseCache(
+        model,
+        Constants.SEMANTIC_CACHE_SIMILARITY_THRESHOLD,
+        Constants.SEMANTIC_CACHE_TTL_SECONDS,
+        Constants.SEMANTIC_CACHE_MAX_ENTRIES,
+        Constants.SEMANTIC_CACHE_SQLITE_PATH,
+    )
+
+
+# Built on first use, so the SQLite file is only opened when SEMANTIC_CACHE_ENABLED
+services.register("nh_qa_response_cache", lambda: create_response_cache(OpenAIModel.NH_QA.value))
+services.register("title_response_cache", lambda: create_response_cache(OpenAIModel.TITLE.value))
+
+# Streams in flight in this worker; on shutdown the server waits for them (see Dockerfile)
+active_streams = 0
+
+
+
+@asynccontextmanager
+async def lifespan(app):
+    # Secrets and clients are loaded here, not at import; the app serves /ready/ even if this fails.
+    await services.start()
+    yield
+    if active_streams:
+        print(f"Shutting down with {active_streams} streams still in flight")
+    await services.stop()
+    await llm_client_manager.aclose()
+
 
 app = FastAPI(
+    lifespan=lifespan,
     title="LangChain Server",
     version="1.0",
     description="A simple API server using LangChain's Runnable interfaces",
@@ -57,75 +133,67 @@ class Item(BaseModel):
     files: Optional[list] = None
 
 
-def set_default(obj):
-    if isinstance(obj, set):
-        return list(obj)
-    raise TypeError
+def get_history_text(chat_history):
+    return "\n".join(str(message.content) for message in chat_history)
 
 
 async def handle_gpt_4model(callback, chat_history, session_user_question, user_prompt):
-    llm = ChatOpenAI(
-        model=OpenAIModel.GPT_4.value,
-        max_tokens=4000,
-        streaming=True,
-        verbose=True,
-        callbacks=[callback],
-        api_key=random.choice(OPENAI_API_KEY_LIST),
-    )
+    llm = llm_client_manager.get_chat_openai(
+        OpenAIModel.GPT_4.value, services.get("openai_key_scheduler").acquire(model=OpenAIModel.GPT_4.value)
+    ).bind(max_tokens=Constants.ANSWER_MAX_TOKENS)
     try:
         chain = user_prompt | llm | StrOutputParser()
         async for msg in chain.astream(
-            {"chat_history": chat_history, "user_question": session_user_question}
+            {"chat_history": chat_history, "user_question": session_user_question},
+            config={"callbacks": [callback]},
         ):
-            yield msg + "\n"
+            yield TOKEN_EVENT, msg
     except Exception as e:
         print(e)
-        yield "There is some Error to generate response. Please Contact AI-CoE with Full Screen Screenshot"
+        yield ERROR_EVENT, {"message": Constants.STREAM_ERROR_MESSAGE}
 
 
 async def handle_claude_model(
     callback, chat_history, session_user_question, user_prompt
 ):
-    api_key = random.choice(ANTHROPIC_API_KEY_LIST)
-    llm_anthropic = ChatAnthropic(
-        temperature=0.3,
-        max_tokens=4000,
-        model_name="claude-3-opus-20240229",
-        streaming=True,
-        verbose=True,
-        callbacks=[callback],
-        api_key=api_key,
-    )
+    api_key = services.get("anthropic_key_scheduler").acquire(model=CLAUDE_MODEL)
+    llm_anthropic = llm_client_manager.get_chat_anthropic(CLAUDE_MODEL, api_key).bind(temperature=0.3, max_tokens=Constants.ANSWER_MAX_TOKENS)
     try:
         chain = user_prompt | llm_anthropic | StrOutputParser()
         async for msg in chain.astream(
-            {"chat_history": chat_history, "user_question": session_user_question}
+            {"chat_history": chat_history, "user_question": session_user_question},
+            config={"callbacks": [callback]},
         ):
-            yield msg + "\n"
+            yield TOKEN_EVENT, msg
     except Exception as e:
         print(e)
-        yield "There is some Error to generate response. Please Contact AI-CoE with Full Screen Screenshot"
+        yield ERROR_EVENT, {"message": Constants.STREAM_ERROR_MESSAGE}
 
 
 async def handle_nh_qa_model(callback, chat_history, session_user_question):
     try:
-        contextualized_question, source_docs, formatted_docs = get_sourced_documents(
+        contextualized_question, source_docs, formatted_docs = await aget_sourced_documents(
             session_user_question, chat_history
         )
         docs = [
             {"file_name": d.metadata["file_name"], "content": d.page_content}
             for d in source_docs
         ]
-        yield json.dumps(docs, default=set_default)
-
-        llm = ChatOpenAI(
-            model=OpenAIModel.GPT_4.value,
-            max_tokens=4000,
-            streaming=True,
-            verbose=True,
-            callbacks=[callback],
-            api_key=random.choice(OPENAI_API_KEY_LIST),
-        )
+        yield SOURCES_EVENT, docs
+
+        question_vector = None
+        if Constants.SEMANTIC_CACHE_ENABLED:
+            question_vector = await services.get("embedding").aembed_query(contextualized_question)
+            doc_ids = [chunk_id(d) for d in source_docs]
+            cached_chunks = await services.get("nh_qa_response_cache").alookup(question_vector, doc_ids)
+            if cached_chunks is not None:
+                for chunk in cached_chunks:
+                    yield TOKEN_EVENT, chunk
+                return
+
+        llm = llm_client_manager.get_chat_openai(
+            OpenAIModel.GPT_4.value, services.get("openai_key_scheduler").acquire(model=OpenAIModel.GPT_4.value)
+        ).bind(max_tokens=Constants.ANSWER_MAX_TOKENS)
 
         answer_input = {
             "chat_history": chat_history,
@@ -135,76 +203,157 @@ async def handle_nh_qa_model(callback, chat_history, session_user_question):
 
         answer_chain = RunnablePassthrough() | qa_prompt | llm
 
-        async for chunk in answer_chain.astream(answer_input):
-            yield f"{chunk.content}\n"
+        answer_chunks = []
+        async for chunk in answer_chain.astream(
+            answer_input, config={"callbacks": [callback]}
+        ):
+            answer_chunks.append(chunk.content)
+            yield TOKEN_EVENT, chunk.content
+
+        if question_vector is not None:
+            await services.get("nh_qa_response_cache").astore(
+                question_vector,
+                doc_ids,
+                answer_chunks,
+                count_tokens(
+                    formatted_docs
+                    + contextualized_question
+                    + get_history_text(chat_history)
+                    + "".join(answer_chunks)
+                ),
+            )
     except Exception as e:
         print(e)
-        yield "There is some Error to generate response. Please Contact AI-CoE with Full Screen Screenshot"
+        yield ERROR_EVENT, {"message": Constants.STREAM_ERROR_MESSAGE}
 
 
 async def handle_title_model(callback, chat_history, user_prompt):
-    llm = ChatOpenAI(
-        model=OpenAIModel.GPT_4.value,
-        max_tokens=4000,
-        streaming=True,
-        verbose=True,
-        callbacks=[callback],
-        api_key=random.choice(OPENAI_API_KEY_LIST),
-    )
+    llm = llm_client_manager.get_chat_openai(
+        OpenAIModel.GPT_4.value, services.get("openai_key_scheduler").acquire(model=OpenAIModel.GPT_4.value)
+    ).bind(max_tokens=Constants.ANSWER_MAX_TOKENS)
     try:
+        history_vector = None
+        if Constants.SEMANTIC_CACHE_ENABLED:
+            history_vector = await services.get("embedding").aembed_query(get_history_text(chat_history))
+            cached_chunks = await services.get("title_response_cache").alookup(history_vector)
+            if cached_chunks is not None:
+                for title in cached_chunks:
+                    yield TITLE_EVENT, {"title": title}
+                return
+
         chain = user_prompt | llm | StrOutputParser()
         title_result = ""
-        async for msg in chain.astream({"chat_history": chat_history}):
+        async for msg in chain.astream(
+            {"chat_history": chat_history}, config={"callbacks": [callback]}
+        ):
             title_result += msg
-        yield json.dumps({"title": title_result.strip()}, default=set_default)
+        yield TITLE_EVENT, {"title": title_result.strip()}
+
+        if history_vector is not None:
+            await services.get("title_response_cache").astore(
+                history_vector,
+                (),
+                [title_result.strip()],
+                count_tokens(get_history_text(chat_history) + title_result),
+            )
     except Exception as e:
         print(e)
-        yield "There is some Error to generate response. Please Contact AI-CoE with Full Screen Screenshot"
+        yield ERROR_EVENT, {"message": Constants.STREAM_ERROR_MESSAGE}
 
 
-async def send_message(item: Item) -> AsyncIterable[str]:
+async def send_message(item: Item) -> AsyncIterable[tuple]:
+    """Yields the (event, data) pairs of the answer; sse_stream turns them into SSE messages."""
     session_memory, chat_history, session_user_question, session_files, session_tags = (
         get_history_question(item)
     )
     callback = AsyncIteratorCallbackHandler()
     list_files = session_files if len(session_files) > 0 else []
     if item.model == OpenAIModel.GPT_4.value:
-        user_prompt = get_prompt(item.model, session_tags, list_files)
+        user_prompt = await get_prompt(
+            item.model, session_tags, list_files, session_user_question, chat_history
+        )
         async for msg in handle_gpt_4model(
             callback, chat_history, session_user_question, user_prompt
         ):
-            yield msg + "\n"
+            yield msg
 
     elif (item.model == OpenAIModel.CLAUDE_3_OPUS.value or item.model == OpenAIModel.CLAUDE_3_OPOUS.value):
-        user_prompt = get_prompt(item.model, session_tags, list_files)
+        user_prompt = await get_prompt(
+            item.model, session_tags, list_files, session_user_question, chat_history
+        )
         async for msg in handle_claude_model(
             callback, chat_history, session_user_question, user_prompt
         ):
-            yield msg + "\n"
+            yield msg
 
     elif item.model == OpenAIModel.NH_QA.value:
         async for msg in handle_nh_qa_model(
             callback, chat_history, session_user_question
         ):
-            print(msg)
-            yield msg + "\n"
+            yield msg
 
     elif item.model == OpenAIModel.TITLE.value:
-        user_prompt = get_prompt(item.model, session_tags, list_files)
+        user_prompt = await get_prompt(item.model, session_tags, list_files)
         async for msg in handle_title_model(callback, chat_history, user_prompt):
-            yield msg + "\n"
+            yield msg
 
     else:
-        pass
+        yield ERROR_EVENT, {"message": f"Unknown model {item.model}"}
 
 
 class StreamRequest(BaseModel):
     message: str
 
 
+async def track_stream(messages):
+    global active_streams
+    active_streams += 1
+    try:
+        async for message in messages:
+            yield message
+    finally:
+        active_streams -= 1
+
+
 @app.post("/chat_stream/")
-def stream(item: Item):
-    return StreamingResponse(send_message(item), media_type="text/event-stream")
+def stream(item: Item, request: Request):
+    return StreamingResponse(
+        track_stream(sse_stream(send_message(item), request.is_disconnected)),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@app.get("/ready/")
+def ready(response: Response):
+    readiness = services.readiness()
+    if not readiness["ready"]:
+        response.status_code = 503
+    return readiness
+
+
+@app.get("/stats/")
+def stats():
+    return {
+        "extracted_text_cache": ExtractedTextCache.getInstance().get_stats(),
+        "parse_timings": parse_timings.get_stats(),
+        "context_builder": dict(context_stats),
+        "llm_clients": llm_client_manager.get_stats(),
+        "openai_keys": services.get("openai_key_scheduler").get_stats(),
+        "anthropic_keys": services.get("anthropic_key_scheduler").get_stats(),
+        "nh_qa_response_cache": (
+            services.get("nh_qa_response_cache").get_stats() if Constants.SEMANTIC_CACHE_ENABLED else None
+        ),
+        "title_response_cache": (
+            services.get("title_response_cache").get_stats() if Constants.SEMANTIC_CACHE_ENABLED else None
+        ),
+        "embedding_cache": services.get("embedding").get_stats(),
+        "question_rewriter": question_rewriter.get_stats(),
+        "reranker": services.get("reranker").get_stats(),
+        "key_vault": KeyVaultManager.getInstance().get_stats(),
+        "worker": {"pid": os.getpid(), "active_streams": active_streams},
+        "sse": dict(stream_stats),
+    }
 
 
 # To run the server, use the following command in the terminal:
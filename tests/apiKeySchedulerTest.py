@@ -0,0 +1,59 @@
+import httpx
+
+from common.api_key_scheduler import ApiKeyScheduler
+from common.llm_client_manager import LLMClientManager
+
+# Per (key, model) rate limit tracking of ApiKeyScheduler, offline:
+#   PYTHONPATH=. python tests/apiKeySchedulerTest.py
+KEYS = ["sk-aaaa", "sk-bbbb"]
+
+
+def headers(remaining_tokens, limit_tokens):
+    return {
+        "x-ratelimit-limit-requests": "500",
+        "x-ratelimit-remaining-requests": "400",
+        "x-ratelimit-limit-tokens": str(limit_tokens),
+        "x-ratelimit-remaining-tokens": str(remaining_tokens),
+    }
+
+
+def test_headers_of_one_model_leave_the_other_alone():
+    scheduler = ApiKeyScheduler("openai", KEYS)
+    # sk-aaaa is nearly out of gpt-4 tokens; a gpt-4o-mini response on it must not hide that.
+    scheduler.update_from_response("sk-aaaa", 200, headers(1000, 40000), model="gpt-4")
+    scheduler.update_from_response("sk-aaaa", 200, headers(1990000, 2000000), model="gpt-4o-mini")
+    stats = scheduler.get_stats()
+    assert stats["...aaaa gpt-4"]["headroom"] < 0.05
+    assert stats["...aaaa gpt-4o-mini"]["headroom"] > 0.5
+    assert scheduler.acquire(model="gpt-4") == "sk-bbbb"
+
+
+def test_cooldown_is_per_model():
+    scheduler = ApiKeyScheduler("openai", KEYS)
+    scheduler.update_from_response("sk-bbbb", 200, headers(1000, 40000), model="gpt-4")
+    scheduler.update_from_response("sk-aaaa", 429, {"retry-after": "30"}, model="gpt-4o-mini")
+    assert scheduler.acquire(model="gpt-4o-mini") == "sk-bbbb"
+    # The 429 on gpt-4o-mini does not cool sk-aaaa down for gpt-4.
+    assert scheduler.acquire(model="gpt-4") == "sk-aaaa"
+    stats = scheduler.get_stats()
+    assert stats["...aaaa gpt-4o-mini"]["cooling_down"]
+    assert not stats["...aaaa gpt-4"]["cooling_down"]
+
+
+def test_request_model():
+    request = httpx.Request(
+        "POST", "https://api.openai.com/v1/chat/completions", json={"model": "gpt-4o-mini", "messages": []}
+    )
+    assert LLMClientManager._request_model(request) == "gpt-4o-mini"
+    assert LLMClientManager._request_model(httpx.Request("GET", "https://api.openai.com/v1/models")) is None
+
+
+def main():
+    test_headers_of_one_model_leave_the_other_alone()
+    test_cooldown_is_per_model()
+    test_request_model()
+    print("api key scheduler: all checks passed")
+
+
+if __name__ == "__main__":
+    main()
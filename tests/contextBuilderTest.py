@@ -0,0 +1,99 @@
+import tiktoken
+
+import utils.tokens
+from src.context_builder import ContextBuilder
+from utils.constants import Constants
+
+# Ranking and trimming of ContextBuilder, offline:
+#   PYTHONPATH=. python tests/contextBuilderTest.py
+# cl100k_base is downloaded on first use, so a byte level encoding (one token
+# per byte) stands in for it; the budgets below are in bytes accordingly.
+utils.tokens._encoding = tiktoken.Encoding(
+    name="bytes",
+    pat_str=r"[\s\S]",
+    mergeable_ranks={bytes([i]): i for i in range(256)},
+    special_tokens={},
+)
+
+HEADER = "Docs:\n"
+GPT_4_BUDGET = 8192 - Constants.ANSWER_MAX_TOKENS
+
+
+def new_builder(question):
+    return ContextBuilder("gpt-4", HEADER, question)
+
+
+def test_fits_whole():
+    builder = new_builder("what is the budget")
+    builder.add_source("files", "short section one\n\nshort section two")
+    context = builder.build()
+    assert "short section one" in context and "short section two" in context
+    assert builder.token_report["sources"]["files"]["sections_kept"] == 2
+
+
+def test_keeps_matching_sections_in_order():
+    filler = "unrelated filler text " * 60
+    sections = [f"{filler} part {i}" for i in range(8)]
+    sections[2] = "the migration budget is approved " + "x" * 1000
+    sections[6] = "budget owner for the migration is finance " + "y" * 1000
+    builder = new_builder("who owns the migration budget")
+    builder.add_source("files", "\n\n".join(sections))
+    context = builder.build()
+    assert len(context) - len(HEADER) <= builder.budget <= GPT_4_BUDGET
+    assert "approved" in context and "finance" in context
+    assert context.index("approved") < context.index("finance")
+    report = builder.token_report["sources"]["files"]
+    assert report["tokens"] <= builder.budget
+    assert 2 <= report["sections_kept"] < len(sections)
+
+
+def test_truncates_file_without_paragraph_breaks():
+    # One huge section used to be dropped whole, leaving only the header.
+    text = "line about the quarterly migration costs\n" * 4000
+    builder = new_builder("what are the migration costs")
+    builder.add_source("files", text)
+    context = builder.build()
+    report = builder.token_report["sources"]["files"]
+    assert report["sections_kept"] == 1 and report["sections_truncated"] == 1
+    # The section and the blank line after it fill the budget exactly.
+    assert report["tokens"] + 2 == builder.budget
+    assert context.startswith(HEADER + "line about the quarterly migration costs")
+
+
+def test_truncates_best_section_and_keeps_it_first():
+    small = "the appendix lists the costs"
+    large = "migration costs per region " * 400
+    builder = new_builder("migration costs per region")
+    builder.add_source("tag:plan", small)
+    builder.add_source("files", large)
+    builder.build()
+    sources = builder.token_report["sources"]
+    assert sources["files"]["sections_truncated"] == 1
+    assert sources["files"]["tokens"] + sources["tag:plan"]["tokens"] <= builder.budget
+
+
+def test_small_section_after_large_one_is_kept():
+    # The large section ranks first but does not fit; the small one still does, and the
+    # large one is then cut to what is left rather than taking the whole budget.
+    large = "migration costs per region " * 400
+    small = "the migration costs are approved by finance"
+    builder = new_builder("migration costs per region")
+    builder.add_source("files", large + "\n\n" + small)
+    context = builder.build()
+    report = builder.token_report["sources"]["files"]
+    assert report["sections_kept"] == 2 and report["sections_truncated"] == 1
+    assert small in context
+    assert len(context) - len(HEADER) <= builder.budget
+
+
+def main():
+    test_fits_whole()
+    test_keeps_matching_sections_in_order()
+    test_truncates_file_without_paragraph_breaks()
+    test_truncates_best_section_and_keeps_it_first()
+    test_small_section_after_large_one_is_kept()
+    print("context builder: all checks passed")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+import time
+
+import chardet
+
+from src.vectorstore.splitting import ENCODINGS, decode_bytes, try_decode
+
+# Micro-benchmark of blob decoding on a corpus of mixed encodings:
+#   PYTHONPATH=. python tests/encodingDetectionBench.py
+REPEAT_LINES = 20000
+
+SAMPLES = {
+    "ascii": ("utf-8", "Quarterly strategy review for the cloud migration programme.\n"),
+    "utf-8": ("utf-8", "Überblick der Kosten – Migration nach Azure, café résumé.\n"),
+    "utf-8-sig": ("utf-8-sig", "Überblick der Kosten – Migration nach Azure.\n"),
+    "utf-16": ("utf-16", "Überblick der Kosten – Migration nach Azure.\n"),
+    "windows-1252": ("windows-1252", "Überblick der Kosten – “Migration” nach Azure, café.\n"),
+    "windows-1251": ("windows-1251", "Обзор стоимости миграции в облако Azure.\n"),
+    "shift_jis": ("shift_jis", "クラウド移行のコストの概要です。\n"),
+}
+
+
+def old_decode(data):
+    """The previous path: chardet over the whole blob, then the fallback list."""
+    encoding = chardet.detect(data)["encoding"]
+    return try_decode(data, [encoding] + ENCODINGS if encoding else ENCODINGS)
+
+
+def main():
+    corpus = []
+    for name, (encoding, line) in SAMPLES.items():
+        # ASCII lines first, so the non-ASCII evidence is not at the start of the file.
+        text = "Header line\n" * 2000 + line * REPEAT_LINES
+        corpus.append((name, text, text.encode(encoding)))
+    total_mb = sum(len(data) for _, _, data in corpus) / 1e6
+    print(f"{len(corpus)} blobs, {total_mb:.1f} MB")
+
+    for label, decode in [("chardet on whole blob", old_decode), ("tiered decoder", decode_bytes)]:
+        started = time.perf_counter()
+        results = [(name, text, decode(data)) for name, text, data in corpus]
+        seconds = time.perf_counter() - started
+        print(f"\n{label}: {seconds:.2f}s ({total_mb / seconds:.1f} MB/s)")
+        for name, text, (decoded, used_encoding) in results:
+            status = "ok" if decoded == text else "MISMATCH"
+            print(f"  {name:<13} -> {used_encoding:<13} {status}")
+
+
+if __name__ == "__main__":
+    main()
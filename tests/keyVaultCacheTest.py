@@ -0,0 +1,206 @@
+import threading
+import time
+from types import SimpleNamespace
+
+from common.api_key_scheduler import ApiKeyScheduler
+from common.key_vault_manager import KeyVaultManager
+from common.service_container import ServiceContainer
+
+# KeyVaultManager secret cache against a fake SecretClient, no Azure access needed:
+#   PYTHONPATH=. python tests/keyVaultCacheTest.py
+LATENCY_SECONDS = 0.1
+
+
+class FakeSecretClient:
+    """In-memory stand-in for azure.keyvault.secrets.SecretClient, with a latency and an outage switch."""
+
+    def __init__(self, secrets):
+        self.secrets = dict(secrets)
+        self.calls = 0
+        self.down = False
+        self._lock = threading.Lock()
+
+    def get_secret(self, name):
+        with self._lock:
+            self.calls += 1
+        time.sleep(LATENCY_SECONDS)
+        if self.down:
+            raise ConnectionError("Key Vault unavailable")
+        return SimpleNamespace(name=name, value=self.secrets[name])
+
+
+def new_manager(client, **kwargs):
+    KeyVaultManager._instance = None
+    return KeyVaultManager.getInstance(client=client, **kwargs)
+
+
+def test_cache_hits():
+    client = FakeSecretClient({"dbPassword": "v1"})
+    manager = new_manager(client)
+    for _ in range(100):
+        assert manager.get_secret("dbPassword") == "v1"
+    assert client.calls == 1
+    print(f"cache hits: 100 reads, {client.calls} Key Vault call")
+
+
+def test_background_refresh():
+    client = FakeSecretClient({"openAIAPIKeyList": "k1"})
+    manager = new_manager(client, ttl_seconds=1.0, refresh_ahead_seconds=0.5)
+    manager.get_secret("openAIAPIKeyList")
+    client.secrets["openAIAPIKeyList"] = "k2"
+    time.sleep(0.6)
+
+    started = time.perf_counter()
+    value = manager.get_secret("openAIAPIKeyList")
+    seconds = time.perf_counter() - started
+    assert value == "k1" and seconds < LATENCY_SECONDS / 2
+    time.sleep(LATENCY_SECONDS * 2)
+    assert manager.get_secret("openAIAPIKeyList") == "k2"
+    assert manager.get_stats()["background_refreshes"] == 1
+    print(f"background refresh: read before expiry took {seconds * 1000:.2f}ms, rotated value picked up")
+
+
+def test_stale_on_error():
+    client = FakeSecretClient({"dbHost": "db.internal"})
+    manager = new_manager(client, ttl_seconds=0.2, refresh_ahead_seconds=0, error_retry_seconds=0.3)
+    manager.get_secret("dbHost")
+    client.down = True
+    time.sleep(0.3)
+    assert manager.get_secret("dbHost") == "db.internal"
+    assert manager.get_stats()["stale_served"] == 1
+
+    # Until the retry delay has passed, reads do not wait on the failing Key Vault again.
+    calls = client.calls
+    for _ in range(10):
+        assert manager.get_secret("dbHost") == "db.internal"
+    assert client.calls == calls
+
+    client.down = False
+    client.secrets["dbHost"] = "db2.internal"
+    time.sleep(0.3)
+    assert manager.get_secret("dbHost") == "db2.internal"
+    print("stale on error: expired value served during the outage, refreshed once Key Vault is back")
+
+
+def test_per_secret_ttl():
+    client = FakeSecretClient({"dbUser": "postgres", "anthropicAPIKeyList": "a1"})
+    manager = new_manager(client)
+    manager.set_ttl("anthropicAPIKeyList", 0.1)
+    manager.prefetch(["dbUser", "anthropicAPIKeyList"])
+    time.sleep(0.2)
+    calls = client.calls
+    manager.get_secret("dbUser")
+    manager.get_secret("anthropicAPIKeyList")
+    assert client.calls == calls + 1
+    print("per secret TTL: only the short-lived secret was read again")
+
+
+def test_prefetch():
+    names = [f"secret{i}" for i in range(8)]
+    client = FakeSecretClient({name: name.upper() for name in names})
+    manager = new_manager(client)
+
+    started = time.perf_counter()
+    values = manager.prefetch(names)
+    seconds = time.perf_counter() - started
+    assert values == {name: name.upper() for name in names}
+    assert seconds < LATENCY_SECONDS * 3
+
+    calls = client.calls
+    manager.prefetch(names)
+    assert client.calls == calls
+    print(
+        f"prefetch: {len(names)} secrets in {seconds:.2f}s "
+        f"(vs {len(names) * LATENCY_SECONDS:.2f}s one by one), second prefetch served from cache"
+    )
+
+
+def test_outage_without_cache():
+    client = FakeSecretClient({"dbPort": "5432"})
+    client.down = True
+    manager = new_manager(client)
+    try:
+        manager.get_secret("dbPort")
+    except ConnectionError:
+        print("cold cache outage: the error is raised, as there is nothing to serve")
+    else:
+        raise AssertionError("expected the Key Vault error")
+
+
+def test_outage_backs_off():
+    client = FakeSecretClient({"openAIAPIKeyList": "k1"})
+    manager = new_manager(client, ttl_seconds=0.5, refresh_ahead_seconds=0.4, error_retry_seconds=0.3)
+    manager.get_secret("openAIAPIKeyList")
+    client.down = True
+    time.sleep(0.15)
+
+    # Reads in the refresh-ahead window and past expiry, during an outage of about 1s.
+    calls = client.calls
+    started = time.monotonic()
+    reads = 0
+    while time.monotonic() - started < 1.0:
+        assert manager.get_secret("openAIAPIKeyList") == "k1"
+        reads += 1
+        time.sleep(0.005)
+    outage_calls = client.calls - calls
+    # One attempt per error_retry_seconds at most, plus the one in flight at the start.
+    assert outage_calls <= 1.0 / 0.3 + 2, outage_calls
+    print(f"outage back-off: {reads} reads during the outage, {outage_calls} Key Vault calls")
+
+
+def test_single_flight():
+    client = FakeSecretClient({"dbPassword": "v1"})
+    manager = new_manager(client)
+    threads = [threading.Thread(target=manager.get_secret, args=("dbPassword",)) for _ in range(20)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert client.calls == 1
+    print(f"single flight: 20 concurrent cold reads, {client.calls} Key Vault call")
+
+
+def test_rotation_reaches_services():
+    client = FakeSecretClient({"openAIAPIKeyList": "k1,k2", "openAIAPIKey": "e1"})
+    new_manager(client, ttl_seconds=0.3, refresh_ahead_seconds=0)
+    ServiceContainer._instance = None
+    services = ServiceContainer.getInstance()
+
+    services.register(
+        "scheduler",
+        lambda: ApiKeyScheduler("openai", key_source=lambda: services.get_secret("openAIAPIKeyList").split(",")),
+        secrets=["openAIAPIKeyList"],
+        rebuild=False,
+        refresh=lambda scheduler: scheduler.reload_keys(),
+    )
+    services.register("embedding", lambda: {"api_key": services.get_secret("openAIAPIKey")}, secrets=["openAIAPIKey"])
+    services.register("search", lambda: {"embedding": services.get("embedding")}, depends=("embedding",))
+    search = services.get("search")
+    scheduler = services.get("scheduler")
+    assert search["embedding"]["api_key"] == "e1"
+    assert {scheduler.acquire(), scheduler.acquire()} == {"k1", "k2"}
+
+    client.secrets.update({"openAIAPIKeyList": "k3", "openAIAPIKey": "e2"})
+    time.sleep(0.4)
+    # Requests never wait on Key Vault: until the rotation check runs they keep the built services.
+    calls = client.calls
+    assert services.get("search") is search and scheduler.acquire() in ("k1", "k2")
+    assert client.calls == calls
+
+    retired = services.check_rotations()
+    assert sorted(name for name, _ in retired) == ["embedding", "search"]
+    assert scheduler.acquire() == "k3"
+    assert services.get("search")["embedding"]["api_key"] == "e2"
+    print("rotation: checked in the background, scheduler uses the new key list, embedding and dependents rebuilt")
+
+
+if __name__ == "__main__":
+    test_cache_hits()
+    test_background_refresh()
+    test_stale_on_error()
+    test_per_secret_ttl()
+    test_prefetch()
+    test_outage_without_cache()
+    test_outage_backs_off()
+    test_single_flight()
+    test_rotation_reaches_services()
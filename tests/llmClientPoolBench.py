@@ -0,0 +1,93 @@
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+from langchain_openai import ChatOpenAI
+
+from common.llm_client_manager import LLMClientManager
+
+# Delay added to every new connection to stand in for the TLS handshake
+# (and TCP round trip) a real provider costs.
+HANDSHAKE_DELAY_SECONDS = 0.05
+REQUESTS = 50
+
+
+class MockOpenAIHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def setup(self):
+        time.sleep(HANDSHAKE_DELAY_SECONDS)
+        super().setup()
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        chunk = {
+            "id": "chatcmpl-mock",
+            "object": "chat.completion.chunk",
+            "created": int(time.time()),
+            "model": body["model"],
+            "choices": [
+                {"index": 0, "delta": {"role": "assistant", "content": "pong"}, "finish_reason": None}
+            ],
+        }
+        done = dict(chunk, choices=[{"index": 0, "delta": {}, "finish_reason": "stop"}])
+        payload = f"data: {json.dumps(chunk)}\n\ndata: {json.dumps(done)}\n\ndata: [DONE]\n\n".encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+
+async def run_fresh_clients(base_url):
+    """The old behaviour: a new ChatOpenAI, and so a new connection pool, per request."""
+    started = time.perf_counter()
+    for _ in range(REQUESTS):
+        async with httpx.AsyncClient() as http_async_client:
+            llm = ChatOpenAI(
+                model="gpt-4",
+                api_key="sk-mock",
+                base_url=base_url,
+                streaming=True,
+                http_client=httpx.Client(),
+                http_async_client=http_async_client,
+            )
+            await llm.ainvoke("ping")
+    return (time.perf_counter() - started) / REQUESTS
+
+
+async def run_pooled_clients(base_url):
+    llm_client_manager = LLMClientManager.getInstance()
+    started = time.perf_counter()
+    for _ in range(REQUESTS):
+        llm = llm_client_manager.get_chat_openai("gpt-4", "sk-mock", base_url=base_url)
+        await llm.ainvoke("ping")
+    elapsed = (time.perf_counter() - started) / REQUESTS
+    await llm_client_manager.aclose()
+    return elapsed
+
+
+def llm_client_pool_benchmark():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), MockOpenAIHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}/v1"
+
+    fresh_latency = asyncio.run(run_fresh_clients(base_url))
+    pooled_latency = asyncio.run(run_pooled_clients(base_url))
+    server.shutdown()
+
+    print(f"Fresh client per request: {fresh_latency * 1000:.1f} ms/request")
+    print(f"Pooled client registry:   {pooled_latency * 1000:.1f} ms/request")
+    print(f"Saved per request:        {(fresh_latency - pooled_latency) * 1000:.1f} ms")
+    print(f"Registry stats: {LLMClientManager.getInstance().get_stats()}")
+
+
+if __name__ == "__main__":
+    llm_client_pool_benchmark()
@@ -0,0 +1,90 @@
+import threading
+import time
+
+import requests
+from enums.model import *
+
+# Run against a live server: uvicorn stream:app --host 0.0.0.0 --port 8000
+url = "http://localhost:8000/chat_stream/"
+headers = {"Content-Type": "application/json"}
+
+
+def build_request(model, question):
+    return {
+        "messages": [{"role": "user", "content": question}],
+        "tags": [],
+        "model": model,
+        "temperature": 0,
+        "max_tokens": 0,
+        "top_p": 0,
+        "frequency_penalty": 0,
+        "presence_penalty": 0,
+        "files": [],
+    }
+
+
+def timed_stream(data, results, key):
+    """Streams one request and records the arrival time of every chunk."""
+    started = time.perf_counter()
+    arrivals = []
+    response = requests.post(url, json=data, headers=headers, stream=True)
+    for chunk in response.iter_content(chunk_size=None):
+        if chunk:
+            arrivals.append(time.perf_counter() - started)
+    results[key] = arrivals
+
+
+def max_gap(arrivals):
+    if len(arrivals) < 2:
+        return 0.0
+    return max(later - earlier for earlier, later in zip(arrivals, arrivals[1:]))
+
+
+def nh_qa_concurrency_benchmark(background_streams=3):
+    """
+    Starts several GPT-4 streams, then fires an nh-qa request while they are
+    flowing. If the nh-qa retrieval blocked the event loop, every background
+    stream would show a gap as long as the retrieval itself.
+    """
+    results = {}
+    threads = [
+        threading.Thread(
+            target=timed_stream,
+            args=(
+                build_request(OpenAIModel.GPT_4.value, "Write 300 words about supply chains"),
+                results,
+                f"gpt-4-{i}",
+            ),
+        )
+        for i in range(background_streams)
+    ]
+    for thread in threads:
+        thread.start()
+
+    time.sleep(2)
+    nh_qa_results = {}
+    nh_qa_started = time.perf_counter()
+    timed_stream(
+        build_request(OpenAIModel.NH_QA.value, "Tell me about IT Procurement"),
+        nh_qa_results,
+        "nh-qa",
+    )
+    nh_qa_arrivals = nh_qa_results["nh-qa"]
+    retrieval_time = nh_qa_arrivals[0] if nh_qa_arrivals else time.perf_counter() - nh_qa_started
+
+    for thread in threads:
+        thread.join()
+
+    print(f"nh-qa time to sources: {retrieval_time:.2f}s")
+    for key, arrivals in sorted(results.items()):
+        print(f"{key}: {len(arrivals)} chunks, max inter-chunk gap {max_gap(arrivals):.2f}s")
+    worst_gap = max((max_gap(arrivals) for arrivals in results.values()), default=0.0)
+    print(
+        "Other streams kept flowing"
+        if worst_gap < retrieval_time
+        else "Other streams stalled while nh-qa retrieval was in flight"
+    )
+
+
+if __name__ == "__main__":
+    nh_qa_concurrency_benchmark()
@@ -0,0 +1,88 @@
+import asyncio
+
+from langchain_core.language_models import FakeListChatModel
+from langchain_core.messages import AIMessage, HumanMessage
+
+from nh.question_rewriter import QuestionRewriter
+
+# Skip heuristic, variant parsing and caching of the nh-qa question rewriter, with a fake LLM:
+#   PYTHONPATH=. python tests/questionRewriterTest.py
+HISTORY = [
+    HumanMessage(content="Which regions does the migration plan cover?"),
+    AIMessage(content="West Europe and North Europe."),
+]
+
+
+def new_rewriter(responses):
+    llm = FakeListChatModel(responses=responses)
+    return QuestionRewriter(lambda: llm, variants=3)
+
+
+def test_skip_heuristic():
+    standalone = "What is the total budget of the Azure migration programme?"
+    assert QuestionRewriter.is_standalone(standalone, [])
+    assert QuestionRewriter.is_standalone(standalone, HISTORY)
+    assert QuestionRewriter.is_standalone("Budget?", [])
+    # Short or referring questions need the history.
+    assert not QuestionRewriter.is_standalone("And the costs?", HISTORY)
+    assert not QuestionRewriter.is_standalone("What is the total budget of it for next year?", HISTORY)
+    assert not QuestionRewriter.is_standalone("How about the previous quarter for those regions?", HISTORY)
+
+    # The latest question is part of the history built by get_history_question.
+    question = "And the costs?"
+    assert QuestionRewriter.prior_history(question, HISTORY + [HumanMessage(content=question)]) == HISTORY
+
+
+def test_skips_llm_for_standalone_question():
+    rewriter = new_rewriter([])
+    question = "What is the total budget of the Azure migration programme?"
+    assert rewriter.rewrite(question, HISTORY) == (question, [question])
+    stats = rewriter.get_stats()
+    assert stats["skipped"] == 1 and stats["llm_calls"] == 0
+
+
+def test_parses_variants():
+    output = (
+        'Sure, here it is: {"standalone_question": "What do the migration regions cost?", '
+        '"variants": ["Cost of West Europe", "Cost of North Europe", "What do the migration regions cost?", '
+        '"Regional pricing", "Extra variant"]}'
+    )
+    rewriter = new_rewriter([output])
+    question, queries = rewriter.rewrite("And the costs?", HISTORY, with_variants=True)
+    assert question == "What do the migration regions cost?"
+    # Duplicates go, and at most `variants` variants follow the standalone question.
+    assert queries == [question, "Cost of West Europe", "Cost of North Europe"]
+
+
+def test_bad_json_falls_back_to_question():
+    rewriter = new_rewriter(["not json at all", '{"standalone_question": '])
+    assert rewriter.rewrite("And the costs?", HISTORY, with_variants=True) == (
+        "And the costs?",
+        ["And the costs?"],
+    )
+    assert rewriter.get_stats()["parse_failures"] == 1
+    # A failed parse is not cached.
+    assert rewriter.rewrite("And the costs?", HISTORY, with_variants=True)[0] == "And the costs?"
+    assert rewriter.get_stats()["llm_calls"] == 2
+
+
+def test_caches_rewrites():
+    rewriter = new_rewriter(["What do the migration regions cost?"])
+    first = asyncio.run(rewriter.arewrite("And the costs?", HISTORY))
+    second = asyncio.run(rewriter.arewrite("And the costs?", HISTORY))
+    assert first == second == ("What do the migration regions cost?", ["What do the migration regions cost?"])
+    stats = rewriter.get_stats()
+    assert stats["llm_calls"] == 1 and stats["cache_hits"] == 1
+
+
+def main():
+    test_skip_heuristic()
+    test_skips_llm_for_standalone_question()
+    test_parses_variants()
+    test_bad_json_falls_back_to_question()
+    test_caches_rewrites()
+    print("question rewriter: all checks passed")
+
+
+if __name__ == "__main__":
+    main()
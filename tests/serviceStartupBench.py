@@ -0,0 +1,108 @@
+import threading
+import time
+from types import SimpleNamespace
+
+from fastapi.testclient import TestClient
+from langchain_core.embeddings import FakeEmbeddings
+
+from common.key_vault_manager import KeyVaultManager
+from common.service_container import ServiceContainer
+from src.vectorstore.embedding_cache import CachedEmbeddings
+from utils.constants import Constants, KeyVaultSecretKeys
+
+# Cold start of the app against local stand-ins for Key Vault, no Azure access needed:
+#   PYTHONPATH=. python tests/serviceStartupBench.py
+SECRET_LATENCY_SECONDS = 0.15
+STAND_IN_SECRETS = {
+    KeyVaultSecretKeys.ANTHROPIC_KEY_LIST: "sk-ant-standin-1,sk-ant-standin-2",
+    KeyVaultSecretKeys.AZURE_STORAGE_CONTAINER_CONNECTION_STRING: (
+        "DefaultEndpointsProtocol=https;AccountName=standin;"
+        "AccountKey=c3RhbmRpbg==;EndpointSuffix=core.windows.net"
+    ),
+    KeyVaultSecretKeys.OPENAI_API_KEY: "sk-standin",
+    KeyVaultSecretKeys.OPENAI_API_KEY_LIST: "sk-standin-1,sk-standin-2",
+    KeyVaultSecretKeys.POSTGRES_HOST: "localhost",
+    KeyVaultSecretKeys.POSTGRES_PORT: "5432",
+    KeyVaultSecretKeys.POSTGRES_USER: "postgres",
+    KeyVaultSecretKeys.POSTGRES_PASSWORD: "postgres",
+}
+
+
+class StandInSecretClient:
+    """Answers get_secret after a fixed latency, like a Key Vault round trip, and can fail on demand."""
+
+    def __init__(self, failures=0):
+        self.failures = failures
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def get_secret(self, name):
+        with self._lock:
+            self.calls += 1
+            failing = self.failures > 0
+        time.sleep(SECRET_LATENCY_SECONDS)
+        if failing:
+            raise ConnectionError("Key Vault unavailable")
+        return SimpleNamespace(value=STAND_IN_SECRETS[name])
+
+
+def use_key_vault(client):
+    """Points the process at a fresh KeyVaultManager (with an empty cache) over the given client."""
+    KeyVaultManager._instance = None
+    return KeyVaultManager.getInstance(client=client)
+
+
+def main():
+    key_vault = StandInSecretClient()
+    use_key_vault(key_vault)
+    services = ServiceContainer.getInstance()
+
+    started = time.perf_counter()
+    import stream
+
+    import_seconds = time.perf_counter() - started
+    print(f"import stream: {import_seconds:.2f}s, {key_vault.calls} Key Vault calls")
+    # Stand-in embeddings, so the run does not depend on the OpenAI client of the local environment
+    services.register(
+        "embedding",
+        lambda: CachedEmbeddings(FakeEmbeddings(size=Constants.VECTOR_DIMENSIONS), sqlite_path=None),
+        eager=True,
+    )
+
+    secret_count = len(services._secret_names)
+    print(
+        f"{secret_count} secrets fetched one by one (the old import path): "
+        f">= {secret_count * SECRET_LATENCY_SECONDS:.2f}s of Key Vault round trips alone"
+    )
+
+    started = time.perf_counter()
+    with TestClient(stream.app) as client:
+        startup_seconds = time.perf_counter() - started
+        response = client.get("/ready/")
+        print(
+            f"lifespan startup: {startup_seconds:.2f}s, {key_vault.calls} Key Vault calls, "
+            f"/ready/ -> {response.status_code}"
+        )
+        print(f"service build seconds: {response.json()['services']}")
+        assert response.status_code == 200
+
+    # A Key Vault outage at a cold start: the app stays up, not ready, and recovers in the background.
+    Constants.STARTUP_RETRY_SECONDS = 0.5
+    key_vault = StandInSecretClient(failures=1)
+    use_key_vault(key_vault)
+    with TestClient(stream.app) as client:
+        status = client.get("/ready/").status_code
+        key_vault.failures = 0
+        deadline = time.monotonic() + 10
+        while time.monotonic() < deadline and client.get("/ready/").status_code != 200:
+            time.sleep(0.1)
+        readiness = client.get("/ready/").json()
+        print(
+            f"Key Vault outage: /ready/ -> {status} while down, "
+            f"ready={readiness['ready']} after {readiness['startup_attempts']} attempts"
+        )
+        assert status == 503 and readiness["ready"]
+
+
+if __name__ == "__main__":
+    main()
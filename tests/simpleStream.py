@@ -1,3 +1,5 @@
+import json
+
 import requests
 from enums.model import *
 
@@ -28,11 +30,21 @@ def claude3opus_test():
     data["model"] = OpenAIModel.CLAUDE_3_OPUS.value
 
 def test_ai():
+    # The response is server-sent events: "event: <type>" then "data: <json>" per message
     response = requests.post(url, json=data, headers=headers, stream=True)
     full_response = ""
+    event = None
     for line in response.iter_lines():
-        if line:
-            full_response += line.decode('utf-8')
+        line = line.decode('utf-8')
+        if line.startswith("event: "):
+            event = line[len("event: "):]
+        elif line.startswith("data: "):
+            payload = json.loads(line[len("data: "):])
+            if event == "token":
+                full_response += payload
+            elif event == "error":
+                print(payload["message"])
+    print(full_response)
 
 gpt4_test()
 test_ai()
\ No newline at end of file
@@ -0,0 +1,161 @@
+import asyncio
+import json
+import time
+
+from langchain_core.embeddings import FakeEmbeddings
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessageChunk
+from langchain_core.outputs import ChatGenerationChunk
+
+from common.key_vault_manager import KeyVaultManager
+from enums.model import OpenAIModel
+from src.vectorstore.embedding_cache import CachedEmbeddings
+from tests.serviceStartupBench import StandInSecretClient
+from utils.constants import Constants
+
+# Tokens an LLM keeps generating (and billing) after the client of /chat_stream/ went away,
+# against a stand-in model that, like a real provider, generates until its connection closes:
+#   PYTHONPATH=. python tests/sseDisconnectTest.py
+ANSWER_TOKENS = 400
+TOKEN_SECONDS = 0.005
+DISCONNECT_AFTER_TOKENS = 50
+
+
+class UpstreamMeter:
+    generated = 0
+    closed_at = None
+
+
+class StandInChatModel(BaseChatModel):
+    @property
+    def _llm_type(self):
+        return "stand-in"
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs):
+        raise NotImplementedError
+
+    async def _astream(self, messages, stop=None, run_manager=None, **kwargs):
+        queue = asyncio.Queue()
+
+        async def generate():
+            for i in range(ANSWER_TOKENS):
+                await asyncio.sleep(TOKEN_SECONDS)
+                UpstreamMeter.generated += 1
+                queue.put_nowait(f"tok{i} ")
+            queue.put_nowait(None)
+
+        generator = asyncio.create_task(generate())
+        try:
+            while True:
+                token = await queue.get()
+                if token is None:
+                    break
+                yield ChatGenerationChunk(message=AIMessageChunk(content=token))
+        finally:
+            # Closing the stream is what stops the provider
+            generator.cancel()
+            UpstreamMeter.closed_at = time.perf_counter()
+
+
+def parse_events(body):
+    events = []
+    for message in body.decode("utf-8").split("\n\n"):
+        if not message:
+            continue
+        fields = dict(line.split(": ", 1) for line in message.split("\n"))
+        events.append((fields["event"], json.loads(fields["data"])))
+    return events
+
+
+async def call_chat_stream(app, disconnect_after_tokens=None):
+    """Drives /chat_stream/ through ASGI directly, with a client that can hang up mid-stream."""
+    body = json.dumps(
+        {"messages": [{"role": "user", "content": "Tell me a long story"}], "tags": [], "model": OpenAIModel.GPT_4.value, "files": []}
+    ).encode("utf-8")
+    disconnected = asyncio.Event()
+    received = {"body": b"", "writes": 0, "tokens": 0, "generated_at_disconnect": None}
+    request_sent = False
+
+    async def receive():
+        nonlocal request_sent
+        if not request_sent:
+            request_sent = True
+            return {"type": "http.request", "body": body, "more_body": False}
+        await disconnected.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        if message["type"] != "http.response.body" or not message.get("body"):
+            return
+        if disconnected.is_set():
+            raise OSError("client disconnected")
+        received["body"] += message["body"]
+        received["writes"] += 1
+        received["tokens"] = sum(
+            len(data.split()) for event, data in parse_events(received["body"]) if event == "token"
+        )
+        if disconnect_after_tokens is not None and received["tokens"] >= disconnect_after_tokens:
+            received["generated_at_disconnect"] = UpstreamMeter.generated
+            received["disconnected_at"] = time.perf_counter()
+            disconnected.set()
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0", "spec_version": "2.3"},
+        "http_version": "1.1",
+        "method": "POST",
+        "scheme": "http",
+        "path": "/chat_stream/",
+        "raw_path": b"/chat_stream/",
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(b"content-type", b"application/json")],
+        "client": ("127.0.0.1", 50000),
+        "server": ("127.0.0.1", 8000),
+    }
+    try:
+        await app(scope, receive, send)
+    except OSError:
+        pass
+    return received
+
+
+async def main():
+    KeyVaultManager.getInstance(client=StandInSecretClient())
+    import stream
+
+    stream.services.register(
+        "embedding",
+        lambda: CachedEmbeddings(FakeEmbeddings(size=Constants.VECTOR_DIMENSIONS), sqlite_path=None),
+        eager=True,
+    )
+    stream.llm_client_manager.get_chat_openai = lambda model, api_key: StandInChatModel()
+    await stream.services.start()
+
+    UpstreamMeter.generated = 0
+    received = await call_chat_stream(stream.app)
+    events = parse_events(received["body"])
+    print(
+        f"full stream: {received['tokens']} tokens in {received['writes']} writes, "
+        f"event types {sorted({event for event, _ in events})}, last event {events[-1][0]}"
+    )
+    assert received["tokens"] == ANSWER_TOKENS and events[-1][0] == "done"
+
+    UpstreamMeter.generated = 0
+    UpstreamMeter.closed_at = None
+    received = await call_chat_stream(stream.app, disconnect_after_tokens=DISCONNECT_AFTER_TOKENS)
+    await asyncio.sleep(ANSWER_TOKENS * TOKEN_SECONDS * 2)
+    wasted = UpstreamMeter.generated - received["generated_at_disconnect"]
+    remaining = ANSWER_TOKENS - received["generated_at_disconnect"]
+    closed_ms = (UpstreamMeter.closed_at - received["disconnected_at"]) * 1000 if UpstreamMeter.closed_at else None
+    print(
+        f"disconnect after {received['tokens']} tokens: upstream generated {wasted} more tokens "
+        f"(of {remaining} left without cancellation), upstream closed {closed_ms:.1f}ms after the disconnect"
+    )
+    assert wasted < remaining / 4
+    print(f"sse stats: {stream.stream_stats}")
+    await stream.services.stop()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,58 @@
+import random
+import time
+import tracemalloc
+
+from src.vectorstore.splitting import RANGE_BYTES, iter_split_ranges, split_documents_from_bytes
+
+# Peak memory of splitting a blob whole vs in streamed ranges, as the blob grows:
+#   PYTHONPATH=. python tests/streamingSplitMemoryBench.py
+BLOB_SIZES_MB = [4, 16, 32]
+WORDS = ["strategy", "cloud", "migration", "Überblick", "pricing", "data", "café", "team", "roadmap"]
+
+
+def blob_ranges(size_bytes, seed=0):
+    """Yields a synthetic UTF-8 text blob RANGE_BYTES at a time, like ranged blob reads."""
+    rng = random.Random(seed)
+    pending = b""
+    produced = 0
+    while produced < size_bytes:
+        while len(pending) < RANGE_BYTES:
+            paragraph = " ".join(rng.choice(WORDS) for _ in range(rng.choice([20, 80, 250])))
+            pending += (paragraph + "\n\n").encode("utf-8")
+        data, pending = pending[: min(RANGE_BYTES, size_bytes - produced)], pending[RANGE_BYTES:]
+        produced += len(data)
+        yield data
+
+
+def whole_blob(size_bytes):
+    # readall(): the whole blob is in memory before splitting starts.
+    raw_data = b"".join(blob_ranges(size_bytes))
+    return len(split_documents_from_bytes("bench.txt", raw_data))
+
+
+def streamed_blob(size_bytes):
+    # Chunks are consumed (here: counted) as they come, like the ingestion queues do.
+    return sum(1 for _ in iter_split_ranges("bench.txt", blob_ranges(size_bytes)))
+
+
+def measure(function, size_bytes):
+    tracemalloc.start()
+    started = time.perf_counter()
+    chunks = function(size_bytes)
+    seconds = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return chunks, peak / 1e6, seconds
+
+
+def main():
+    print(f"{'blob':>8} {'path':<10} {'chunks':>8} {'peak MB':>9} {'seconds':>8}")
+    for size_mb in BLOB_SIZES_MB:
+        size_bytes = size_mb * 1024 * 1024
+        for label, function in [("whole", whole_blob), ("streamed", streamed_blob)]:
+            chunks, peak_mb, seconds = measure(function, size_bytes)
+            print(f"{size_mb:>6}MB {label:<10} {chunks:>8} {peak_mb:>9.1f} {seconds:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+import os
+import signal
+import statistics
+import subprocess
+import sys
+import threading
+import time
+
+import requests
+
+from enums.model import OpenAIModel
+
+# Throughput of the app with 1 vs N uvicorn workers, against local stand-ins for Key Vault,
+# the embeddings and the chat model, so only the CPU work of the app itself is measured
+# (history and prompt token counting, context trimming, streaming):
+#   PYTHONPATH=. python tests/workerThroughputBench.py
+# The workers import this module and build the app with create_app().
+PORT = 8765
+URL = f"http://127.0.0.1:{PORT}"
+WORKER_COUNTS = [1, int(os.environ.get("BENCH_WORKERS", max(2, os.cpu_count() or 1)))]
+CLIENTS = 16
+REQUESTS_PER_CLIENT = 10
+ANSWER_WORDS = 200
+DRAIN_TOKEN_DELAY_SECONDS = 0.02
+
+
+def create_app():
+    from langchain_core.embeddings import FakeEmbeddings
+    from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+    from langchain_core.messages import AIMessage
+
+    from common.key_vault_manager import KeyVaultManager
+    from src.vectorstore.embedding_cache import CachedEmbeddings
+    from tests.serviceStartupBench import StandInSecretClient
+    from utils.constants import Constants
+
+    token_delay = float(os.environ.get("STAND_IN_TOKEN_DELAY_SECONDS", "0"))
+
+    class StandInChatModel(GenericFakeChatModel):
+        def _stream(self, *args, **kwargs):
+            for chunk in super()._stream(*args, **kwargs):
+                time.sleep(token_delay)
+                yield chunk
+
+    KeyVaultManager.getInstance(client=StandInSecretClient())
+    import stream
+
+    stream.services.register(
+        "embedding",
+        lambda: CachedEmbeddings(FakeEmbeddings(size=Constants.VECTOR_DIMENSIONS), sqlite_path=None),
+        eager=True,
+    )
+    answer = " ".join(f"word{i}" for i in range(ANSWER_WORDS))
+    stream.llm_client_manager.get_chat_openai = lambda model, api_key: StandInChatModel(
+        messages=iter([AIMessage(content=answer)])
+    )
+    return stream.app
+
+
+def build_request(turn):
+    history = []
+    for i in range(6):
+        history.append({"role": "user", "content": f"Question {turn}-{i} about the digital twins " * 40})
+        history.append({"role": "assistant", "content": f"Answer {turn}-{i} on operating models " * 80})
+    history.append({"role": "user", "content": f"How do the engagement and data driven twins relate? ({turn})"})
+    return {
+        "messages": history,
+        "tags": [
+            {"id": "data_driven_digital_twin", "displayName": "Data driven"},
+            {"id": "knowledge_management_digital_twin", "displayName": "Knowledge management"},
+        ],
+        "model": OpenAIModel.GPT_4.value,
+        "files": [],
+    }
+
+
+def start_server(workers, token_delay=0.0):
+    env = dict(os.environ, STAND_IN_TOKEN_DELAY_SECONDS=str(token_delay), UVICORN_TIMEOUT_GRACEFUL_SHUTDOWN="30")
+    server = subprocess.Popen(
+        [
+            sys.executable, "-m", "uvicorn", "tests.workerThroughputBench:create_app", "--factory",
+            "--port", str(PORT), "--workers", str(workers), "--log-level", "warning",
+        ],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    deadline = time.monotonic() + 120
+    while time.monotonic() < deadline:
+        try:
+            if requests.get(f"{URL}/ready/", timeout=1).status_code == 200:
+                # Every worker has to be up, not only the first one to answer
+                time.sleep(2 + workers * 0.5)
+                return server
+        except requests.ConnectionError:
+            pass
+        time.sleep(0.5)
+    server.kill()
+    raise RuntimeError("Server did not become ready")
+
+
+def stop_server(server):
+    server.send_signal(signal.SIGTERM)
+    server.wait(timeout=60)
+
+
+def stream_request(session, turn):
+    started = time.perf_counter()
+    response = session.post(f"{URL}/chat_stream/", json=build_request(turn), stream=True)
+    body = b"".join(response.iter_content(chunk_size=None))
+    return time.perf_counter() - started, body
+
+
+def client(latencies, client_id):
+    with requests.Session() as session:
+        for i in range(REQUESTS_PER_CLIENT):
+            seconds, _ = stream_request(session, client_id * REQUESTS_PER_CLIENT + i)
+            latencies.append(seconds)
+
+
+def measure(workers):
+    server = start_server(workers)
+    try:
+        latencies = []
+        started = time.perf_counter()
+        threads = [threading.Thread(target=client, args=(latencies, i)) for i in range(CLIENTS)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - started
+    finally:
+        stop_server(server)
+    latencies.sort()
+    print(
+        f"{workers} worker(s): {len(latencies) / elapsed:6.1f} req/s  "
+        f"p50={statistics.median(latencies) * 1000:7.1f}ms  p95={latencies[int(len(latencies) * 0.95)] * 1000:7.1f}ms"
+    )
+    return len(latencies) / elapsed
+
+
+def drain_check(workers):
+    """SIGTERM while a stream is in flight: the stream has to finish, not be cut."""
+    server = start_server(workers, token_delay=DRAIN_TOKEN_DELAY_SECONDS)
+    result = {}
+
+    def run():
+        with requests.Session() as session:
+            result["seconds"], result["body"] = stream_request(session, 0)
+
+    thread = threading.Thread(target=run)
+    thread.start()
+    time.sleep(1)
+    stop_server(server)
+    thread.join()
+    complete = f"word{ANSWER_WORDS - 1}".encode() in result["body"]
+    print(f"graceful drain: SIGTERM 1s into a {result['seconds']:.1f}s stream, stream completed={complete}")
+
+
+if __name__ == "__main__":
+    throughput = [measure(workers) for workers in WORKER_COUNTS]
+    print(f"speedup with {WORKER_COUNTS[-1]} workers: {throughput[-1] / throughput[0]:.2f}x")
+    drain_check(WORKER_COUNTS[-1])
@@ -1,37 +1,96 @@
-import os
+import asyncio
+import multiprocessing
 import re
-import uuid
-
-from llama_index.core import SimpleDirectoryReader
+from concurrent.futures import ProcessPoolExecutor
 
 from common.azure_blob_client_manager import AzureBlobClientManager
+from utils.constants import Constants
+from utils.extraction import parse_timings, timed_extract_documents
+from utils.text_cache import ExtractedTextCache
+
+text_cache = ExtractedTextCache.getInstance()
 
-container_client = AzureBlobClientManager.getInstance().get_container_client()
+_parse_executor = None
 
 
-def get_blob_files(container_client, prefix):
-    blob_list = container_client.list_blobs(name_starts_with=prefix)
-    return [blob.name for blob in blob_list]
+def get_parse_executor():
+    global _parse_executor
+    if _parse_executor is None:
+        # Spawned, not forked: the web worker already runs the event loop and client threads,
+        # whose locks a forked child could inherit held.
+        _parse_executor = ProcessPoolExecutor(
+            max_workers=Constants.BLOB_PARSE_WORKERS, mp_context=multiprocessing.get_context("spawn")
+        )
+    return _parse_executor
 
 
-def get_content_from_azure_blob(list_files):
-    folder_name = str(uuid.uuid4())
-    os.makedirs(f"/tmp/{folder_name}")
+async def aget_blob_properties(async_container_client, prefix):
+    return [
+        blob
+        async for blob in async_container_client.list_blobs(name_starts_with=prefix)
+    ]
 
-    for file_object in list_files:
-        file_name = str(file_object.split("/")[-1])
-        print(f"Downloading file {file_object} ...")
-        blob_client = container_client.get_blob_client(file_object)
-        raw_data = blob_client.download_blob().readall()
-        with open(f"/tmp/{folder_name}/{file_name}", "wb") as file:
-            file.write(raw_data)
 
-    documents = SimpleDirectoryReader(f"/tmp/{folder_name}").load_data()
+def parse_blob_text(blob_name, raw_data):
+    file_name = str(blob_name.split("/")[-1])
+    documents, extension, seconds = timed_extract_documents(file_name, raw_data)
 
+    cleaned_file_name = re.sub(r"\b\w{26}_", "", file_name)
     text = ""
-    for doc in documents:
-        cleaned_file_name =  re.sub(r"\b\w{26}_", "", doc.metadata["file_name"])
+    for doc_text in documents:
         text += cleaned_file_name + "\n"
-        text += doc.text.replace("\x00", "") + "\n\n"
+        text += doc_text.replace("\x00", "") + "\n\n"
+
+    return text, extension, seconds
+
+
+async def aget_blob_text(async_container_client, blob_properties, download_semaphore):
+    """Returns the extracted text of a blob, downloading and parsing it only on a cache miss."""
+    cache_key = ExtractedTextCache.cache_key(
+        blob_properties.name, blob_properties.etag, blob_properties.last_modified
+    )
+    text = await asyncio.to_thread(text_cache.get, cache_key)
+    if text is not None:
+        return text
 
+    async with download_semaphore:
+        print(f"Downloading file {blob_properties.name} ...")
+        blob_client = async_container_client.get_blob_client(blob_properties.name)
+        downloader = await blob_client.download_blob()
+        raw_data = await downloader.readall()
+
+    loop = asyncio.get_running_loop()
+    text, extension, seconds = await loop.run_in_executor(
+        get_parse_executor(), parse_blob_text, blob_properties.name, raw_data
+    )
+    parse_timings.record(extension, seconds)
+    await asyncio.to_thread(text_cache.put, cache_key, text)
     return text
+
+
+async def aget_content_from_blob_properties(async_container_client, list_properties):
+    """
+    Downloads and parses all blobs concurrently, with at most
+    BLOB_DOWNLOAD_CONCURRENCY downloads in flight. The text is joined in file
+    name order, whatever order the downloads finish in.
+    """
+    list_properties = sorted(list_properties, key=lambda blob: blob.name.split("/")[-1])
+    download_semaphore = asyncio.Semaphore(Constants.BLOB_DOWNLOAD_CONCURRENCY)
+    texts = await asyncio.gather(
+        *(
+            aget_blob_text(async_container_client, blob_properties, download_semaphore)
+            for blob_properties in list_properties
+        )
+    )
+    return "".join(texts)
+
+
+async def aget_content_from_azure_blob(list_files):
+    async_container_client = AzureBlobClientManager.getInstance().get_async_container_client()
+    list_properties = await asyncio.gather(
+        *(
+            async_container_client.get_blob_client(file_object).get_blob_properties()
+            for file_object in list_files
+        )
+    )
+    return await aget_content_from_blob_properties(async_container_client, list_properties)
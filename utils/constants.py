@@ -1,3 +1,6 @@
+import os
+
+
 class Constants:
     # DEV/Test Environment
     # DATABASE_NAME = "NHChat"
@@ -13,6 +16,128 @@ class Constants:
     KEY_VAULT_NAME = "ai-coe-prod-kv"
     LLM_CONTAINER_NAME = "ai-coe-llm"
 
+    # Tokens reserved for the model answer when budgeting the prompt
+    ANSWER_MAX_TOKENS = 4000
+
+    # Extracted blob text cache
+    TEXT_CACHE_DIR = "/tmp/ai-coe-text-cache"
+    TEXT_CACHE_MEMORY_MAX_BYTES = 64 * 1024 * 1024
+    TEXT_CACHE_DISK_MAX_BYTES = 1024 * 1024 * 1024
+    # Disk eviction goes down to this share of the maximum, so it does not run on every write
+    TEXT_CACHE_DISK_EVICT_TO = 0.9
+
+    # Blob download and parsing (the parse process pool is per web worker)
+    BLOB_DOWNLOAD_CONCURRENCY = 8
+    BLOB_PARSE_WORKERS = int(os.getenv("BLOB_PARSE_WORKERS", "4"))
+
+    # Pooled HTTP connections to the LLM providers
+    LLM_HTTP_MAX_CONNECTIONS = 100
+    LLM_HTTP_MAX_KEEPALIVE_CONNECTIONS = 20
+    LLM_HTTP_KEEPALIVE_EXPIRY = 60.0
+    LLM_HTTP_TIMEOUT = 600.0
+
+    # API key scheduling, used until the provider sends rate limit headers
+    API_KEY_WINDOW_SECONDS = 60
+    API_KEY_REQUESTS_PER_MINUTE = {"openai": 500, "anthropic": 50}
+    API_KEY_TOKENS_PER_MINUTE = {"openai": 300000, "anthropic": 40000}
+    API_KEY_DEFAULT_COOLDOWN_SECONDS = 20
+
+    # Semantic response cache for the nh-qa and title models (opt-in)
+    SEMANTIC_CACHE_ENABLED = os.getenv("SEMANTIC_CACHE_ENABLED", "false").lower() == "true"
+    SEMANTIC_CACHE_SIMILARITY_THRESHOLD = float(
+        os.getenv("SEMANTIC_CACHE_SIMILARITY_THRESHOLD", "0.97")
+    )
+    SEMANTIC_CACHE_TTL_SECONDS = 3600
+    SEMANTIC_CACHE_MAX_ENTRIES = 1000
+    # Shared by the worker processes of a pod (set to None to keep answers per worker)
+    SEMANTIC_CACHE_SQLITE_PATH = "/tmp/ai-coe-semantic-cache.sqlite3"
+    # How long a worker waits for another worker's write lock on a shared SQLite cache before
+    # treating the read as a miss or dropping the write (sqlite3 waits 5s by default)
+    SQLITE_CACHE_BUSY_TIMEOUT_SECONDS = 0.25
+
+    # Embedding cache shared by retrieval and ingestion (set the path to None to keep it in memory only)
+    EMBEDDING_CACHE_MAX_ENTRIES = 5000
+    EMBEDDING_CACHE_SQLITE_PATH = "/tmp/ai-coe-embedding-cache.sqlite3"
+    # Newest rows kept in the SQLite table, about 6 KB each at 1536 dimensions
+    EMBEDDING_CACHE_SQLITE_MAX_ROWS = 20000
+
+    # Ingestion pipeline: concurrent blob downloads, split processes and embedding calls, the
+    # chunks per embedding request, and how many downloaded blobs wait for a split worker
+    INGEST_DOWNLOAD_CONCURRENCY = 8
+    INGEST_SPLIT_WORKERS = 4
+    INGEST_EMBED_CONCURRENCY = 2
+    INGEST_EMBED_BATCH_SIZE = 512
+    INGEST_QUEUE_SIZE = 16
+
+    # Approximate nearest neighbour index of the vector store ("hnsw" or "ivfflat")
+    VECTOR_DIMENSIONS = 1536
+    # One-off migration typing the shared embedding column as vector(VECTOR_DIMENSIONS), which the
+    # index needs; it locks the table for every collection, so ingestion only runs it when asked
+    VECTOR_MIGRATE_DIMENSION = os.getenv("VECTOR_MIGRATE_DIMENSION", "false").lower() == "true"
+    VECTOR_INDEX_METHOD = "hnsw"
+    HNSW_M = 16
+    HNSW_EF_CONSTRUCTION = 64
+    HNSW_EF_SEARCH = 40
+    IVFFLAT_PROBES = 10
+
+    # Per sub-query vector search of nh-qa (cosine similarity floor and hits per sub-query)
+    NH_QA_SCORE_THRESHOLD = 0.75
+    NH_QA_TOP_K_PER_QUERY = 4
+
+    # nh-qa retrieval: "multi_query" (LLM query variants) or "hybrid" (full text + vector, fused by RRF)
+    NH_QA_RETRIEVER = os.getenv("NH_QA_RETRIEVER", "multi_query")
+    TEXT_SEARCH_CONFIG = "english"
+    HYBRID_TOP_K = 8
+    HYBRID_CANDIDATES = 40
+    HYBRID_RRF_K = 60
+
+    # nh-qa question rewriting: one call to a cheaper model for the standalone question and query variants
+    QUESTION_REWRITER_MODEL = os.getenv("QUESTION_REWRITER_MODEL", "gpt-4o-mini")
+    QUESTION_REWRITE_VARIANTS = 3
+    QUESTION_REWRITE_ESTIMATED_TOKENS = 500
+    QUESTION_REWRITE_CACHE_MAX_ENTRIES = 1000
+    QUESTION_REWRITE_CACHE_TTL_SECONDS = 3600
+
+    # Reranking of nh-qa candidates: an ONNX cross-encoder when RERANKER_MODEL_DIR holds
+    # model.onnx + tokenizer.json (needs onnxruntime and tokenizers), BM25 otherwise. On by
+    # default only with a model, as BM25 alone would override the vector search order.
+    RERANKER_MODEL_DIR = os.getenv("RERANKER_MODEL_DIR")
+    RERANK_ENABLED = os.getenv("RERANK_ENABLED", "true" if RERANKER_MODEL_DIR else "false").lower() == "true"
+    RERANK_TOP_K = 8
+    RERANK_MAX_CONTEXT_TOKENS = 3000
+    RERANK_BATCH_SIZE = 16
+    RERANK_LATENCY_BUDGET_SECONDS = 0.25
+
+    # Server-sent events of /chat_stream/: consecutive tokens are coalesced into one write of
+    # up to SSE_COALESCE_MAX_CHARS, held back at most SSE_COALESCE_MAX_SECONDS; the handler reads
+    # ahead at most SSE_QUEUE_SIZE events
+    SSE_COALESCE_MAX_CHARS = 256
+    SSE_COALESCE_MAX_SECONDS = 0.05
+    SSE_QUEUE_SIZE = 64
+    SSE_DISCONNECT_POLL_SECONDS = 0.5
+    STREAM_ERROR_MESSAGE = (
+        "There is some Error to generate response. Please Contact AI-CoE with Full Screen Screenshot"
+    )
+
+    # Service bootstrap: secrets are fetched in one concurrent batch and cached for the TTL
+    # (refreshed in the background shortly before expiry, served stale when Key Vault is down);
+    # a failed startup is retried in the background with exponential backoff
+    SECRET_TTL_SECONDS = 3600
+    SECRET_REFRESH_AHEAD_SECONDS = 300
+    SECRET_ERROR_RETRY_SECONDS = 30
+    SECRET_FETCH_CONCURRENCY = 8
+    STARTUP_RETRY_SECONDS = 5
+    STARTUP_RETRY_MAX_SECONDS = 60
+    # Rotated secrets are looked for this often; a client replaced after a rotation is closed
+    # ROTATED_CLIENT_CLOSE_DELAY_SECONDS later, so its in-flight calls finish
+    SECRET_ROTATION_CHECK_SECONDS = 60
+    ROTATED_CLIENT_CLOSE_DELAY_SECONDS = 60
+
+
+class LLMProviders:
+    OPENAI = "openai"
+    ANTHROPIC = "anthropic"
+
 
 class KeyVaultSecretKeys:
     ANTHROPIC_KEY_LIST = "anthropicAPIKeyList"
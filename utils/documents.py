@@ -1,447 +0,0 @@
-document_dictionary = {
-    "data_driven_digital_twin": """
-    
-    "NH data driven strategies Digital Twin":
-    
-    Consulting Co. Data-Driven Technologies and Methodologies
-    Shown below at Exhibit 2-2, Consulting Co.'s methods and comprehensive suite of AI-based tools, known as the CC Intelligence Platform, are accelerators in supporting ACME IT's organizational redesign initiative in alignment with the ACME’ strategic vision and plan. The CC Intelligence Platform is embedded in our ways of working and serves as the foundation of our people-first approach. It enables us to efficiently listen to more ACME voices, versus basing our designs on a small “n” – it enables us to learn faster and results in a fact-based body of evidence that aligns the organization. Throughout this proposal response we demonstrate the value ACME receives by leveraging a combination of benchmarks, assessments, quantitative and qualitative research, and our tool’s – Decooda – advanced analytics, Consulting Co. can provide ACME IT with data-driven insights to guide the transformation towards greater agility, diversity, impact, innovation, and a people-first culture.
-    EXHIBIT 2-2: CC INTELLIGENCE PLATFORM
-    Benchmarks and best practices help ACME IT understand its current position in relation to industry peers and best practices. This information is crucial in identifying areas of strength and opportunities for improvement, enabling the design of an IT organization that is competitive and future-ready. Assessments, such as Change Readiness and Digital Maturity, provide a deeper understanding of ACME IT's current capabilities and readiness for transformation, informing the prioritization of initiatives and resource allocation.
-    Quantitative and qualitative research, enhanced by Decooda's AI-powered analysis of unstructured data, offers valuable insights into the needs, preferences, and behaviors of ACME IT's stakeholders, including employees, customers, and partners. This holistic understanding of the human factors driving the organization is essential in designing roles, responsibilities, and processes that foster collaboration, innovation, and employee engagement. Decooda's ability to uncover authentic perspectives and link intent with topics and emotions help ACME IT identify areas of concern and develop targeted interventions to address them.
-
-    As the organizational redesign progresses, Consulting Co.'s Data and Analytics capabilities play a key role in integrating insights from various sources and generating actionable intelligence. This includes descriptive analytics to understand current performance, predictive analytics to forecast future trends and outcomes, and prescriptive analytics to recommend optimal courses of action. By blending these insights with data from ACME IT's systems of record, Consulting Co. enables evidence-based decision making throughout the transformation journey.
-    The true power of Consulting Co.'s Integrated Insights Framework lies in the synergistic integration of these various tools and methodologies. As insights from one component feed into the next, ACME IT benefits from a continuously evolving and refined understanding of its transformation journey. The early-stage insights derived from benchmarks, assessments, and research serve as the foundation for defining success metrics and key performance indicators. These metrics then guide the ongoing measurement and calibration of the organizational redesign, ensuring that it remains aligned with the strategic objectives of agility, diversity, impact, innovation, and people-first. Further, by leveraging Consulting Co.'s AI-based tools and methodologies, a body of evidence based on facts is produced, leading to informed designs that aligns stakeholders. Throughout the project, constant feedback loop between insights, actions, and outcomes enable the organization to adapt and refine its strategies ensuring ACME’s tactical and strategic objectives are met. This agility and responsiveness is critical in navigating the complex and dynamic landscape of technology and innovation over the next decade.
-    Consulting Co.'s AI-based CC Intelligence Platform offers a powerful and data-driven approach to support ACME IT's organizational redesign in alignment with the ACME 2030 strategic plan. By leveraging a synergistic combination of benchmarks, assessments, research, and advanced analytics, Consulting Co. can provide ACME IT with the evidence-based insights, predictive vision, and strategies necessary to build an agile, diverse, impactful, innovative, and people-centric IT organization. This transformative approach positions ACME IT as a strategic enabler of the institute's mission and vision, driving sustainable growth, competitiveness, and value creation for years to come.
-    Decooda Unlocks the Value in Unstructured Data
-    Decooda is a key component of Consulting Co.'s CC Intelligence Platform, specializing in efficiently analyzing unstructured data from various sources, including third-party platforms, and Consulting Co.'s proprietary approach to open-ended questions – the Imaginative Question technique that reveals the authentic unfiltered voice of the employee. By leveraging advanced AI, natural language processing (NLP), natural language understanding (NLU), and now Generative AI, Decooda can listen to all voices within an organization with minimal disruption to stakeholders, while significantly increasing the quality and depth of the insights generated.
-    Decooda's ability to develop a valuable body of evidence based on facts is crucial in a federated organization like ACME, where aligning stakeholders and getting them to lean-in can be challenging. Decooda's sophisticated algorithms detect the context of experiences and the drivers of behavior within unstructured data, forming the basis for an informed hypothesis that guides the design of experiences, strategies, solutions, and transformations.
-    The integration of unstructured data insights generated by Decooda with structured data insights from other tools in the CC Intelligence Platform sets the stage for advanced, evidence-based
-
-    analytics. Decooda's insights then have a ripple effect throughout the framework, making every downstream analysis better and generating efficacy metrics as a byproduct.
-    In the context of ACME IT's organizational redesign, Decooda can play a pivotal role in uncovering the unspoken needs, preferences, and concerns of employees, IT customers, and other stakeholders. These insights can inform the design of roles, responsibilities, processes, and structures that align with the strategic objectives of agility, diversity, impact, innovation, and a people-first culture. Further, Decooda's ability to generate efficacy metrics can help ACME IT track the success of the organizational redesign initiative over time.
-    Consulting Co.’s differentiated data-driven approach is a powerful tool that unlocks the value in unstructured data, providing organizations with deep, authentic insights into the human factors driving their performance. When integrated with other tools in Consulting Co.'s Integrated Insights Framework, Decooda's insights become even more potent, enabling organizations like ACME IT to design and execute strategic initiatives with precision, vision, and adaptability.
-    Consulting Co. Survey and Assessment Tools
-    Consulting Co. Survey and Assessment tools enabled with Decooda outlined below reveal valuable insights from unstructured data. Our approach to surveys at Consulting Co. is far less intrusive than other survey techniques, with far fewer questions. Yet, we have higher response rates, and ACME stakeholders will provide more data that is emotionally and cognitively rich.
-    Our surveys leverage our proprietary questioning technique called the imaginative question. Although the difference may appear subtle, our research has shown that imaginative questions elicit significantly better survey responses. In fact, compared to traditional questions, imaginative questions yield:
-    17% more sentiment detection 25% more emotion detection
-    27% more cognitive state detection 28% more topic detection
-    This yields far greater insights. On average, responses to traditional open-ended survey questions are 17 words per verbatim, while responses to our imaginative questions are generally between 50- 70 words per verbatim.
-    Actionable Segmented Insights
-    What this means for ACME is that Consulting Co.'s CC Intelligence platform will generate higher quality actionable insights that inform better organization designs based on facts and evidence. It is our opinion that the common thread to achieving this goal is accurately understanding the voice of stakeholders in order to understand their needs and priorities. Our platform's ability to deliver segmented insights across different stakeholder groups will provide ACME with a nuanced understanding of the diverse perspectives and requirements within and across all federated research organizations. Armed with this level of clarity and granularity, ACME will be confident in the design and implementation of the proposed IT organizational redesign that will enable its 2030 strategic plan.
-    • The Decooda IQ survey is a powerful tool for gathering authentic, unfiltered feedback from ACME IT stakeholders and the broader eco-system, ensuring alignment with the ACME 2030
-
-    strategic plan. These concise surveys can be tailored to any topic and audience, empowering respondents to express themselves freely and providing a truly people-first approach to data collection. By leveraging Decooda's advanced AI and natural language processing capabilities, the survey data is automatically classified and contextualized, generating actionable insights that inform strategic decision-making and guide the IT organizational redesign with data-driven evidence.
-    • The Maturity Assessment Report System (MARS), powered by Decooda, is key for evaluating ACME IT's maturity in alignment with the ACME 2030 strategic plan. It benchmarks IT practices, processes, and capabilities against established standards, focusing on areas critical for success like agility, innovation, and a people-first culture. Utilizing Decooda's AI and natural language processing, MARS offers a comprehensive analysis of ACME IT's current state, identifying strengths and gaps. This analysis provides actionable insights, helping ACME IT leaders to effectively enhance maturity levels in line with the ACME 2030 objectives. By comparing ACME IT's maturity against industry practices, MARS aids in prioritizing initiatives that boost organizational success. It is an essential tool for strategic planning and decision making – guiding the IT organizational redesign with data-driven evidence and aligning transformation efforts with strategic goals.
-    • Change Pulse supports the ACME IT organizational transformation and the 2030 plan by measuring the impact of change initiatives and gauging employee sentiment and readiness. It provides insights into areas of resistance and support, enabling leaders to adjust strategies and manage the human aspect of change effectively. Regular monitoring helps maintain the momentum needed to achieve the goals of the 2030 plan.
-    • The Change Saturation tool supports the ACME IT transformation and the 2030 plan by addressing the issue of change saturation. It identifies symptoms, assesses change load, and provides strategies to manage and mitigate risks associated with change overload. Proactively managing change saturation ensures the transformation remains sustainable and employees can adapt and thrive in the new environment.
-    • Consulting Co.'s Digital Maturity assessment tool supports the ACME IT transformation and the 2030 plan by evaluating the organization's digital capabilities across various dimensions. It identifies strengths and opportunities for improvement, helping ACME IT prioritize and plan digital transformation initiatives effectively. Regular assessment and improvement of digital maturity ensures ACME IT remains at the forefront of technological innovation and is well- positioned to deliver on the goals of the 2030 plan.
-    Exhibit 2-3, Below, we demonstrate how our tool suite is applied throughout the project's lifecycle, and specifically, how we leverage the acquisition of knowledge and the derived insights in our designs and recommendations. The evidence and fact-based insights are important beyond merely informing our work; they become a factor in aligning an organization, which can be challenging in federated models such as ACME's. This approach helps to mitigate that risk.
-
-    EXHIBIT 2-3: APPLICATION OF SURVEY AND ASSESSMENT TOOLS
-    Bringing CC Intelligence to Life for ACME
-    Consulting Co. leverages its innovative AI-enabled qualitative and quantitative research methods to enable ACME's IT organizational redesign goals. By tailoring these methods to ACME's specific context and strategic objectives, we can uncover valuable insights that inform the development of a customized transformation strategy. This approach ensures the IT organizational redesign is grounded in data and evidence and that it effectively addresses the unique needs, challenges, and aspirations of ACME's IT workforce and stakeholders. The following key components of Transformational Intelligence are crucial in driving a successful transformation:
-    • Imaginative Question. Gather robust, nuanced responses from employees, stakeholders, and customers to uncover unique challenges, opportunities, and expectations surrounding the IT transformation.
-    • Identifying Intent, Topics, Emotions, and Behaviors. Analyze narratives to gain deep understanding and empathy, informing the development of a people-centric transformation strategy.
-    • Linking with Structured Data. Integrate qualitative and quantitative data to reveal the most valuable priorities for ACME's IT transformation.
-    • Designing for Emotional and Cognitive Evidence. Develop a transformation strategy that reinforces desired behaviors and attitudes, which serve as leading indicators of long-term success.
-    • Data and Evidence-Based Designs. Leverage AI algorithms and advanced analytics to quantify success, monitor progress, and make real-time adjustments to ensure the IT transformation delivers desired outcomes.
-
-    By applying these components of Transformational Intelligence to ACME's IT organizational redesign, Consulting Co. can help drive a transformation that is aligned with the goals of the ACME 2030 strategic plan and that positions the IT organization for long-term success.
-    What Are the Core Components of the CC Intelligence Platform?
-    At Consulting Co., we understand that the intricacies of today's challenges demand a multifaceted approach. Rather than being confined to a singular methodology, our robust portfolio of tools and strategies equips us to select the optimal solution for any given obstacle, ensuring our clients receive precise, actionable insights tailored to their unique needs. From leveraging benchmarks and market trends to analyze industry standing, to harnessing the power of quantitative and qualitative research complemented by Decooda's capabilities in unstructured data analysis, our diverse range of tools ensures we aren't a one-trick pony. Our service portfolio further fortifies our position, offering a comprehensive command-and-control view of enterprise investments, keeping businesses not only in the loop but always a step ahead in this ever-evolving market landscape.
-    Benchmarks and Market Trends
-    Benchmarks provide a standard of excellence or reference point against which performance or achievements can be compared. They offer businesses clarity on where they stand in the market, enabling them to identify areas of strength and pinpoint opportunities for improvement. By aligning with benchmarks, organizations can set realistic and strategic goals, monitor progress, and ensure competitive performance in their industry. In essence, benchmarks are invaluable tools that guide decision-making, inspire growth, and promote best practices across sectors. Regular updates and active industry engagement enhance the value of these insights, positioning companies for sustained growth and resilience.
-    Assessments
-    Consulting Co. has successfully conducted around 400 independent assessments and is in the midst of standardizing them for consistent high-quality insights delivery. Originally, these assessments predominantly relied on Quantitative Research Surveys. Yet, recent integrations with Decooda's Imaginative Question in these surveys have deepened insights into what drives both customer and employee behaviors. Merging the quantitative insights with those from Decooda gives clarity on priority areas through an impact analysis, backed by evidence. A variety of assessments, from Change Readiness and Digital Maturity to Future releases like PPM Maturity and Experience Maturity, are part of their suite.
-    Quantitative Research
-    This approach involves surveying audiences to gather and analyze structured numerical data. Its strength lies in identifying patterns, making predictions, and testing causality. However, there's a risk of confirmation bias due to hypothesis-based designs, and sometimes surveys may lack context, contributing to lower response rates. Introducing insights from Decooda Research and the Imaginative Question can refine survey designs, making them more relevant and authentic.
-    Qualitative Research
-    Qualitative research dives deep into individuals' opinions, ideas, or experiences, utilizing structured non-numerical data. This approach employs various methodologies, like grounded theory and ethnography, each with distinct goals and perspectives. Biases can creep into this research type, so being aware of them can mitigate their effects. Methods include observations, interviews, and focus groups, among others. Like quantitative research, qualitative research can also be enhanced by
-
-    integrating insights from both Decooda and the Imaginative Question, ensuring that the design and content remain relevant and authentic.
-    Decooda Research
-    Decooda, under the Consulting Co. umbrella, excels in analyzing unstructured data, whether from clients, third-party platforms, or Consulting Co.'s Imaginative Question technique. The analysis uncovers unadulterated customer or employee perspectives, leading to an unbiased "Informed Hypothesis." Not only does Decooda offer a fundamental understanding, but its findings also shed light on potential further research areas. By linking a person's intent with topics they discuss and the emotions they display, Decooda highlights areas of concern in an organization. These insights form the basis for the informed hypothesis which directs the design of experience, strategy, solution, and transformations.
-    Data and Analytics
-    Playing a pivotal role in Consulting Co.’s Integrated Insights Framework, Data and Analytics consolidates insights from Decooda, Quantitative, Qualitative, and Assessment Research. This results in top-tier analytics, spanning descriptive, prescriptive, and predictive actionable insights. This can further blend with various data forms to conduct statistical research, which in turn can be a valuable input for advanced AI endeavors.
-    Service Portfolio Management
-    Service Portfolio Management (SPM) provides a dynamic roll-up of all insights generated by Consulting Co.’s Integrated Insights Framework as well as data from client systems of record. The result is a “command-and-control” perspective of the performance of enterprise investments. Thus, enabling organizations to prioritize and manage their suite of investments, ensuring optimal alignment with business objectives and resource allocation. By adopting SPM, companies can navigate the complexities of their business environment by predicting and monitoring the performance of their investments, tracking and adjusting based on evidence.
-
-    Elevating Insight Quality Through Integration
-    Benchmarks, paired with sophisticated research methodologies like assessments, qualitative and quantitative research, and Decooda analysis, provide businesses with a robust evidence-based foundation. This shift from conjecture to evidence-driven insights equips companies to understand their market position, spotlight strengths, and discern areas in need of enhancement. Assessments focus on dimensions like Change Readiness and Digital Maturity, offering critical insights into specific areas of interest. While quantitative methods illuminate patterns and relationships, qualitative research goes deep into personal perspectives and beliefs.
-    Incorporating Decooda analysis into the process refines these methods, offering clearer insights and elevating the depth of qualitative discussions. Given this evidence-backed foundation, experts can streamline discussions, pivoting from extensive discovery sessions to more efficient feedback and validation interactions. This efficiency not only shortens the qualitative research process but ensures a more informed and precise dialogue. Ultimately, this holistic and evidence-based strategy ensures that every business decision is both insightful and strategically positioned for success. The whole is greater than the sum of its parts.
-    Amplified Benefits Through the Integrated Insights Framework
-    The Integrated Insights Framework isn't just about utilizing a multitude of tools; it's about how these tools synergistically amplify each other. When one tool produces a stellar output, it becomes the foundational input for another, enhancing the accuracy and depth of subsequent insights. As insights from one tool feed into the next, our understanding of behaviors, experiences, and outcomes deepens. This integrated approach ensures real-time adaptability and illuminates the most informed, actionable steps, based on a continuously enriched understanding of each client transformation.
-    From Hypothesis to Concrete Evidence
-    While traditional methods often lean on isolated hypotheses, our approach thrives on evidence which is iteratively reinforced. Every insight is not only data-driven but also continuously refined by the compounding effect of multiple tools working in tandem, ensuring every decision is rooted in reinforced evidence.
-    Predictive Precision
-    With each tool's output enhancing the next, Consulting Co.'s foresight becomes unmatched. We don't just predict behaviors and outcomes; we understand and mold them ahead of time, leveraging the compounded insights to ensure proactive and impactful strategies.
-    Continuous Iterative Improvement
-    Our commitment to continuous listening is supercharged by the sequential interplay of our tools. The constant feedback loop ensures strategies are not only responsive but also preemptive. This iterative enrichment, driven by each tool's compounding effect on the next, guarantees strategies that are consistently ahead of the curve, delivering unparalleled results.
-    Early Insights as Transformative Behavioral Metrics
-    In the lifecycle of a project, the early-stage insights are not just foundational; they evolve into pivotal metrics that guide the entire trajectory of the initiative. Here's how:
-    Confidence in Action
-
-    The initial insights we derive set the tone and direction for the entire project. By capturing these primary understandings, we're not just sketching an outline; we're setting proactive targets that resonate throughout the project's lifespan.
-    From Insights to Indicators
-    These early-stage insights metamorphose into transformative and behavioral leading indicators. Instead of merely being initial observations, they become benchmarks against which progress, change, and transformation are constantly measured. This ensures that the project's pulse is consistently monitored against its original objectives, aligning real-time actions with foundational goals.
-    Adaptive Efficacy Metrics
-    As the project advances, these leading indicators become adaptable efficacy metrics. They not only gauge how well the project is aligning with its early-stage insights but also offer flexibility in adjusting to evolving scenarios. This ensures that the project remains rooted in its foundational objectives while adapting to the dynamic demands of real-world execution.
-    Continuous Reinforcement and Calibration
-    The true power of these early insights as leading indicators lies in their ability to reinforce desired behaviors and outcomes. They serve as constant reminders of what the project set out to achieve. Moreover, they allow for continuous calibration, ensuring that strategies and actions are synchronized with the core transformative objectives. Lastly, they keep stakeholders leaning in and aligned with the project by demonstrating adoption of preferred behaviors that are leading indicators to desired outcomes.
-    A Living Blueprint
-    In essence, the early-stage insights don't remain static; they evolve into a living blueprint for the project. They ensure that, from inception to completion, every decision made, every strategy devised, and every action taken is deeply anchored in evidence-based insights, optimizing the project for transformative success.
-    At Consulting Co., our multifaceted approach is akin to a well-orchestrated symphony, where each instrument, or tool, amplifies the next, resulting in harmonious and resonant outcomes. Starting with data-driven insights, we cultivate an evidence-rich foundation. As we advance, this foundation shapes transformative and behavioral leading indicators, consistently guiding the project's trajectory. These early-stage revelations morph into dynamic benchmarks, enabling us to continually calibrate our strategies to the project's core objectives while being adaptive to real-world shifts. In sum, while each tool in our portfolio offers significant value individually, their combined synergy creates an outcome where the whole is undeniably greater than the sum of its parts. This integrated blueprint ensures that our clients' projects are not only rooted in initial evidence but also evolve with foresight and precision, promising transformative success.
-    Consulting Co.'s approach to Strategic Portfolio Management (SPM) is deeply enriched by its CC Intelligence platform, a foundational system designed to harness the power of both structured and unstructured data. This platform is the cornerstone of Consulting Co.'s data-driven strategy, providing an evidence-based body of knowledge that not only predicts and measures portfolio risk but also elucidates the underlying reasons for those risks. Through this comprehensive analysis,
-
-    Consulting Co. offers clear guidance on the next best actions, enabling decisions to be made with heightened confidence.
-    Leveraging CC Intelligence for Business Agility and Transformation Management
-    In today’s fast-evolving digital landscape, every transformation is fundamentally digital. Consulting Co.’s proprietary NH360TM platform, a key component of its CC Intelligence framework, offers clients a crystal-clear snapshot of their current position, facilitating precise alignment on priorities, actionable steps forward, and the realization of tangible value. This platform embodies the essence of where vision translates into value.
-    The Role of Management and Execution in Business Transformation
-    The journey of business transformation is intricate, involving the management of complex programs and significant changes, with the ultimate goal of maximizing value and ROI. Consulting Co.'s CC Intelligence platform enables a value-guided, flexible approach to navigating these waters, promoting business agility by regularly evaluating assumptions, revisiting priorities, and fostering continuous improvement.
-    Comprehensive Support Across the Transformation Spectrum
-    Consulting Co. stands out for its expertise in program and project management, business analysis, change management, and fostering business agility. The CC Intelligence platform integrates these disciplines, offering a holistic solution that inspires adoption and unlocks maximum potential, ensuring change is not just implemented but embraced, change readiness is instilled, and the delivery of transformation is accelerated, aligning and measuring progress across the spectrum of products, projects, programs, and portfolios.
-    Addressing the Risks in Transformation Investments
-    With digital transformation investments projected to soar, the lack of business agility poses a significant risk to realizing expected business outcomes. Consulting Co.'s CC Intelligence platform plays a pivotal role in mitigating these risks by providing a 360-degree view across the enterprise, ensuring timely decision-making, and maintaining continuous alignment with strategic objectives.
-    Breaking Down Silos for Enhanced Business Agility
-    Business agility requires a collective effort, transcending organizational silos. Consulting Co.’s platform fosters collaboration among all stakeholders—transformation offices, architects, PMOs, business, and technology leaders—facilitating the adoption of strategic portfolio management processes that enhance decision-making and drive business agility.
-    Strategic Portfolio Management as a Catalyst for Agility
-    At the heart of driving business agility is the strategic portfolio management enabled by Consulting Co.'s CC Intelligence platform. This approach combines strategy execution with best practices in business and enterprise architecture, generating a dynamic blueprint of the entire business. This blueprint allows for the continuous alignment and orchestration of all investments with strategy, optimizing business outcomes.
-    The Advantages of a 360-Degree Strategic Portfolio Management
-    This platform ensures that all investments and stakeholders are aligned with strategic priorities, facilitating effective communication of strategy across the organization. It breaks down silos, connecting departments, portfolios, products, services, and technology, and provides the insights
-
-    needed to model and understand the business impact of decisions. The platform supports the creation of powerful strategic and technical roadmaps, enabling continuous optimization of investments and resources, and guiding the transformation towards becoming an outcome-driven business.
-    Enabling Specific Capabilities for Enhanced Agility
-    Consulting Co.'s NH360 Strategic Portfolio Manager, powered by the CC Intelligence platform, enables strategy definition, outcome management, budgeting and forecasting, resource capacity planning, and strategic roadmaps and dependency management, among other capabilities. This comprehensive strategy execution, combined with business and enterprise architecture best practices, offers a tailored solution that can be built over time or implemented all at once for a complete strategic portfolio management solution.
-    Ensuring Success with a Proven Approach
-    Success in strategic portfolio management transcends technology, requiring the right combination of processes and tools. Consulting Co.'s proven approach, informed by its CC Intelligence platform, ensures the creation of a strategically aligned and connected enterprise, providing a roadmap for future growth and evolution. This unique process framework, named VIC (Visibility, Insight, and Connect), is the key to unlocking the full potential of strategic portfolio management, powered by a fact-based body of evidence that guides organizations to predict, measure, and act with confidence.
-    """,
-    "operating_model_digital_twin": """
-
-    "operating model strategy digital twin":
-
-    North Highland’s Approach to Developing an Updated Operating Model for Clients
-
-Introduction
-
-North Highland partners with clients to develop forward-looking strategic plans that articulate a vision for their organization's future success and growth. To achieve this vision, the strategic plan identifies key goals and objectives around themes such as Agility, Diversity, Impact, Innovation, and People-First.
-
-As a critical enabler of the client's mission, the client's IT organization must ensure it is appropriately structured to support the company's future success and growth. This requires an organizational redesign initiative that defines clear roles and responsibilities aligned to the strategic priorities. North Highland partners with the client's IT leadership on this transformation, leveraging our proven Organizational Design Framework and deep experience supporting similar efforts at other public-sector and Fortune 100 clients.
-
-Approach
-
-Our approach begins with Setup and Management, a crucial phase that lays the foundation for a successful organizational redesign initiative. During this phase, we work closely with the client's IT leadership to establish a robust program governance structure. This includes defining clear roles and responsibilities for the core team, identifying key stakeholders across the organization, and establishing regular reporting and communication channels. By aligning on program governance early on, we ensure that the redesign effort has the necessary leadership support, resources, and decision-making processes in place to drive progress and manage risks.
-
-Another key aspect of the Setup and Management phase is identifying and engaging key stakeholders. These stakeholders represent various functions, levels, and perspectives within the client's IT organization and the broader company. Through targeted interviews, focus groups, and surveys, we gather valuable insights into the current state of the organization, including pain points, improvement opportunities, and desired outcomes. By involving stakeholders early and often, we build buy-in and ownership for the redesign effort, which is critical for successful adoption and sustainability of the future state.
-
-With the program governance and stakeholder engagement underway, we then conduct a comprehensive Current State assessment. This assessment provides a detailed understanding of the client's IT organization's existing capabilities, service delivery model, organizational culture, and structure. We review documentation, analyze data, and conduct additional stakeholder interviews to develop a holistic view of the current state.
-
-The capabilities assessment looks at the key functions and services provided by the client's IT organization, evaluating their maturity, effectiveness, and alignment with industry best practices. The service delivery review maps out the current processes, tools, and metrics
-
-used to deliver IT services to the company, identifying opportunities for streamlining and automation. The culture assessment provides insights into the values, behaviors, and norms that shape how work gets done within the client's IT organization, highlighting strengths to build upon and areas for improvement. Finally, the structural assessment looks at the current organizational hierarchy, roles, and responsibilities, identifying any gaps, overlaps, or inefficiencies.
-
-By combining the insights from the Current State assessment with the goals and objectives of the client's Strategic Plan, we develop a set of design principles to guide the future state recommendations. These design principles serve as guardrails to ensure that the redesigned organization is aligned with the company's strategic priorities and values. Example design principles might include customer-centricity, agility, innovation, collaboration, and empowerment. These principles are then used to evaluate and prioritize potential future state options, ensuring that the final recommendations are grounded in both the current realities and the desired future outcomes.
-
-Overall, the Setup and Management and Current State assessment phases are critical for establishing a strong foundation for the organizational redesign effort. By aligning on program governance, engaging stakeholders, and developing a comprehensive understanding of the current state, we can develop targeted and actionable recommendations that position the client's IT organization for success in enabling the company's future growth and impact.
-
-In the Future State design phase, we collaboratively develop a comprehensive Target Operating Model (TOM) that serves as the blueprint for the future client's IT organization. The TOM is a holistic and detailed view of how the client's IT organization will function in the future, aligning people, processes, and technology to deliver on the company's strategic objectives.
-
-One key component of the TOM is the definition of functional capabilities. These are the core areas of expertise and service that the client's IT organization will need to provide to support the company's mission. Examples might include IT strategy and governance, application development and support, infrastructure and operations, cybersecurity, and data management and analytics. For each capability, we define the key activities, outputs, and performance metrics, ensuring that they are aligned with industry best practices and the company's unique needs.
-
-Another critical aspect of the TOM is the design of operating processes. These processes define how work gets done within and across the functional capabilities, ensuring smooth handoffs, clear decision points, and continuous improvement. We map out the end-to-end processes for key IT services, such as incident management, change management, and project delivery, identifying opportunities for simplification, standardization, and automation. By designing efficient and effective operating processes, we enable the
-
-client's IT organization to deliver high-quality services with speed, consistency, and resilience.
-
-The service catalog is another key deliverable in the Future State design phase. The service catalog defines the full range of IT services offered to the company, along with their service levels, pricing, and request processes. By clearly articulating the IT service offerings, we enable better alignment with business needs, improved demand management, and greater transparency and accountability. The service catalog also serves as a foundation for continuous improvement, as the client's IT organization can track service performance and identify areas for optimization over time.
-
-Organizational structure is a critical component of the TOM, as it defines how people and teams are organized to deliver the functional capabilities and services. We design a structure that balances the need for specialization and collaboration, with clear lines of reporting, decision-making, and accountability. This may involve creating new roles or teams, realigning existing ones, or establishing centers of excellence or shared services. The organizational structure is designed to enable agility, innovation, and customer-centricity, while also promoting employee engagement and development.
-
-To bring the new organizational structure to life, we define the key roles and responsibilities required for success. This includes creating detailed job descriptions that outline the skills, experience, and competencies needed for each role, as well as the expected outcomes and performance metrics. We also conduct a workforce analysis to determine the optimal headcount and capacity needed to deliver the future state capabilities, taking into account factors such as workload, skill gaps, and growth projections. This analysis informs decisions around hiring, upskilling, and talent management, ensuring that the client's IT organization has the right people in the right roles to execute the TOM.
-
-Finally, we conduct a gap analysis between the current state and the future state TOM. This analysis highlights the key differences between where the client's IT organization is today and where it needs to be in the future, across dimensions such as capabilities, processes, technology, people, and culture. By quantifying these gaps, we can prioritize the areas that require the most attention and investment during the transition phase. The gap analysis also informs the development of a detailed implementation roadmap, which sequences the key activities and milestones required to realize the future state vision.
-
-Overall, the Future State design phase is a highly collaborative and iterative process that engages stakeholders from across the client's IT organization and the broader company. By co-creating the Target Operating Model, we ensure that the future state vision is both ambitious and achievable, and that it has broad buy-in and ownership from the people who will be responsible for executing it. The TOM serves as a clear and compelling blueprint for the future of the client's IT organization, guiding the company towards greater impact, agility, and innovation in support of its mission.
-
-The Roadmap and Change Management phase is critical to the success of the client's IT organizational redesign initiative, as it bridges the gap between the future state vision and the current state reality. This phase focuses on developing a comprehensive plan for implementing the Target Operating Model (TOM) and managing the complex organizational changes required to achieve the desired outcomes.
-
-One of the key deliverables in this phase is a phased implementation roadmap. The roadmap breaks down the overall transformation into manageable stages, each with specific objectives, activities, dependencies, and timelines. The phasing is based on a careful analysis of the gaps between the current state and the future state, as well as the priorities and constraints of the organization. For example, the roadmap might begin with foundational activities such as technology upgrades or process standardization, before moving on to more complex changes such as organizational restructuring or capability building. By providing a clear and realistic path forward, the roadmap helps to build momentum and confidence in the transformation journey.
-
-To support the implementation roadmap, we also develop detailed budgetary estimates. These estimates capture the one-time and ongoing costs associated with the transformation, including investments in technology, facilities, training, and talent. The budgetary estimates are based on a thorough analysis of the resources required to execute the roadmap, as well as benchmarks from similar transformations in other organizations. By providing transparency into the financial implications of the transformation, we help the client's IT leadership make informed decisions about resource allocation and prioritization.
-
-Alongside the implementation roadmap and budgetary estimates, we develop a comprehensive organizational change management (OCM) strategy and plan. The OCM strategy is based on a deep understanding of the stakeholder landscape, including the various groups and individuals impacted by the transformation, their readiness for change, and their potential resistance or support. The strategy outlines the key messages, communication channels, and engagement activities required to build awareness, understanding, and buy-in for the changes.
-
-The OCM plan operationalizes the strategy, providing a detailed roadmap of activities and milestones aligned with the overall implementation timeline. This includes regular communications such as newsletters, town halls, and leadership updates, as well as targeted engagement activities such as workshops, focus groups, and training sessions. The OCM plan also includes mechanisms for gathering feedback and measuring the effectiveness of the change efforts, allowing for continuous improvement and course correction as needed.
-
-A critical aspect of the OCM strategy and plan is the focus on mindset and behavior change. The success of the client's IT transformation depends not only on new structures, processes, and technologies, but also on the ability of individuals and teams to adopt new ways of working and thinking. To support this, we design and deliver targeted interventions
-
-such as leadership development programs, team-building workshops, and coaching and mentoring initiatives. These interventions help to build the skills, confidence, and resilience required for individuals to thrive in the new organization.
-
-Throughout the Roadmap and Change Management phase, we maintain a strong emphasis on stakeholder engagement and two-way communication. We work closely with the client's IT leadership to identify and empower change champions and advocates across the organization, who can help to cascade messages and build grassroots support for the transformation. We also establish regular feedback loops and listening sessions to gather input and concerns from employees at all levels, and to incorporate their ideas and suggestions into the ongoing change efforts.
-
-By taking a structured and proactive approach to change management, we help to mitigate the risks and resistance that can derail organizational transformations. We ensure that all stakeholders are aligned and engaged throughout the journey, and that the changes are sustainable and embedded into the fabric of the organization.
-
-Overall, the Roadmap and Change Management phase is a critical enabler of the client's IT organizational redesign initiative. By developing a clear and actionable plan for implementation and change management, we help to turn the future state vision into a tangible reality. We provide the tools, resources, and support required for individuals and teams to navigate the complexity of the transformation, and to emerge as a stronger, more agile, and more innovative organization, better equipped to deliver on the company's mission and strategic objectives.
-
-""",
-    "knowledge_management_digital_twin": """
-
-"Knowledge manangement strategies":
-This paper is broken up into two sections that combined represent North Highland’s Approach to highlighting the value of knowledge management and then describing the steps organizations can go through to develop a foundation of knowledge that is required to power AI in a way that will optimize value for an organization. The first section is “The Importance of Knowledge Management as First Principles of Effective AI To Enable and Autonomous Enterprise” and the second section is “Developing Enterprise Knowledge Management in The Era of AI”
-
-This content can be used to explain North Highland’s approach to helping clients build a foundation of knowledge to enable AI and the autonomous enterprise.
-
-
-The Importance of Knowledge Management as First Principles of Effective AI To Enable and Autonomous Enterprise
-
-Executive Summary
-Knowledge management plays a crucial role in the development and deployment of effective AI and autonomous systems. By establishing a solid foundation of knowledge, organizations can ensure that their AI systems are built on reliable, accurate, and contextually relevant information. This white paper explores the significance of knowledge management as a first principle in AI development and how it contributes to the creation of robust, trustworthy, and efficient autonomous systems.
-
-Introduction
-In the rapidly evolving landscape of artificial intelligence and autonomous systems, organizations are increasingly recognizing the value of knowledge management as a fundamental pillar of success. Knowledge management involves the systematic capture, organization, and dissemination of an organization's intellectual assets, including explicit, implicit, and tacit knowledge. By prioritizing knowledge management as a first principle, organizations can lay the groundwork for the development of effective AI and autonomous systems that drive innovation, enhance decision-making, and improve overall performance.
-
-The Role of Knowledge in AI and Autonomous Systems
-
-Foundational Knowledge: AI and autonomous systems rely on a solid foundation of knowledge to operate effectively. This includes domain-specific knowledge, organizational policies, best practices, and historical data. By capturing and organizing this knowledge in a structured manner, such as through ontologies, organizations can ensure that their AI systems have access to accurate and relevant information.
-
-Training and Learning: Knowledge management plays a vital role in the training and learning process of AI and autonomous systems. By providing a comprehensive knowledge base, organizations can train their AI models using high-quality data, reducing the risk of biases and errors. Additionally, knowledge management enables continuous learning and adaptation, allowing AI systems to update their knowledge as new information becomes available.
-
-Decision-Making and Reasoning: Effective knowledge management supports improved decision-making and reasoning capabilities in AI and autonomous systems. By leveraging a rich knowledge base, AI systems can make informed decisions based on context, historical patterns, and domain-specific rules. This leads to more accurate and reliable outcomes, enhancing the overall performance of autonomous systems.
-
-Explainability and Trust: Knowledge management contributes to the explainability and trustworthiness of AI and autonomous systems. By maintaining a clear and transparent knowledge base, organizations can trace the reasoning behind AI-driven decisions. This explainability fosters trust among stakeholders, as they can understand how the AI system arrived at a particular conclusion or recommendation.
-
-5-Steps for Implementing Knowledge Management for AI Success
-
-Knowledge Capture and Representation: Organizations should establish processes and tools for capturing explicit, implicit, and tacit knowledge from various sources, including databases, documents, and subject matter experts. This knowledge should be represented in a structured format, such as ontologies, to facilitate easy access and integration with AI systems.
-
-Ontology Development: Ontologies serve as a single source of truth, providing a shared understanding of concepts, relationships, and domain-specific knowledge. By developing comprehensive ontologies, organizations can ensure consistency and interoperability across different AI and autonomous systems, enabling seamless knowledge sharing and collaboration.
-
-Knowledge Validation and Maintenance: Regular validation and maintenance of the knowledge base are essential to ensure its accuracy, relevance, and currency. Organizations should establish mechanisms for updating and refining the knowledge base as new insights emerge or changes occur in the business environment. This ongoing maintenance helps prevent the propagation of outdated or erroneous information.
-
-AI Model Training and Integration: The knowledge base should be seamlessly integrated with AI model training processes. By leveraging the structured knowledge from ontologies, organizations can train AI models using reliable and contextually relevant data. This integration ensures that the AI system's learning aligns with the organization's knowledge assets, leading to more accurate and trustworthy outcomes.
-
-Human-AI Collaboration: Knowledge management should facilitate collaboration between human experts and AI systems. By providing a shared knowledge base, organizations can enable seamless interaction and knowledge transfer between humans and AI. This collaboration enhances the overall decision-making process, combining the strengths of human intuition and AI's computational capabilities.
-
-Conclusion
-Knowledge management serves as a critical first principle in the development and deployment of effective AI and autonomous systems. By prioritizing the capture, organization, and dissemination of knowledge, organizations can build AI systems that are grounded in reliable and contextually relevant information. This foundation enables improved decision-making, explainability, and trust, ultimately leading to the successful implementation of AI and autonomous systems across various domains.
-
-By investing in knowledge management practices, such as ontology development, knowledge validation, and human-AI collaboration, organizations can unlock the full potential of AI and autonomous systems. This approach ensures that AI systems are aligned with organizational goals, deliver accurate and trustworthy results, and drive innovation and competitive advantage in an increasingly AI-driven world.
-
-
-Developing Enterprise Knowledge Management in The Era of AI 
-
-Introduction
-In the rapidly evolving landscape of artificial intelligence (AI) and autonomous systems, organizations are increasingly recognizing the critical role of knowledge management as a foundational pillar for success. Knowledge management, which involves the systematic capture, organization, and dissemination of an organization's intellectual assets, has emerged as a key enabler for the effective development and deployment of AI systems. As organizations strive to harness the power of AI to drive innovation, improve decision-making, and gain a competitive advantage, the importance of knowledge management as a first principle cannot be overstated.
-
-This white paper explores the significance of knowledge management in the era of AI and autonomous systems, exploring the strategies, considerations, and ethical implications that organizations must navigate to successfully integrate knowledge management with AI initiatives. The paper is divided into four Phases, each addressing a crucial aspect of knowledge management in the context of AI.
-
-Phase 1: "The Importance of Knowledge Management in the Era of AI," examines the transformation of knowledge management practices driven by the rapid advancements in AI technologies. It explores how AI has brought about a paradigm shift, emphasizing the importance of managing not only explicit knowledge but also implicit and tacit knowledge. This Phase also discusses the challenges and opportunities associated with integrating AI into knowledge management, highlighting the need for data governance practices and ethical considerations.
-
-Phase 2: "Building a Knowledge Foundation for AI," focuses on the essential elements required to establish a strong knowledge base that enables the effective training and deployment of AI systems. It covers key aspects such as data quality and AI governance, knowledge representation and ontologies, knowledge acquisition and curation, knowledge integration and alignment, and continuous knowledge maintenance and evolution. This Phase emphasizes the importance of building a comprehensive and reliable knowledge foundation to ensure the accuracy, relevance, and trustworthiness of AI systems.
-
-Phase 3: "Knowledge Management Strategies for AI-Driven Organizations," presents a range of strategies that organizations can adopt to effectively integrate knowledge management with AI initiatives. It explores topics such as fostering a knowledge-sharing culture, implementing knowledge capture and retention processes, leveraging AI-assisted knowledge discovery and recommendation systems, ensuring knowledge governance and quality assurance, promoting continuous learning and skill development, and collaborating with external knowledge networks. This Phase provides practical insights and best practices for organizations seeking to optimize their knowledge management practices in an AI-driven environment.
-
-Phase 4: "Ethical Considerations in AI-Driven Knowledge Management," dives into the critical ethical considerations that organizations must address when deploying AI systems in knowledge management. It examines issues related to data privacy and security, bias and fairness, explainability and transparency, accountability and responsibility, human oversight and control, and societal impact and responsibility. This Phase emphasizes the importance of embedding ethical principles into the design and deployment of AI systems to build trust, mitigate risks and ensure that AI-driven knowledge management trustworthy and aligns with societal values and promotes the greater good.
-
-By exploring these key aspects of knowledge management in the context of AI and autonomous systems, this white paper aims to provide organizations with a comprehensive understanding of the importance of knowledge management as a first principle. It offers insights, strategies, and considerations to guide organizations in their journey towards successfully integrating knowledge management with AI initiatives, enabling them to unlock the full potential of AI while navigating the complexities and ethical implications associated with these technologies.
-
-
-Phase 1: The Importance of Knowledge Management in the Era of AI
-
-The field of knowledge management has undergone a significant transformation in recent years, driven by the rapid advancements in artificial intelligence (AI) and autonomous systems. Traditionally, knowledge management focused on capturing, organizing, and sharing explicit knowledge within organizations, primarily through document repositories and knowledge bases. However, the emergence of AI has brought about a paradigm shift, emphasizing the importance of managing not only explicit knowledge but also implicit and tacit knowledge.
-
-AI and autonomous systems have the ability to process vast amounts of data, identify patterns, and generate insights that were previously difficult for humans to discern. This has led to a new era of knowledge discovery and creation, where AI complements human expertise and helps uncover hidden knowledge within organizations. By leveraging AI techniques such as machine learning, natural language processing, and computer vision, organizations can extract valuable knowledge from unstructured data sources, including text documents, images, and videos.
-
-Moreover, AI has enabled the development of intelligent knowledge management systems that can automatically classify, categorize, and link related knowledge assets. These systems can understand the semantic relationships between concepts, making it easier for users to navigate and retrieve relevant information. AI-powered recommendation engines can also suggest relevant knowledge to users based on their interests, roles, and past interactions, enhancing the discoverability and accessibility of knowledge.
-
-However, the integration of AI into knowledge management also presents new challenges and considerations. One of the key challenges is ensuring the quality and accuracy of the knowledge captured and generated by AI systems. As AI models learn from data, they can inherently inherit biases and errors present in the training data. Therefore, organizations must implement  data governance practices and regularly validate the knowledge generated by AI systems to maintain its integrity and reliability.
-
-Another important consideration is the ethical implications of using AI in knowledge management. As AI systems become more autonomous in their decision-making and knowledge generation, organizations must address issues related to transparency, accountability, and fairness. It is crucial to establish ethical guidelines and frameworks that govern the use of AI in knowledge management, ensuring that the generated knowledge aligns with organizational values and societal norms.
-
-Despite these challenges, the integration of AI into knowledge management offers immense opportunities for organizations to leverage their intellectual assets more effectively. By harnessing the power of AI, organizations can unlock hidden insights, enhance decision-making, and foster innovation. The evolution of knowledge management in the era of AI requires a holistic approach that combines the strengths of human expertise with the capabilities of AI systems, creating a synergistic relationship that drives organizational success.
-
-Phase 2: Building a Knowledge Foundation for AI
-
-A  knowledge foundation is essential for the effective development and deployment of AI and autonomous systems. This foundation serves as the bedrock upon which AI models are trained, enabling them to make informed decisions and generate accurate insights. Building a strong knowledge foundation involves several key aspects:
-
-Data Quality and AI Governance: The quality of the data used to train AI models directly impacts their performance and reliability. Organizations must establish comprehensive data governance practices to ensure the accuracy, completeness, and consistency of the data fed into AI systems. This includes implementing data quality checks, data cleansing processes, and data validation mechanisms to identify and resolve any discrepancies or errors in the data.
-
-Knowledge Representation and Ontologies: Knowledge representation plays a crucial role in organizing and structuring the knowledge base for AI systems. Ontologies provide a formal and explicit specification of the concepts, relationships, and axioms within a domain. By developing well-defined ontologies, organizations can create a shared understanding of the knowledge domain, enabling consistent interpretation and reasoning by AI systems.
-
-Ontologies serve as a unifying framework that bridges the gap between human understanding and machine-readable representations. They capture the semantics and constraints of the domain, allowing AI systems to make inferences and derive new knowledge based on the ontological structure. Ontologies also facilitate knowledge sharing and reuse across different AI applications, promoting interoperability and reducing duplication of effort.
-
-Knowledge Acquisition and Curation: Building a comprehensive knowledge base requires effective knowledge acquisition and curation processes. Organizations must establish mechanisms to capture knowledge from various sources, including internal documents, subject matter experts, and external data providers. This knowledge acquisition process should be ongoing, ensuring that the knowledge base remains up to date and relevant.
-
-Knowledge curation involves the systematic organization, classification, and annotation of the acquired knowledge. Subject matter experts play a vital role in reviewing and validating the curated knowledge, ensuring its accuracy and relevance. AI techniques, such as natural language processing and machine learning, can assist in automating certain aspects of knowledge curation, such as entity recognition and relation extraction, reducing manual effort and improving efficiency.
-
-Knowledge Integration and Alignment: Integrating knowledge from diverse sources and aligning it with organizational goals and objectives is essential for creating a coherent and usable knowledge base. Organizations must establish processes to reconcile conflicting or overlapping knowledge, ensuring consistency and avoiding contradictions.
-
-Knowledge integration also involves mapping the acquired knowledge to the defined ontologies, creating a structured representation that can be easily consumed by AI systems. This integration process enables seamless access to the knowledge base, facilitating efficient retrieval and reasoning by AI models.
-
-Continuous Knowledge Maintenance and Evolution: Knowledge is not static; it evolves over time as new insights emerge and business requirements change. Organizations must implement processes for continuous knowledge maintenance and evolution to keep the knowledge base up to date and aligned with the evolving needs of AI systems.
-
-This involves regular review and update cycles, where subject matter experts and AI systems collaborate to identify gaps, inconsistencies, or outdated information in the knowledge base. Automated knowledge discovery techniques can also be employed to identify new knowledge from incoming data streams, suggesting updates and enhancements to the existing knowledge base.
-
-By building a  knowledge foundation, organizations can ensure that their AI and autonomous systems have access to accurate, relevant, and up-to-date knowledge. This foundation enables AI systems to make informed decisions, generate reliable insights, and adapt to changing business requirements. It also promotes explainability and trust in AI systems, as the knowledge base provides a clear and traceable source of information that can be audited and validated.
-
-
-Phase 3: Knowledge Management Strategies for AI-Driven Organizations
-
-Implementing effective knowledge management strategies is crucial for organizations seeking to leverage AI and autonomous systems for competitive advantage. These strategies should align with the organization's goals, culture, and technological capabilities, enabling the seamless integration of knowledge management practices with AI initiatives. Here are some key knowledge management strategies for AI-driven organizations:
-
-Fostering a Knowledge-Sharing Culture: Creating a culture that values knowledge sharing and collaboration is essential for the success of knowledge management in AI-driven organizations. Encouraging employees to actively contribute their expertise and insights to the knowledge base can enrich the available knowledge and drive innovation.
-
-Organizations can promote knowledge sharing through various initiatives, such as establishing communities of practice, conducting knowledge-sharing sessions, and recognizing and rewarding employees who actively contribute to the knowledge base. By fostering a culture of openness and collaboration, organizations can tap into the collective intelligence of their workforce and enhance the quality and breadth of the knowledge available to AI systems.
-
-Implementing Knowledge Capture and Retention Processes: Capturing and retaining valuable knowledge is a critical aspect of knowledge management in AI-driven organizations. Organizations should establish formal processes and tools to capture explicit knowledge, such as documentation, best practices, and lessons learned. This can involve using knowledge management platforms, wikis, or collaborative workspaces where employees can document and share their knowledge.
-
-Tacit knowledge, which resides in the minds of employees, is equally important but more challenging to capture. Organizations can facilitate the transfer of tacit knowledge through mentoring programs, job shadowing, and apprenticeship initiatives. AI techniques, such as natural language processing and machine learning, can also be employed to extract tacit knowledge from unstructured data sources, such as emails, chat logs, and project discussions.
-
-Developing AI-Assisted Knowledge Discovery and Recommendation Systems: AI-driven organizations can leverage AI technologies to enhance knowledge discovery and recommendation capabilities. By applying machine learning algorithms to the knowledge base, organizations can automatically identify patterns, correlations, and insights that may not be apparent to human users.
-
-AI-assisted knowledge discovery systems can analyze large volumes of structured and unstructured data, uncovering hidden relationships and generating new knowledge. These systems can also provide personalized knowledge recommendations to users based on their roles, interests, and past interactions with the knowledge base. By delivering relevant knowledge at the right time, AI-assisted recommendation systems can improve productivity and decision-making.
-
-Implementing Knowledge Governance and Quality Assurance: Ensuring the quality and governance of the knowledge base is crucial for the reliability and trustworthiness of AI systems. Organizations should establish knowledge governance frameworks that define policies, standards, and procedures for managing the knowledge lifecycle.
-
-Knowledge governance includes defining roles and responsibilities for knowledge management, establishing quality assurance processes, and implementing access controls and security measures to protect sensitive knowledge. Regular audits and reviews should be conducted to assess the accuracy, relevance, and completeness of the knowledge base, ensuring that it meets the requirements of AI systems and organizational standards.
-
-Promoting Continuous Learning and Skill Development: AI-driven organizations should prioritize continuous learning and skill development to keep pace with the rapidly evolving AI landscape. Providing training and education programs that focus on AI and knowledge management can equip employees with the necessary skills to effectively contribute to and leverage the knowledge base.
-
-Organizations can also encourage self-directed learning by providing access to online courses, workshops, and conferences related to AI and knowledge management. By fostering a culture of continuous learning, organizations can ensure that their workforce remains up to date with the latest advancements and best practices in the field.
-
-Collaborating with External Knowledge Networks: Collaborating with external knowledge networks, such as industry associations, research institutions, and knowledge-sharing platforms, can provide organizations with access to a wider pool of expertise and knowledge. These collaborations can facilitate the exchange of best practices, insights, and innovative ideas related to AI and knowledge management.
-
-By actively participating in external knowledge networks, organizations can stay informed about the latest trends, technologies, and challenges in the field. They can also contribute their own knowledge and experiences, establishing themselves as thought leaders and driving the advancement of AI and knowledge management practices.
-
-Implementing these knowledge management strategies requires a holistic approach that considers the organization's culture, processes, and technological capabilities. It involves engaging stakeholders across the organization, from senior leadership to frontline employees, to ensure buy-in and participation in knowledge management initiatives. By aligning knowledge management strategies with AI initiatives, organizations can create a synergistic relationship that drives innovation, improves decision-making, and enhances overall performance.
-
-
-Phase 4: Ethical Considerations in AI-Driven Knowledge Management
-
-As AI and autonomous systems become increasingly integrated into knowledge management practices, organizations must focus on delivering trustworthy solutions and navigate the ethical considerations that arise from the use of these technologies. Ensuring the responsible and ethical deployment of AI in knowledge management is crucial for maintaining trust, transparency, and accountability. Here are some key ethical considerations in AI-driven knowledge management:
-
-Data Privacy and Security: AI systems rely on vast amounts of data to train models and generate insights. Organizations must ensure that the collection, storage, and use of data for AI-driven knowledge management adhere to data privacy regulations and ethical guidelines. This includes obtaining necessary consents, implementing data protection measures, and ensuring that sensitive information is handled securely.
-
-Organizations should also be transparent about how data is collected, processed, and used by AI systems. Providing clear privacy policies and giving individuals control over their data can help build trust and alleviate concerns about data misuse.
-
-Bias and Fairness: AI systems can inherit biases present in the data used for training, leading to unfair or discriminatory outcomes. Biases can stem from historical data, societal prejudices, or underrepresentation of certain groups in the training data. Organizations must proactively address bias and ensure fairness in AI-driven knowledge management.
-
-This involves implementing bias detection and mitigation strategies, such as diverse and representative training data, algorithmic fairness assessments, and regular audits. Organizations should also establish guidelines and ethical principles that promote fairness, non-discrimination, and equal treatment in the development and deployment of AI systems.
-
-Explainability and Transparency: The decision-making processes of AI systems can be complex and opaque, making it challenging to understand how they arrive at specific conclusions or recommendations. Explainability and transparency are crucial for building trust in AI-driven knowledge management.
-
-Organizations should strive to develop AI systems that provide clear explanations for their decisions and actions. This can involve using interpretable models, providing explanatory interfaces, and documenting the reasoning behind AI-generated insights. Transparency also extends to disclosing the limitations, assumptions, and potential risks associated with AI systems, enabling stakeholders to make informed decisions.
-
-Accountability and Responsibility: As AI systems become more autonomous in knowledge management, questions arise about who is accountable for their actions and decisions. Organizations must establish clear lines of accountability and responsibility for AI-driven knowledge management.
-
-This involves defining roles and responsibilities for the development, deployment, and monitoring of AI systems. Organizations should also establish governance frameworks that outline the ethical principles, standards, and procedures for the responsible use of AI in knowledge management. Regular audits and assessments should be conducted to ensure compliance with these frameworks and to identify and address any ethical concerns.
-
-Human Oversight and Control: While AI systems can automate and augment knowledge management processes, human oversight and control remain essential. Organizations should ensure that AI systems operate within predefined boundaries and are subject to human review and intervention when necessary.
-
-This can involve implementing human-in-the-loop mechanisms, where human experts review and validate AI-generated insights before they are incorporated into the knowledge base. Organizations should also provide training and education to employees on the responsible use of AI systems and empower them to raise concerns or override AI decisions when ethical issues arise.
-
-Societal Impact and Responsibility: AI-driven knowledge management has the potential to impact society at large, shaping how information is created, disseminated, and consumed. Organizations have a responsibility to consider the broader societal implications of their AI systems and ensure that they align with ethical values and promote the greater good.
-
-This involves engaging in dialogue with stakeholders, including employees, customers, regulators, and the wider public, to understand their concerns and expectations regarding AI and knowledge management. Organizations should also actively contribute to the development of industry standards, best practices, and ethical guidelines that promote responsible AI deployment.
-
-Addressing these ethical considerations requires a proactive and collaborative approach from organizations. It involves embedding ethical principles into the design, development, and deployment of AI systems, and fostering a culture of responsible innovation. By prioritizing ethics in AI-driven knowledge management, organizations can build trust, mitigate risks, and ensure that the benefits of AI are realized in a manner that respects individual rights and promotes societal well-being.
-
-Conclusion
-Knowledge management plays a pivotal role as a first principle in the development and deployment of effective AI and autonomous systems. By establishing a  knowledge foundation, organizations can ensure that their AI systems are built on accurate, relevant, and contextually rich information. This foundation enables AI systems to make informed decisions, generate reliable insights, and adapt to evolving business requirements.
-
-To successfully integrate knowledge management with AI initiatives, organizations must adopt a holistic approach that encompasses various strategies and considerations. Fostering a knowledge-sharing culture, implementing knowledge capture and retention processes, leveraging AI-assisted knowledge discovery and recommendation systems, ensuring knowledge governance and quality assurance, promoting continuous learning and skill development, and collaborating with external knowledge networks are all essential components of effective knowledge management in AI-driven organizations.
-
-Furthermore, organizations must navigate the ethical considerations that arise from the use of AI in knowledge management. Ensuring data privacy and security, addressing bias and fairness, promoting explainability and transparency, establishing accountability and responsibility, maintaining human oversight and control, and considering the societal impact and responsibility are critical ethical imperatives. By embedding ethical principles into the design and deployment of AI systems, organizations can build trust, mitigate risks, and ensure that AI-driven knowledge management aligns with societal values and promotes the greater good.
-
-As the field of AI continues to evolve, the importance of knowledge management as a first principle will only grow. Organizations that prioritize knowledge management and adopt a proactive approach to integrating it with AI initiatives will be well-positioned to harness the full potential of AI and autonomous systems. By leveraging the power of knowledge and AI in a responsible and ethical manner, organizations can drive innovation, improve decision-making, and gain a competitive edge in an increasingly AI-driven world.
-""",
-    "ai_engagement_digital_twin": """
-
-"AI engagement model":
-This document represent North Highland’s best practices for how companies should approach driving adoption of AI solutions to maximize value for an organization by zooming out to look at the big picture and questions that need to be answered that have remained elusive, connecting the dots that will enable the organization to enable new ways of working that will be more efficient and productive, and then zoom in on the initiatives that matter most, and execute AI enabling strategies and tactics that are aligned to the vision of the organization. 
-
-Abstract:
-In the rapidly evolving landscape of artificial intelligence (AI), organizations often struggle to effectively prioritize and align their AI initiatives with overarching goals and values. This white paper explores the importance of adopting a strategic, knowledge-driven approach to AI implementation, emphasizing the need to zoom out and assess initiatives through a broader lens while also zooming in to focus on robust knowledge management practices. By empowering executives through education and establishing an AI Center of Excellence, organizations can overcome the challenges of fragmented AI initiatives and optimize value creation. The summary concludes by highlighting the significance of resisting AI hype and embracing a holistic approach to position organizations as leaders in the AI renaissance, equipped to navigate complexities and drive meaningful change.
-
-Zoom Out, Connect The Dots, Zoom In, And Execute
-In the fast-paced world of artificial intelligence (AI) and autonomous systems, organizations are constantly bombarded with meteoric claims and promises about the transformative potential of these technologies. Executives, eager to capitalize on the benefits of AI, often find themselves swept up in the hype without taking a moment to zoom out and consider the broader context in which these initiatives will operate. 
-
-One of the most significant negative consequences of relenting to AI hype is the tendency to pursue fragmented and disconnected AI projects without considering their strategic alignment and contextual relevance to the broader needs of the organization. This myopic focus on short-term gains can lead to a scattered and ineffective AI landscape, hindering the organization's ability to harness the true power of AI-enabled change.
-
-By taking the time to zoom out and assess AI initiatives through a broader lens, executives can accelerate the identification of high-impact opportunities that align with the organization's overall goals and values. This contextual prioritization involves considering factors such as the organization's mission, customer needs, competitive landscape, regulatory environment, and ethical considerations. 
-
-Moreover, the act of zooming out and considering the contextual factors surrounding AI initiatives can speed up the implementation process. By identifying the most promising and strategically aligned AI projects upfront, organizations can allocate their resources more effectively, focusing on the initiatives that have the highest potential for success.
-
-Another critical aspect of this contextual prioritization approach is the recognition of the vital role that knowledge management plays in enabling AI success. AI systems rely heavily on acquiring, documenting, and storing explicit, implicit, and tacit knowledge that drives organization decision making. Investing in robust knowledge management practices, such as establishing clear data governance frameworks, promoting cross-functional collaboration, and fostering a culture of continuous learning and knowledge sharing, can significantly accelerate the AI development and deployment process. 
-
-Key Take-Away
-We recommend clients resist the seduction of AI hype that can lead organizations astray, causing them to pursue fragmented and misaligned AI projects that fail to deliver meaningful value. By taking the time to zoom out and engage in contextual prioritization, executives can accelerate the identification of high-impact AI initiatives that align with the organization's overall goals and values. Moreover, by investing in robust knowledge management practices and adopting a dual approach that supports both large-scale transformation and targeted improvements, organizations can harness the full potential of AI and autonomous systems, driving significant and sustainable value creation.
-
-North Highland Customer “0” - 5x in a Fraction of Time
-Like many companies, North Highland is looking for methods to increase its productivity and efficiency through the use of generative AI and other forms of artificial intelligence. To address the insatiable appetite for AI tools and automation, we launched a pilot team so we could observe adoption patterns. We quickly realized that while we saw some productivity gains, we also saw the emergence of behaviors that were not aligned with our best practices.  
-
-We followed this initial test with a more precise quantitative and qualitative assessment of organizational needs, with a targeted emphasis on areas of friction that could be resolved through AI enablement. We performed hundreds of surveys and interviews with firm leaders. In one area that we were targeting for productivity and efficiency gains, we identified 28 specific use cases across 10 different functional teams.
-
-Conventional wisdom might tell you, "Great job, you've identified 28 backlog items that you can focus on that have value to the enterprise." However, by zooming out and looking across the 28 use cases and the 10 functional teams we identified, we discovered we could aggregate these use cases into three macro, flexible, AI-enabled use cases and modify new ways of working that would allow us to accelerate time to market and deliver 5x ROI, versus implementing 28 fragmented solutions.
-
-
-The Downside of Fragmented AI Initiatives 
-
-Amplifying Data Silos and Complexity
-The unchecked proliferation of AI tools and applications exacerbates the already fragmented and complex data landscape within organizations, hindering the development of a unified, comprehensive view of the business.
-
-Neglecting Critical Knowledge Management Foundations
-Organizations that pursue fragmented AI initiatives often overlook the critical importance of mature knowledge management practices, leading to suboptimal outcomes and missed opportunities for innovation.
-
-Constraining AI's Impact to Narrow, Functional Silos
-When AI initiatives remain confined to narrow, functional domains, they fail to address cross-functional business challenges and opportunities, preventing AI from delivering its full potential in driving enterprise-wide optimization and transformation.
-
-Misalignment with Strategic Business Priorities
-Fragmented AI initiatives often arise from a disconnect between AI deployments and overarching business strategy, resulting in a scattered AI landscape where resources are wasted on incremental improvements rather than focused on areas of strategic importance.
-
-Perpetuating Silos and Hindering Collaboration
-Fragmented AI initiatives perpetuate organizational silos, hindering collaboration and knowledge sharing across departments and functions, preventing the organization from leveraging collective intelligence and realizing the full potential of AI.
-
-Increased Complexity and Technical Debt
-The pursuit of fragmented AI initiatives can lead to a proliferation of disparate AI systems, increasing the overall complexity of the AI landscape and contributing to the accumulation of technical debt, hindering the organization's ability to derive long-term value from AI.
-
-Empowering Executives and Establishing an AI Center of Excellence
-To overcome these challenges and effectively harness the transformative potential of AI, organizations must adopt a strategic, knowledge-driven approach to identifying and prioritizing AI initiatives. This requires a fundamental shift from a solely technology-centric mindset to a business-oriented perspective that aligns AI projects with the organization's overarching goals, values, and strategic priorities. 
-
-Executive education plays a vital role in this process, as it equips leaders with the knowledge and insights necessary to understand the art of the possible that AI creates. By gaining a comprehensive understanding of AI's capabilities, limitations, and potential applications, executives can effectively guide their organizations towards high-impact AI initiatives that deliver transformative value.
-
-One powerful way to accelerate this process and support executives in their AI leadership role is through the establishment of an AI Center of Excellence (COE) that leverages a knowledge-based approach. The AI COE is a centralized entity that provides the structure, expertise, and resources necessary to guide the organization's end-to-end AI journey.
-
-Key components of the AI COE:
-
-Executive Education and Alignment
-The AI COE plays a crucial role in providing relatable executive education to help leaders understand the art of the possible with AI. By offering tailored training programs and workshops, they equip executives with a comprehensive understanding of AI's capabilities, limitations, and potential applications within the organization's specific industry and context. This education enables executives to effectively guide AI initiatives and make informed strategic decisions.
-
-
-
-Knowledge Management
-At the core of the AI COE is a robust knowledge management system. Critical explicit, implicit, and tacit organizational knowledge is captured, including business processes, policies, regulations, quality standards, risks, and existing tools and solutions. This knowledge is then organized and structured into a centralized repository that serves as the foundation for AI initiative prioritization and development. By continuously capturing, organizing, and sharing knowledge across the organization, it ensures that AI initiatives have access to the necessary information and expertise.
-
-Strategic Roadmap Development
-The team specializes in developing strategic roadmaps that align AI initiatives with the organization's overarching goals and objectives. By leveraging the knowledge repository and collaborating with business stakeholders, they identify the critical connection points that generate the greatest value. Detailed roadmaps are created that prioritize and sequence AI initiatives, balancing large-scale transformative projects with focused quick-win opportunities. These roadmaps serve as a guide for the organization's AI journey, ensuring strategic alignment and optimal resource allocation.
-
-Governance and Risk Mitigation
-The team is responsible for developing and implementing a comprehensive AI governance framework. This framework establishes clear guidelines, policies, and oversight mechanisms to mitigate risks associated with AI adoption, such as data privacy, algorithmic bias, transparency, and accountability. They work closely with legal, compliance, and ethics teams to ensure that AI initiatives adhere to organizational values and societal expectations. By embedding strong governance practices into the AI development lifecycle, this helps build trust in AI systems and safeguards the organization against potential risks.
-
-Talent and Skill Development
-The AI COE also acts as a hub for talent and skill development within the organization. It identifies the skill gaps and training needs required to support AI initiatives effectively. They develop and deliver training programs to upskill employees across various functions, enabling them to work effectively with AI technologies. Additionally, a culture of continuous learning and knowledge sharing is fostered, encouraging employees to stay up-to-date with the latest AI advancements and best practices.
-
-Vendor and Technology Evaluation
-A key role is played in evaluating and selecting the right AI vendors and technologies for the organization. The capabilities, scalability, and compatibility of different AI platforms, tools, and services are assessed, ensuring they align with the organization's technical requirements and standards. Relationships with AI vendors are managed, negotiating contracts, and ensuring seamless integration with existing systems and processes.
-
-Performance Measurement and Continuous Improvement
-Behavioral and leading indicator metrics and key performance indicators (KPIs) are established to measure the success and impact of AI initiatives. The performance of AI systems is monitored and analyzed, identifying areas for improvement and optimization. Continuous improvement is facilitated by gathering feedback from stakeholders, conducting post-implementation reviews, and incorporating lessons learned into future AI projects. This iterative approach ensures that AI initiatives deliver tangible value and drive ongoing innovation.
-
-By combining active executive leadership with the expertise and structure provided by the AI COE, organizations can unlock the true transformative potential of AI and autonomous systems. The AI COE provides the knowledge-driven framework necessary to prioritize high-impact AI initiatives, mitigate risks, and drive enterprise-wide value creation.
-
-Key Take-Away
-The path to successful AI adoption and transformation lies in resisting the seduction of AI hyperbole and addressing the blind spots in strategic prioritization. Organizations must recognize the pitfalls of fragmented AI initiatives and shift towards a strategic, knowledge-driven approach.
-
-Conclusion
-By following the steps outlined in this white paper, resisting the temptation to react without first zooming out to understand the value of connecting the dots and the knowledge required to automate decisions, and embracing the principles outlined while leveraging the expertise and guidance provided by the AI COE, organizations can breed confidence, enable new ways of working that optimize organizational value, and realize the promise of artificial intelligence. This holistic approach positions organizations as leaders in the AI renaissance, equipped to navigate the complexities of the AI landscape, drive meaningful change, ensure the responsible and ethical use of these transformative technologies, and create the optimal context for technology, people, and processes to converge, enabling them to achieve the full potential of an AI-enabled enterprise in the most accelerated fashion possible.
-
-""",
-}
@@ -0,0 +1,92 @@
+import io
+import os
+import tempfile
+import threading
+import time
+
+import docx2txt
+from llama_index.core import SimpleDirectoryReader
+from pypdf import PdfReader
+
+
+def extract_txt(raw_data):
+    return [raw_data.decode("utf-8", errors="ignore")]
+
+
+def extract_docx(raw_data):
+    return [docx2txt.process(io.BytesIO(raw_data))]
+
+
+def extract_pdf(raw_data):
+    pdf = PdfReader(io.BytesIO(raw_data))
+    return [page.extract_text() for page in pdf.pages]
+
+
+# Formats whose llama-index reader is a plain read of the bytes. Markdown and CSV are not:
+# MarkdownReader and PandasCSVReader reshape the text, so they stay on the reader path.
+IN_MEMORY_EXTRACTORS = {
+    ".txt": extract_txt,
+    ".docx": extract_docx,
+    ".pdf": extract_pdf,
+}
+
+
+def extract_with_reader(file_name, raw_data):
+    """Formats that only llama-index can read, from disk (md, csv, pptx, ...). The temp dir is always removed."""
+    with tempfile.TemporaryDirectory(prefix="ai-coe-extract-") as folder:
+        file_path = os.path.join(folder, file_name)
+        with open(file_path, "wb") as file:
+            file.write(raw_data)
+        documents = SimpleDirectoryReader(input_files=[file_path]).load_data()
+    return [doc.text for doc in documents]
+
+
+def get_extension(file_name):
+    return os.path.splitext(file_name)[1].lower()
+
+
+def extract_documents(file_name, raw_data):
+    """Returns the text of every document (pdf page, whole docx, ...) held in raw_data."""
+    extractor = IN_MEMORY_EXTRACTORS.get(get_extension(file_name))
+    if extractor:
+        return extractor(raw_data)
+    return extract_with_reader(file_name, raw_data)
+
+
+class ParseTimings:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._timings = {}
+
+    def record(self, extension, seconds):
+        with self._lock:
+            timing = self._timings.setdefault(
+                extension or "<none>",
+                {"count": 0, "total_seconds": 0.0, "max_seconds": 0.0},
+            )
+            timing["count"] += 1
+            timing["total_seconds"] += seconds
+            timing["max_seconds"] = max(timing["max_seconds"], seconds)
+
+    def get_stats(self):
+        with self._lock:
+            return {
+                extension: dict(
+                    timing, avg_seconds=timing["total_seconds"] / timing["count"]
+                )
+                for extension, timing in self._timings.items()
+            }
+
+
+parse_timings = ParseTimings()
+
+
+def timed_extract_documents(file_name, raw_data):
+    """
+    Same as extract_documents, but also returns the extension and the parse
+    time so the caller can record it. Parsing runs in a worker process, so the
+    timing has to travel back with the result.
+    """
+    started = time.perf_counter()
+    documents = extract_documents(file_name, raw_data)
+    return documents, get_extension(file_name), time.perf_counter() - started
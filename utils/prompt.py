@@ -26,3 +26,32 @@ qa_prompt = ChatPromptTemplate.from_messages(
         ("human", "{question}"),
     ]
 )
+
+
+document_system_template = """
+            **Please first read the document, If you can give answer using only this document, please provide the answer using document content. If the answer is not belong from the document please use your own knowldge to answer the question. Take History as context.**
+
+            When you respond about any questions, you need to think about the company from multiple perspectives, including what the company is doing and what is most important for the company.
+            Each answer must contain: Introduction, Approach, and Conclusion.
+            Approach should be comprehensive and detail every perspective of the given company.
+            In Approach, describe each point in very detailed paragraphs.
+            Always take a breath and think step by step.
+
+            *CLEARLY FOLLOW THE QUESTION INSTRUCTION ABOUT LENGTH OF RESPONSE*
+            {chat_history}
+            """
+
+
+file_system_template = """
+            Please firest read the document, If you can give answer using only this document, please provide the answer using document content. If the answer is not belong from the document please use your own knowldge to answer the question. Take History as context.
+
+            *CLEARLY FOLLOW THE QUESTION INSTRUCTION ABOUT LENGTH OF RESPONSE*
+            {chat_history}
+            """
+
+
+title_system_template = """
+            Generate Chat title we see in ChatGPT of 2 to 3 words based on Chat History
+
+            {chat_history}
+            """
@@ -0,0 +1,137 @@
+import hashlib
+import json
+import mmap
+import os
+import re
+import sys
+import threading
+from collections import namedtuple
+
+from utils.tokens import count_tokens
+
+DOCUMENT_ASSET_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "assets", "documents"
+)
+INDEX_FILE_NAME = "index.json"
+INDEX_VERSION = 1
+ASSET_KEY_PATTERN = re.compile(r"^[A-Za-z0-9_\-]+$")
+
+PromptAsset = namedtuple("PromptAsset", ["key", "text", "token_count", "sha256"])
+
+
+class PromptAssetStore:
+    """
+    Prompt documents (the digital twins) stored as one <key>.txt file each in
+    assets/documents. index.json carries the precomputed token count and
+    content hash of every entry. Entries are read through mmap on first use
+    and kept in memory; dropping a new .txt file in the folder is enough to
+    add an entry, rebuilding the index only saves counting its tokens.
+    """
+
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls, *args, **kwargs):
+        raise NotImplementedError("Use getInstance() method to get an instance.")
+
+    @classmethod
+    def getInstance(cls, *args, **kwargs):
+        if not cls._instance:
+            with cls._lock:
+                if not cls._instance:
+                    cls._instance = super(PromptAssetStore, cls).__new__(cls)
+                    cls._instance._init(*args, **kwargs)
+        return cls._instance
+
+    def _init(self, asset_dir=DOCUMENT_ASSET_DIR):
+        self.asset_dir = asset_dir
+        self._index = None
+        self._assets = {}
+        self._asset_lock = threading.Lock()
+
+    def _asset_path(self, key):
+        return os.path.join(self.asset_dir, f"{key}.txt")
+
+    def _get_index(self):
+        if self._index is None:
+            index_path = os.path.join(self.asset_dir, INDEX_FILE_NAME)
+            try:
+                with open(index_path, "r", encoding="utf-8") as file:
+                    index = json.load(file)
+            except FileNotFoundError:
+                index = {"version": INDEX_VERSION, "entries": {}}
+            if index.get("version") != INDEX_VERSION:
+                print(f"Ignoring prompt asset index with version {index.get('version')}")
+                index = {"version": INDEX_VERSION, "entries": {}}
+            self._index = index
+        return self._index["entries"]
+
+    def keys(self):
+        return sorted(
+            file_name[: -len(".txt")]
+            for file_name in os.listdir(self.asset_dir)
+            if file_name.endswith(".txt")
+        )
+
+    def has(self, key):
+        if not isinstance(key, str):
+            return False
+        if key in self._assets:
+            return True
+        return bool(ASSET_KEY_PATTERN.match(key)) and os.path.isfile(self._asset_path(key))
+
+    def get(self, key):
+        asset = self._assets.get(key)
+        if asset is not None:
+            return asset
+        if not self.has(key):
+            raise KeyError(key)
+
+        with self._asset_lock:
+            asset = self._assets.get(key)
+            if asset is None:
+                asset = self._load(key)
+                self._assets[key] = asset
+        return asset
+
+    def _load(self, key):
+        with open(self._asset_path(key), "rb") as file:
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                sha256 = hashlib.sha256(mapped).hexdigest()
+                text = mapped[:].decode("utf-8")
+
+        entry = self._get_index().get(key)
+        if entry and entry["sha256"] == sha256:
+            token_count = entry["tokens"]
+        else:
+            print(f"Prompt asset {key} is not in the index or has changed, counting tokens")
+            token_count = count_tokens(text)
+        return PromptAsset(key, text, token_count, sha256)
+
+    def build_index(self):
+        entries = {}
+        for key in self.keys():
+            with open(self._asset_path(key), "rb") as file:
+                raw_data = file.read()
+            entries[key] = {
+                "file": f"{key}.txt",
+                "sha256": hashlib.sha256(raw_data).hexdigest(),
+                "tokens": count_tokens(raw_data.decode("utf-8")),
+            }
+        index = {"version": INDEX_VERSION, "entries": entries}
+        with open(os.path.join(self.asset_dir, INDEX_FILE_NAME), "w", encoding="utf-8") as file:
+            json.dump(index, file, indent=2, sort_keys=True)
+            file.write("\n")
+        self._index = index
+        self._assets = {}
+        return entries
+
+
+if __name__ == "__main__":
+    # Rebuild assets/documents/index.json after adding or editing an entry:
+    # python -m utils.prompt_assets build
+    if sys.argv[1:] == ["build"]:
+        for key, entry in PromptAssetStore.getInstance().build_index().items():
+            print(f"{key}: {entry['tokens']} tokens")
+    else:
+        print("Usage: python -m utils.prompt_assets build")
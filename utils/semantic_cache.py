@@ -0,0 +1,225 @@
+import asyncio
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+import numpy as np
+
+from utils.constants import Constants
+
+
+class SemanticCacheEntry:
+    def __init__(self, vector, doc_ids, chunks, tokens, created_at=None):
+        self.vector = vector
+        self.doc_ids = doc_ids
+        self.chunks = chunks
+        self.tokens = tokens
+        self.created_at = time.monotonic() if created_at is None else created_at
+
+
+class SemanticResponseCache:
+    """
+    Caches streamed answers by the embedding of the question plus the ids of
+    the documents it was answered from. A lookup hits when an entry with the
+    same document ids has a cosine similarity of at least
+    similarity_threshold. Entries expire after ttl_seconds and the least
+    recently used entry is evicted beyond max_entries.
+
+    With a sqlite_path, answers are also written to a SQLite table that all
+    worker processes of the host share, and a worker that misses in memory
+    looks there before calling the model. The SQLite calls never hold the
+    in-memory lock, and alookup / astore run them in a thread so a worker
+    waiting on another worker's write does not stall its event loop; when
+    the lock is not free within SQLITE_CACHE_BUSY_TIMEOUT_SECONDS the read
+    counts as a miss and the write is dropped.
+    """
+
+    def __init__(self, name, similarity_threshold, ttl_seconds, max_entries, sqlite_path=None):
+        self.name = name
+        self.similarity_threshold = similarity_threshold
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._next_id = 0
+        self._lock = threading.Lock()
+        self._db_lock = threading.Lock()
+        self._stats = {
+            "hits": 0,
+            "shared_hits": 0,
+            "misses": 0,
+            "evictions": 0,
+            "expired": 0,
+            "saved_tokens": 0,
+            "sqlite_errors": 0,
+        }
+
+        self._db = None
+        if sqlite_path:
+            self._db = sqlite3.connect(sqlite_path, check_same_thread=False)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                """
+                CREATE TABLE IF NOT EXISTS semantic_cache (
+                    name TEXT NOT NULL,
+                    doc_ids_key TEXT NOT NULL,
+                    vector BLOB NOT NULL,
+                    chunks TEXT NOT NULL,
+                    tokens INTEGER NOT NULL,
+                    created_at REAL NOT NULL
+                )
+                """
+            )
+            self._db.execute(
+                "CREATE INDEX IF NOT EXISTS semantic_cache_lookup ON semantic_cache (name, doc_ids_key, created_at)"
+            )
+            self._db.commit()
+            # Setup above may wait for the other workers; cache reads and writes afterwards must not.
+            self._db.execute(f"PRAGMA busy_timeout = {int(Constants.SQLITE_CACHE_BUSY_TIMEOUT_SECONDS * 1000)}")
+
+    @staticmethod
+    def _normalize(vector):
+        vector = np.asarray(vector, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    @staticmethod
+    def _doc_ids_key(doc_ids):
+        return hashlib.sha256("\n".join(sorted(doc_ids)).encode("utf-8")).hexdigest()
+
+    def _add_entry(self, entry):
+        entry_id = self._next_id
+        self._entries[entry_id] = entry
+        self._next_id += 1
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._stats["evictions"] += 1
+        return entry_id
+
+    def _lookup_shared(self, vector, doc_ids):
+        """Returns the best matching entry written by any worker, or None."""
+        now = time.time()
+        try:
+            with self._db_lock:
+                rows = self._db.execute(
+                    """
+                    SELECT vector, chunks, tokens, created_at FROM semantic_cache
+                    WHERE name = ? AND doc_ids_key = ? AND created_at >= ?
+                    """,
+                    (self.name, self._doc_ids_key(doc_ids), now - self.ttl_seconds),
+                ).fetchall()
+        except sqlite3.Error as e:
+            self._count_sqlite_error("lookup", e)
+            return None
+        best_row, best_similarity = None, self.similarity_threshold
+        for row in rows:
+            similarity = float(np.dot(vector, np.frombuffer(row[0], dtype=np.float32)))
+            if similarity >= best_similarity:
+                best_row, best_similarity = row, similarity
+        if best_row is None:
+            return None
+        blob, chunks, tokens, created_at = best_row
+        return SemanticCacheEntry(
+            np.frombuffer(blob, dtype=np.float32),
+            doc_ids,
+            json.loads(chunks),
+            tokens,
+            time.monotonic() - (now - created_at),
+        )
+
+    def _count_sqlite_error(self, operation, error):
+        with self._lock:
+            self._stats["sqlite_errors"] += 1
+        print(f"Shared {self.name} cache {operation} skipped: {error}")
+
+    def _hit(self, entry_id):
+        self._entries.move_to_end(entry_id)
+        entry = self._entries[entry_id]
+        self._stats["hits"] += 1
+        self._stats["saved_tokens"] += entry.tokens
+        return list(entry.chunks)
+
+    def lookup(self, vector, doc_ids=()):
+        """Returns the cached chunks of the closest matching answer, or None."""
+        vector = self._normalize(vector)
+        doc_ids = frozenset(doc_ids)
+        now = time.monotonic()
+        with self._lock:
+            best_id, best_similarity = None, self.similarity_threshold
+            for entry_id, entry in list(self._entries.items()):
+                if now - entry.created_at > self.ttl_seconds:
+                    del self._entries[entry_id]
+                    self._stats["expired"] += 1
+                    continue
+                if entry.doc_ids != doc_ids:
+                    continue
+                similarity = float(np.dot(vector, entry.vector))
+                if similarity >= best_similarity:
+                    best_id, best_similarity = entry_id, similarity
+            if best_id is not None:
+                return self._hit(best_id)
+
+        shared_entry = self._lookup_shared(vector, doc_ids) if self._db is not None else None
+        with self._lock:
+            if shared_entry is None:
+                self._stats["misses"] += 1
+                return None
+            self._stats["shared_hits"] += 1
+            return self._hit(self._add_entry(shared_entry))
+
+    def store(self, vector, doc_ids, chunks, tokens):
+        entry = SemanticCacheEntry(self._normalize(vector), frozenset(doc_ids), list(chunks), tokens)
+        with self._lock:
+            self._add_entry(entry)
+        if self._db is None:
+            return
+        now = time.time()
+        try:
+            with self._db_lock:
+                self._db.execute(
+                    "INSERT INTO semantic_cache VALUES (?, ?, ?, ?, ?, ?)",
+                    (
+                        self.name,
+                        self._doc_ids_key(entry.doc_ids),
+                        entry.vector.tobytes(),
+                        json.dumps(entry.chunks),
+                        tokens,
+                        now,
+                    ),
+                )
+                # Expired rows and rows beyond the newest max_entries of this cache go.
+                self._db.execute(
+                    """
+                    DELETE FROM semantic_cache WHERE name = ? AND (
+                        created_at < ? OR rowid NOT IN (
+                            SELECT rowid FROM semantic_cache WHERE name = ? ORDER BY created_at DESC LIMIT ?
+                        )
+                    )
+                    """,
+                    (self.name, now - self.ttl_seconds, self.name, self.max_entries),
+                )
+                self._db.commit()
+        except sqlite3.Error as e:
+            with self._db_lock:
+                self._db.rollback()
+            self._count_sqlite_error("store", e)
+
+    async def alookup(self, vector, doc_ids=()):
+        if self._db is None:
+            return self.lookup(vector, doc_ids)
+        return await asyncio.to_thread(self.lookup, vector, doc_ids)
+
+    async def astore(self, vector, doc_ids, chunks, tokens):
+        if self._db is None:
+            return self.store(vector, doc_ids, chunks, tokens)
+        await asyncio.to_thread(self.store, vector, doc_ids, chunks, tokens)
+
+    def get_stats(self):
+        with self._lock:
+            stats = dict(self._stats)
+            stats["entries"] = len(self._entries)
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = stats["hits"] / lookups if lookups else 0.0
+        return stats
@@ -0,0 +1,111 @@
+import asyncio
+import json
+
+from utils.constants import Constants
+
+# Event types of /chat_stream/
+SOURCES_EVENT = "sources"
+TOKEN_EVENT = "token"
+TITLE_EVENT = "title"
+ERROR_EVENT = "error"
+DONE_EVENT = "done"
+
+stream_stats = {"streams": 0, "completed": 0, "disconnected": 0, "events": 0, "writes": 0}
+
+
+def set_default(obj):
+    if isinstance(obj, set):
+        return list(obj)
+    raise TypeError
+
+
+def format_event(event, data):
+    """One SSE message; the data is JSON, so it always fits on a single data: line."""
+    return f"event: {event}\ndata: {json.dumps(data, default=set_default)}\n\n"
+
+
+async def sse_stream(
+    events,
+    is_disconnected=None,
+    max_chars=Constants.SSE_COALESCE_MAX_CHARS,
+    max_seconds=Constants.SSE_COALESCE_MAX_SECONDS,
+):
+    """
+    Turns the (event, data) pairs of a handler into SSE messages.
+
+    The handler runs as a task that reads ahead into a bounded queue, so a
+    slow client also slows the upstream LLM stream down. Consecutive tokens
+    are merged into one message of up to max_chars, held for at most
+    max_seconds. When the client goes away (the response is cancelled or
+    closed, or is_disconnected() turns true while waiting) the handler task
+    is cancelled, which closes the upstream LLM call.
+    """
+    queue = asyncio.Queue(maxsize=Constants.SSE_QUEUE_SIZE)
+    finished = object()
+
+    async def produce():
+        try:
+            async for event in events:
+                await queue.put(event)
+        except Exception as e:
+            print(e)
+            await queue.put((ERROR_EVENT, {"message": Constants.STREAM_ERROR_MESSAGE}))
+        finally:
+            await events.aclose()
+        await queue.put(finished)
+
+    loop = asyncio.get_running_loop()
+    producer = asyncio.create_task(produce())
+    stream_stats["streams"] += 1
+    tokens, token_chars, flush_at = [], 0, None
+    completed = False
+    try:
+        while True:
+            if tokens:
+                timeout = max(flush_at - loop.time(), 0)
+            else:
+                timeout = Constants.SSE_DISCONNECT_POLL_SECONDS if is_disconnected else None
+            try:
+                item = await asyncio.wait_for(queue.get(), timeout)
+            except asyncio.TimeoutError:
+                if tokens:
+                    stream_stats["writes"] += 1
+                    yield format_event(TOKEN_EVENT, "".join(tokens))
+                    tokens, token_chars, flush_at = [], 0, None
+                elif await is_disconnected():
+                    return
+                continue
+
+            if item is finished:
+                break
+            event, data = item
+            stream_stats["events"] += 1
+            if event == TOKEN_EVENT:
+                if not tokens:
+                    flush_at = loop.time() + max_seconds
+                tokens.append(data)
+                token_chars += len(data)
+                if token_chars < max_chars:
+                    continue
+                message = format_event(TOKEN_EVENT, "".join(tokens))
+                tokens, token_chars, flush_at = [], 0, None
+            else:
+                message = ""
+                if tokens:
+                    message = format_event(TOKEN_EVENT, "".join(tokens))
+                    tokens, token_chars, flush_at = [], 0, None
+                message += format_event(event, data)
+            stream_stats["writes"] += 1
+            yield message
+
+        message = format_event(TOKEN_EVENT, "".join(tokens)) if tokens else ""
+        stream_stats["writes"] += 1
+        completed = True
+        yield message + format_event(DONE_EVENT, {})
+    finally:
+        if completed:
+            stream_stats["completed"] += 1
+        else:
+            stream_stats["disconnected"] += 1
+            print("Client disconnected, cancelling its stream")
+        producer.cancel()
@@ -0,0 +1,171 @@
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+
+from utils.constants import Constants
+
+
+class ExtractedTextCache:
+    """
+    Two tier cache for text extracted from blobs. Entries are keyed by blob
+    name plus ETag/last-modified, so a changed blob never serves stale text.
+
+    The disk tier keeps a running byte count of its files, read from the
+    directory once at start. Only when a write takes it over disk_max_bytes
+    is the directory rescanned (to count the files other worker processes
+    wrote) and the least recently used files removed, down to
+    TEXT_CACHE_DISK_EVICT_TO of the maximum. get and put do file I/O; call
+    them from a thread in async code.
+    """
+
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls, *args, **kwargs):
+        raise NotImplementedError("Use getInstance() method to get an instance.")
+
+    @classmethod
+    def getInstance(cls, *args, **kwargs):
+        if not cls._instance:
+            with cls._lock:
+                if not cls._instance:
+                    cls._instance = super(ExtractedTextCache, cls).__new__(cls)
+                    cls._instance._init(*args, **kwargs)
+        return cls._instance
+
+    def _init(
+        self,
+        cache_dir=Constants.TEXT_CACHE_DIR,
+        memory_max_bytes=Constants.TEXT_CACHE_MEMORY_MAX_BYTES,
+        disk_max_bytes=Constants.TEXT_CACHE_DISK_MAX_BYTES,
+    ):
+        self.cache_dir = cache_dir
+        self.memory_max_bytes = memory_max_bytes
+        self.disk_max_bytes = disk_max_bytes
+        self._memory = OrderedDict()
+        self._memory_bytes = 0
+        self._entry_lock = threading.Lock()
+        self._disk_entries = OrderedDict()
+        self._disk_bytes = 0
+        self._disk_lock = threading.Lock()
+        self._stats = {
+            "memory_hits": 0,
+            "disk_hits": 0,
+            "misses": 0,
+            "memory_evictions": 0,
+            "disk_evictions": 0,
+            "disk_scans": 0,
+        }
+        os.makedirs(self.cache_dir, exist_ok=True)
+        with self._disk_lock:
+            self._scan_disk()
+
+    @staticmethod
+    def cache_key(blob_name, etag, last_modified):
+        fingerprint = f"{blob_name}|{etag}|{last_modified}"
+        return hashlib.sha256(fingerprint.encode("utf-8")).hexdigest()
+
+    def get(self, key):
+        with self._entry_lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                self._stats["memory_hits"] += 1
+                return self._memory[key]
+
+        path = self._disk_path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as file:
+                text = file.read()
+            os.utime(path)
+        except FileNotFoundError:
+            with self._entry_lock:
+                self._stats["misses"] += 1
+            return None
+
+        with self._disk_lock:
+            if key in self._disk_entries:
+                self._disk_entries.move_to_end(key)
+        with self._entry_lock:
+            self._stats["disk_hits"] += 1
+            self._put_memory(key, text)
+        return text
+
+    def put(self, key, text):
+        with self._entry_lock:
+            self._put_memory(key, text)
+        self._put_disk(key, text)
+
+    def get_stats(self):
+        with self._entry_lock:
+            stats = dict(self._stats)
+            stats["memory_entries"] = len(self._memory)
+            stats["memory_bytes"] = self._memory_bytes
+        with self._disk_lock:
+            stats["disk_entries"] = len(self._disk_entries)
+            stats["disk_bytes"] = self._disk_bytes
+        lookups = stats["memory_hits"] + stats["disk_hits"] + stats["misses"]
+        stats["hit_rate"] = (
+            (stats["memory_hits"] + stats["disk_hits"]) / lookups if lookups else 0.0
+        )
+        return stats
+
+    def _disk_path(self, key):
+        return os.path.join(self.cache_dir, f"{key}.txt")
+
+    def _put_memory(self, key, text):
+        size = len(text.encode("utf-8"))
+        if size > self.memory_max_bytes:
+            return
+        if key in self._memory:
+            self._memory_bytes -= len(self._memory.pop(key).encode("utf-8"))
+        self._memory[key] = text
+        self._memory_bytes += size
+        while self._memory_bytes > self.memory_max_bytes:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_bytes -= len(evicted.encode("utf-8"))
+            self._stats["memory_evictions"] += 1
+
+    def _put_disk(self, key, text):
+        path = self._disk_path(key)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as file:
+            file.write(text)
+        size = os.path.getsize(tmp_path)
+        os.replace(tmp_path, path)
+
+        with self._disk_lock:
+            self._disk_bytes += size - self._disk_entries.pop(key, 0)
+            self._disk_entries[key] = size
+            if self._disk_bytes > self.disk_max_bytes:
+                self._evict_disk()
+
+    def _scan_disk(self):
+        """Rebuilds the disk index, least recently used first, from the cache directory."""
+        entries = []
+        for entry in os.scandir(self.cache_dir):
+            if not entry.name.endswith(".txt"):
+                continue
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, entry.name[: -len(".txt")], stat.st_size))
+        entries.sort()
+        self._disk_entries = OrderedDict((key, size) for _, key, size in entries)
+        self._disk_bytes = sum(self._disk_entries.values())
+        with self._entry_lock:
+            self._stats["disk_scans"] += 1
+
+    def _evict_disk(self):
+        self._scan_disk()
+        target_bytes = self.disk_max_bytes * Constants.TEXT_CACHE_DISK_EVICT_TO
+        while self._disk_entries and self._disk_bytes > target_bytes:
+            key, size = self._disk_entries.popitem(last=False)
+            self._disk_bytes -= size
+            try:
+                os.remove(self._disk_path(key))
+            except FileNotFoundError:
+                continue
+            with self._entry_lock:
+                self._stats["disk_evictions"] += 1